@@ -0,0 +1,118 @@
+# Time-partitioned events: events.json only holds the current month onwards
+# ("live"); earlier events are moved into one file per month under
+# EVENTS_ARCHIVE_DIR by a background job and read back only when a page asks
+# for a month. Live data, and with it session memory and page time, stays the
+# size of the current and upcoming months however many years accumulate.
+# Month files are gzip-compressed JSON (plain if ARCHIVE_GZIP is off).
+import datetime
+import os
+import threading
+from collections import OrderedDict
+
+import models
+from config import ARCHIVE_CACHE_MONTHS, ARCHIVE_GZIP, EVENTS_ARCHIVE_DIR
+from journal import record_key
+from utils import file_lock, file_signature, load_data, save_data
+
+_months = OrderedDict()  # path -> (signature, events), most recently read last
+_months_lock = threading.Lock()
+_last_run = None  # date of this process's latest archive pass
+_run_lock = threading.Lock()
+
+
+def cutoff(today):
+    """Events dated before this stay archived: the first day of `today`'s month."""
+    return today.replace(day=1).isoformat()
+
+
+def month_path(month):
+    return os.path.join(EVENTS_ARCHIVE_DIR, f"{month}.json")
+
+
+def months():
+    """Archived months ("YYYY-MM"), oldest first."""
+    try:
+        names = os.listdir(EVENTS_ARCHIVE_DIR)
+    except FileNotFoundError:
+        return []
+    return sorted(n[:-5] for n in names if n.endswith(".json") and not n.startswith("."))
+
+
+def load_month(month):
+    """Events archived for `month`, parsed once per process until the file changes."""
+    path = month_path(month)
+    sig = file_signature(path)
+    with _months_lock:
+        hit = _months.get(path)
+        if hit is not None and hit[0] == sig:
+            _months.move_to_end(path)
+            return hit[1]
+    events = models.compact("events", load_data(path, []))
+    with _months_lock:
+        _months[path] = (sig, events)
+        while len(_months) > ARCHIVE_CACHE_MONTHS:
+            _months.popitem(last=False)
+    return events
+
+
+def load_all():
+    """Every archived event, oldest month first (for migrations and exports)."""
+    for month in months():
+        yield from load_month(month)
+
+
+def _append_month(month, events):
+    path = month_path(month)
+    with file_lock(path):
+        archived = load_data(path, [])
+        seen = {record_key(e) for e in archived}
+        # a pass interrupted after this write re-archives the same events; skip them
+        archived.extend(e for e in events if record_key(e) not in seen)
+        save_data(path, archived, compress=ARCHIVE_GZIP)
+
+
+def archive_past(backend, path, today):
+    """Move events dated before `today`'s month out of the live file. Returns the number moved."""
+    limit = cutoff(today)
+    moved = {}
+
+    def split(events):
+        live = []
+        for event in events:
+            if event.get("date", limit) < limit:
+                moved.setdefault(event["date"][:7], []).append(event)
+            else:
+                live.append(event)
+        if not moved:
+            return None
+        # archive before the live file is rewritten: a crash in between leaves
+        # events in both places rather than in neither
+        os.makedirs(EVENTS_ARCHIVE_DIR, exist_ok=True)
+        for month, events_in_month in moved.items():
+            _append_month(month, events_in_month)
+        return live
+
+    backend.rewrite(path, [], split)
+    return sum(len(v) for v in moved.values())
+
+
+def archive_async(backend, path, today):
+    """Run archive_past in a background thread, at most once per process per day."""
+    global _last_run
+    with _run_lock:
+        if _last_run == today:
+            return
+        _last_run = today
+    threading.Thread(target=archive_past, args=(backend, path, today), name="archive-events", daemon=True).start()
+
+
+if __name__ == "__main__":
+    # python archive.py  ->  archive past events now instead of waiting for the next session
+    import sys
+
+    from backends import make_backend
+    from config import FILES, STORAGE_BACKEND
+
+    if STORAGE_BACKEND == "sqlite":
+        sys.exit("the sqlite backend keeps every event in one indexed table; nothing to archive")
+    print(f"archived {archive_past(make_backend(STORAGE_BACKEND), FILES['events'], datetime.date.today())} event(s)")
@@ -0,0 +1,97 @@
+import datetime
+import heapq
+from bisect import bisect_left, bisect_right
+from itertools import islice
+
+STATUSES = ["Not Started", "In Progress", "Done"]
+DONE = "Done"
+
+
+def due_ordinal(record):
+    return datetime.date.fromisoformat(record["due_date"]).toordinal()
+
+
+class _Bucket:
+    """Assignments of one status, sorted by (due ordinal, insertion seq)."""
+
+    __slots__ = ("keys", "items")
+
+    def __init__(self):
+        self.keys = []
+        self.items = []
+
+    def add(self, key, record):
+        i = bisect_right(self.keys, key)
+        self.keys.insert(i, key)
+        self.items.insert(i, record)
+
+    def span(self, lo, hi):
+        start = 0 if lo is None else bisect_left(self.keys, (lo,))
+        stop = len(self.keys) if hi is None else bisect_left(self.keys, (hi + 1,))
+        return start, stop
+
+    def between(self, lo, hi, limit=None):
+        # yields (key, record) so buckets can be merged by due date
+        start, stop = self.span(lo, hi)
+        if limit is not None:
+            stop = min(stop, start + limit)
+        return zip(self.keys[start:stop], self.items[start:stop])
+
+
+class AssignmentIndex:
+    """Assignments bucketed by status, each bucket ordered by due date (most urgent first)."""
+
+    def __init__(self, records=()):
+        # bulk build: sort each bucket once instead of inserting records one by one
+        grouped = {}
+        self._seq = 0
+        for record in records:
+            self._seq += 1
+            grouped.setdefault(record["status"], []).append(((due_ordinal(record), self._seq), record))
+        self.buckets = {}
+        for status, pairs in grouped.items():
+            pairs.sort(key=lambda kv: kv[0])
+            bucket = self.buckets[status] = _Bucket()
+            bucket.keys = [key for key, _ in pairs]
+            bucket.items = [record for _, record in pairs]
+
+    def add(self, record):
+        self._seq += 1
+        self.buckets.setdefault(record["status"], _Bucket()).add((due_ordinal(record), self._seq), record)
+
+    def filter(self, status=None, due_from=None, due_to=None):
+        """Assignments with `status` (None = any) due within [due_from, due_to], by due date."""
+        lo = due_from.toordinal() if due_from else None
+        hi = due_to.toordinal() if due_to else None
+        if status is not None:
+            bucket = self.buckets.get(status)
+            return [record for _, record in bucket.between(lo, hi)] if bucket else []
+        merged = heapq.merge(*(b.between(lo, hi) for b in self.buckets.values()), key=lambda kv: kv[0])
+        return [record for _, record in merged]
+
+    def due_within(self, today, days, status=None):
+        return self.filter(status, today, today + datetime.timedelta(days=days))
+
+    def unfinished(self, due_from=None, due_to=None, limit=None):
+        """Assignments not Done due within [due_from, due_to], most urgent first (the first `limit` of them)."""
+        lo = due_from.toordinal() if due_from else None
+        hi = due_to.toordinal() if due_to else None
+        pending = [b.between(lo, hi, limit) for s, b in self.buckets.items() if s != DONE]
+        return [record for _, record in islice(heapq.merge(*pending, key=lambda kv: kv[0]), limit)]
+
+    def count_unfinished(self, due_from=None, due_to=None):
+        lo = due_from.toordinal() if due_from else None
+        hi = due_to.toordinal() if due_to else None
+        total = 0
+        for status, bucket in self.buckets.items():
+            if status != DONE:
+                start, stop = bucket.span(lo, hi)
+                total += stop - start
+        return total
+
+    def overdue(self, today, limit=None):
+        """Unfinished assignments due before `today`, oldest first."""
+        return self.unfinished(None, today - datetime.timedelta(days=1), limit)
+
+    def pending_count(self):
+        return sum(len(b.keys) for s, b in self.buckets.items() if s != DONE)
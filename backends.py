@@ -0,0 +1,81 @@
+from config import FILES, JOURNAL_COMPACT_BYTES, SQLITE_PATH
+from journal import JournalBackend, apply_op, record_key
+from utils import file_lock, file_signature, load_data, save_data
+
+
+def merge_ops(data, ops):
+    """Replay a session's pending ops onto freshly loaded data, merging adds by record id."""
+    present = {}
+    for entry in ops:
+        if entry["op"] == "add":
+            section = entry.get("section")
+            if section not in present:
+                target = data.get(section, []) if section else data
+                present[section] = {record_key(r) for r in target}
+            key = record_key(entry["record"])
+            if key in present[section]:
+                continue
+            present[section].add(key)
+        apply_op(data, entry)
+    return data
+
+
+class JsonBackend:
+    """Whole-file JSON: changes are only persisted when the store is flushed."""
+
+    incremental = False
+    indexed = False
+
+    def signature(self, path):
+        return file_signature(path)
+
+    def load(self, path, default):
+        return load_data(path, default)
+
+    def save(self, path, data):
+        with file_lock(path):
+            save_data(path, data)
+
+    def append(self, path, entry, default):
+        return False
+
+    def append_many(self, path, entries, default):
+        return False
+
+    def commit(self, path, ops, default, expand=None, normalize=None):
+        """Merge `ops` into the current file under the cross-process lock.
+
+        Re-reading under the lock means a session never overwrites records another
+        process wrote after this session loaded its copy. `expand` turns the file's
+        data into the form the ops were made on, and `normalize` turns the merged
+        data back into what is saved. Returns the file's new signature, the merged
+        data (as the ops see it) and the signature the file had before (when that
+        is the one the session loaded, nobody else wrote in between).
+        """
+        with file_lock(path):
+            before = self.signature(path)
+            data = load_data(path, default)
+            data = merge_ops(data if expand is None else expand(data), ops)
+            save_data(path, data if normalize is None else normalize(data))
+            sig = self.signature(path)
+        return sig, data, before
+
+    def rewrite(self, path, default, transform):
+        """Replace the file with `transform(data)` under the lock; None from `transform` leaves it alone."""
+        with file_lock(path):
+            data = transform(load_data(path, default))
+            if data is not None:
+                save_data(path, data)
+        return data
+
+
+def make_backend(kind):
+    if kind == "json":
+        return JsonBackend()
+    if kind == "journal":
+        return JournalBackend(JOURNAL_COMPACT_BYTES)
+    if kind == "sqlite":
+        from sqlite_backend import SqliteBackend
+
+        return SqliteBackend(SQLITE_PATH, FILES)
+    raise ValueError(f"Unknown storage backend: {kind!r}")
@@ -0,0 +1,88 @@
+"""Session load and page-query cost as years of events accumulate, before and after archiving.
+
+Run from the repository root:
+
+    python bench/bench_archive.py --years 1 3 10 --per-day 20
+"""
+import argparse
+import datetime
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def events(years, per_day, today):
+    rnd = random.Random(years)
+    days = years * 365
+    return [
+        {"id": str(uuid.uuid4()), "title": f"Event {i}", "date": (today + datetime.timedelta(days=rnd.randint(-days, 60))).isoformat(),
+         "time": "06:00 PM", "location": "Main Hall", "type": "Social", "color": "#cfe9ff", "user_pick": False,
+         "description": "Bring a friend"}
+        for i in range((days + 60) * per_day)
+    ]
+
+
+def measure(backend, path, today):
+    """(records, load ms, resident KiB, sort ms, count-upcoming ms) for one session start.
+
+    Load runs under tracemalloc, so its absolute time is inflated; compare rows.
+    """
+    tracemalloc.start()
+    started = time.perf_counter()
+    data = backend.load(path, [])
+    load = time.perf_counter() - started
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    started = time.perf_counter()
+    sorted(data, key=lambda e: e["date"])
+    sort = time.perf_counter() - started
+    cutoff = today.isoformat()
+    started = time.perf_counter()
+    sum(1 for e in data if e["date"] >= cutoff)
+    count = time.perf_counter() - started
+    return len(data), load * 1e3, size / 1024, sort * 1e3, count * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=int, nargs="+", default=[1, 3, 10])
+    parser.add_argument("--per-day", type=int, default=20)
+    args = parser.parse_args()
+
+    # config resolves data/ against the working directory
+    os.chdir(tempfile.mkdtemp(prefix="campus-bench-"))
+    import archive
+    from backends import JsonBackend
+    from config import FILES
+
+    backend = JsonBackend()
+    today = datetime.date.today()
+    print(f"{'years':>5} {'':<8} {'records':>8} {'load ms':>9} {'KiB':>9} {'sort ms':>8} {'count ms':>9}")
+    for years in args.years:
+        for name in os.listdir("data"):
+            if name.endswith(".json"):
+                os.remove(os.path.join("data", name))
+        if os.path.isdir(archive.EVENTS_ARCHIVE_DIR):
+            for name in os.listdir(archive.EVENTS_ARCHIVE_DIR):
+                os.remove(os.path.join(archive.EVENTS_ARCHIVE_DIR, name))
+        with open(FILES["events"], "w") as f:
+            json.dump(events(years, args.per_day, today), f)
+        before = measure(backend, FILES["events"], today)
+        started = time.perf_counter()
+        moved = archive.archive_past(backend, FILES["events"], today)
+        took = time.perf_counter() - started
+        after = measure(backend, FILES["events"], today)
+        for label, row in (("all", before), ("live", after)):
+            print(f"{years:>5} {label:<8} {row[0]:>8} {row[1]:>9.1f} {row[2]:>9.0f} {row[3]:>8.2f} {row[4]:>9.2f}")
+        print(f"{'':>5} archived {moved} event(s) into {len(archive.months())} month file(s) in {took * 1e3:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Assignment queries at N records: the old per-render loop vs AssignmentIndex.
+
+Run from the repository root:
+
+    python bench/bench_assignments.py --assignments 100000
+"""
+import argparse
+import datetime
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from assignments import STATUSES, AssignmentIndex  # noqa: E402
+
+
+def loop_filter(records, today, status_filter, upcoming_only):
+    # the "Your Assignments" loop from timetable_page
+    filtered = []
+    for a in records:
+        d = datetime.date.fromisoformat(a["due_date"])
+        status_ok = (status_filter == "All") or (a["status"] == status_filter)
+        date_ok = (not upcoming_only) or (0 <= (d - today).days <= 7)
+        if status_ok and date_ok:
+            filtered.append((a, d))
+    return filtered
+
+
+def timed(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--assignments", type=int, default=100000)
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    today = datetime.date.today()
+    records = [
+        {"id": str(i), "title": f"task {i}", "status": rnd.choice(STATUSES),
+         "due_date": (today + datetime.timedelta(days=rnd.randint(-365, 60))).isoformat()}
+        for i in range(args.assignments)
+    ]
+    build_ms, index = timed(lambda: AssignmentIndex(records), repeat=1)
+    print(f"index build (once per session): {build_ms:.1f} ms")
+
+    week = today + datetime.timedelta(days=7)
+    cases = [
+        ("due in 7 days, In Progress",
+         lambda: loop_filter(records, today, "In Progress", True),
+         lambda: index.filter("In Progress", today, week)),
+        ("due in 7 days, any status",
+         lambda: loop_filter(records, today, "All", True),
+         lambda: index.due_within(today, 7)),
+        ("pending count",
+         lambda: len([a for a in records if a.get("status") != "Done"]),
+         index.pending_count),
+        ("overdue",
+         lambda: [a for a in records if a["status"] != "Done" and a["due_date"] < today.isoformat()],
+         lambda: index.overdue(today)),
+    ]
+    print(f"{'query':<28} {'loop ms':>9} {'index ms':>9}")
+    for name, loop, indexed in cases:
+        loop_ms, expected = timed(loop)
+        index_ms, result = timed(indexed)
+        expected_n = expected if isinstance(expected, int) else len(expected)
+        result_n = result if isinstance(result, int) else len(result)
+        assert expected_n == result_n, (name, expected_n, result_n)
+        print(f"{name:<28} {loop_ms:9.2f} {index_ms:9.3f}")
+
+
+if __name__ == "__main__":
+    main()
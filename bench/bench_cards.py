@@ -0,0 +1,65 @@
+"""Card-list payload and build time at N events: every card vs one paginated page.
+
+Run from the repository root:
+
+    python bench/bench_cards.py --events 10000 --page-size 20
+"""
+import argparse
+import bisect
+import datetime
+import os
+import random
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cards  # noqa: E402
+
+
+def events(n, today):
+    rnd = random.Random(n)
+    return sorted(
+        (
+            {"id": str(uuid.uuid4()), "title": f"Event {i}", "date": (today + datetime.timedelta(days=rnd.randint(-700, 60))).isoformat(),
+             "time": "06:00 PM", "location": "Main Hall", "type": "Social", "color": "#cfe9ff", "user_pick": False,
+             "description": "Bring a friend"}
+            for i in range(n)
+        ),
+        key=lambda e: e["date"],
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=10000)
+    parser.add_argument("--page-size", type=int, default=20)
+    args = parser.parse_args()
+
+    today = datetime.date.today()
+    feed = events(args.events, today)
+
+    start = time.perf_counter()
+    every = [cards.event_card(e, today) for e in feed]
+    every_ms = (time.perf_counter() - start) * 1000
+    every_bytes = sum(len(c.encode()) for c in every)
+
+    # second pass: fragments come from the cache, only the relative text is rebuilt
+    start = time.perf_counter()
+    [cards.event_card(e, today) for e in feed]
+    cached_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    upcoming = feed[bisect.bisect_left(feed, today.isoformat(), key=lambda e: e["date"]):]
+    page = "\n".join(cards.event_card(e, today) for e in upcoming[: args.page_size])
+    page_ms = (time.perf_counter() - start) * 1000
+    page_bytes = len(page.encode())
+
+    print(f"all {args.events} cards:     {len(every):6d} elements {every_bytes / 1024:10.1f} KiB {every_ms:8.2f} ms")
+    print(f"  again, cached:      {len(every):6d} elements {every_bytes / 1024:10.1f} KiB {cached_ms:8.2f} ms")
+    print(f"one page of upcoming: {1:6d} element  {page_bytes / 1024:10.1f} KiB {page_ms:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
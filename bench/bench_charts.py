@@ -0,0 +1,62 @@
+"""Expense chart cost at N expenses: old per-expense pie vs grouped, cached chart.
+
+Run from the repository root:
+
+    python bench/bench_charts.py --expenses 10000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import matplotlib  # noqa: E402
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+
+import budget_agg  # noqa: E402
+import charts  # noqa: E402
+
+NAMES = ["Food", "Transport", "Data", "Books", "Laundry", "Rent", "Snacks", "Printing", "Gym", "Church", "Gifts", "Misc"]
+
+
+def old_pie(expenses):
+    # one wedge per expense, as the pages drew it before
+    fig, ax = plt.subplots(figsize=(5, 3))
+    ax.pie([e["amount"] for e in expenses], labels=[e["expense"] for e in expenses], startangle=90)
+    with open(os.devnull, "wb") as sink:
+        fig.savefig(sink, format="png")
+    plt.close(fig)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--expenses", type=int, default=10000)
+    parser.add_argument("--skip-old", action="store_true", help="skip the per-expense pie (slow at large N)")
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    expenses = [
+        {"id": str(uuid.uuid4()), "expense": rnd.choice(NAMES), "amount": float(rnd.randint(100, 5000)), "date": "2026-10-18"}
+        for _ in range(args.expenses)
+    ]
+    by_category = budget_agg.rebuild({"expenses": expenses})["by_category"]
+
+    if not args.skip_old:
+        print(f"per-expense pie:   {timed(lambda: old_pie(expenses)):9.1f} ms")
+    print(f"grouped, miss:     {timed(lambda: charts.pie_png(charts.group_top(by_category))):9.1f} ms")
+    print(f"grouped, hit:      {timed(lambda: charts.pie_png(charts.group_top(by_category))):9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Data-file codecs: serialize and parse throughput, file size and save peak memory per codec.
+
+Each codec saves an events store held as typed records (as the store cache
+holds it) and parses it back, plain and gzip-compressed. The first row is
+the previous save path, json.dump straight to the file, for reference.
+Peak memory is what tracemalloc sees allocated during the save on top of
+the data itself.
+
+Run from the repository root:
+
+    python bench/bench_codecs.py --records 100000
+"""
+import argparse
+import datetime
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import models  # noqa: E402
+import serialization  # noqa: E402
+
+
+def events(n, today):
+    rnd = random.Random(n)
+    return [
+        {"id": str(uuid.uuid4()), "title": f"Event {i}", "date": (today + datetime.timedelta(days=rnd.randint(-30, 120))).isoformat(),
+         "time": datetime.time(rnd.randint(8, 19), rnd.choice([0, 30])).strftime("%I:%M %p"), "location": "Main Hall",
+         "type": rnd.choice(["Social", "Academic", "Club", "Other"]), "color": "#cfe9ff", "user_pick": i % 50 == 0,
+         "description": "Bring a friend — all welcome"}
+        for i in range(n)
+    ]
+
+
+def old_save(path, data):
+    with open(path, "w") as f:
+        json.dump(data, f, default=models.to_json)
+
+
+def new_save(codec, compress):
+    def save(path, data):
+        with open(path, "wb") as f:
+            serialization.write(f, data, compress, codec)
+    return save
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    data = models.compact("events", events(args.records, datetime.date.today()))
+    path = os.path.join(tempfile.mkdtemp(prefix="campus-bench-"), "events.json")
+    rows = [("json.dump (before)", old_save, serialization.JsonCodec())]
+    codecs = [serialization.JsonCodec()]
+    if serialization.orjson is not None:
+        codecs.append(serialization.OrjsonCodec())
+    else:
+        print("orjson is not installed: only the standard library codec is measured\n")
+    for codec in codecs:
+        rows.append((codec.name, new_save(codec, False), codec))
+        rows.append((codec.name + " + gzip", new_save(codec, True), codec))
+
+    print(f"{'codec':<20} {'file MiB':>9} {'save s':>7} {'save MiB/s':>11} {'parse s':>8} {'parse MiB/s':>12} "
+          f"{'records/s parse':>16} {'save peak MiB':>14}")
+    for label, save, codec in rows:
+        save_s = best_of(lambda: save(path, data), args.repeat)
+        tracemalloc.start()
+        save(path, data)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        with open(path, "rb") as f:
+            raw = f.read()
+        parse_s = best_of(lambda: serialization.parse(raw, codec), args.repeat)
+        assert len(serialization.parse(raw, codec)) == args.records
+        # throughput in terms of the JSON text, so compressed rows compare with plain ones
+        text_mib = len(json.dumps(serialization.parse(raw, codec)).encode()) / 2**20 if label.endswith("gzip") else len(raw) / 2**20
+        print(f"{label:<20} {len(raw) / 2**20:>9.1f} {save_s:>7.2f} {text_mib / save_s:>11.1f} {parse_s:>8.2f} "
+              f"{text_mib / parse_s:>12.1f} {args.records / parse_s:>16,.0f} {peak / 2**20:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
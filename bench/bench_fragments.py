@@ -0,0 +1,197 @@
+"""Server CPU per interaction: full app rerun vs the fragment that owns the widget.
+
+Every page load and every form submit (plus a few list and filter widgets) is
+driven headlessly with AppTest against synthetic data. AppTest always reruns
+the whole script, so "full rerun" is the script's CPU for that run (what every
+interaction cost before the pages were split into fragments) and "fragment" is
+the CPU spent inside the owning fragment, which is all a fragment rerun
+executes. "app reruns" counts the st.rerun() calls the interaction made, each
+of which costs a full run on top; "served" is what a Streamlit server spends:
+the fragment plus those reruns (a full run for page loads). All are thread CPU
+time of the script thread, read from components.timings; Streamlit's own
+per-rerun bookkeeping is in none of them.
+
+Run from the repository root:
+
+    python bench/bench_fragments.py --records 2000 --repeat 5
+"""
+import argparse
+import datetime
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import uuid
+
+import streamlit as st
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
+STATUSES = ["Not Started", "In Progress", "Done"]
+
+
+def write_data(n, today):
+    rnd = random.Random(n)
+
+    def day(offset):
+        return (today + datetime.timedelta(days=offset)).isoformat()
+
+    data = {
+        "events": [
+            {"id": str(uuid.uuid4()), "title": f"Event {i}", "date": day(rnd.randint(-300, 60)), "time": "06:00 PM",
+             "location": "Main Hall", "type": "Social", "color": "#cfe9ff", "user_pick": i % 50 == 0, "description": "-"}
+            for i in range(n)
+        ],
+        "assignments": [
+            {"id": str(uuid.uuid4()), "course": f"C{i % 12}", "title": f"Task {i}", "status": rnd.choice(STATUSES),
+             "due_date": day(rnd.randint(-300, 60)), "notes": ""}
+            for i in range(n)
+        ],
+        "timetable": [
+            {"id": str(uuid.uuid4()), "day": DAYS[i % 6], "time": "09:00 AM", "start_min": 480 + 30 * (i % 20),
+             "duration_min": 60, "course": f"C{i}", "lecturer": "-", "notes": "", "color": "#b3e5fc", "reminder": False}
+            for i in range(min(n, 60))
+        ],
+        "streaks": [day(-i) for i in range(2, 200, 2)],
+        "budget": {
+            "incomes": [{"id": str(uuid.uuid4()), "source": "Allowance", "amount": 5000.0}],
+            "budgets": [],
+            "expenses": [
+                {"id": str(uuid.uuid4()), "expense": f"Item {i % 30}", "amount": float(rnd.randint(100, 5000)),
+                 "color": "#ffccbc", "date": day(-rnd.randint(0, 300))}
+                for i in range(n)
+            ],
+        },
+    }
+    os.makedirs("data", exist_ok=True)
+    for name, records in data.items():
+        with open(os.path.join("data", f"{name}.json"), "w") as f:
+            json.dump(records, f)
+
+
+def goto(at, label):
+    radio = at.sidebar.radio[0]
+    radio.set_value(next(o for o in radio.options if label in o)).run()
+
+
+def find(elements, label, i=0):
+    return [e for e in elements if e.label == label][i]
+
+
+def submit(values, button):
+    """Fill a form ({(widget kind, label, index): value or f(run)}) and click its submit button."""
+    def action(at, i):
+        for (kind, label, n), value in values.items():
+            find(getattr(at, kind), label, n).set_value(value(i) if callable(value) else value)
+        find(at.button, button).click()
+    return action
+
+
+class Timings(dict):
+    """components.timings that keeps each name's first run since clear(), i.e. the
+    run that handled the interaction rather than an st.rerun() after it."""
+
+    def __setitem__(self, name, seconds):
+        self.setdefault(name, seconds)
+
+
+reruns = []
+
+
+def counted_rerun(*args, **kwargs):
+    if kwargs.get("scope", args[0] if args else "app") == "app":
+        reruns.append(1)
+    return _rerun(*args, **kwargs)
+
+
+_rerun = st.rerun
+st.rerun = counted_rerun
+
+# (page, interaction, owning fragment or None for a full run, action); the action
+# sets a widget value or clicks
+INTERACTIONS = [
+    ("Home", "page load", None, lambda at, i: None),
+    ("Budget", "page load", None, lambda at, i: None),
+    ("Budget", "add income", "budget_sheet",
+     submit({("text_input", "Source name", 0): "Bursary", ("number_input", "Amount", 0): 2500.0}, "➕ Add Income")),
+    ("Budget", "add category", "budget_sheet",
+     submit({("text_input", "Category name", 0): "Books", ("number_input", "Amount", 1): 3000.0}, "➕ Add Category")),
+    ("Budget", "add expense", "budget_sheet",
+     submit({("text_input", "Expense name", 0): "Food", ("number_input", "Amount", 2): 1200.0}, "➕ Add Expense")),
+    ("Budget", "log streak day", "streak_section",
+     lambda at, i: find(at.button, "✅ I logged expenses today").click()),
+    ("Timetable", "page load", None, lambda at, i: None),
+    # after the generated classes, a new day per run so none of them clash
+    ("Timetable", "add class", "classes_section",
+     submit({("text_input", "Course Name", 0): "MTH101", ("selectbox", "Day", 0): lambda i: DAYS[i % 6],
+             ("time_input", "Class Time", 0): lambda i: datetime.time(21 + i // 6 % 3)}, "➕ Add Class")),
+    ("Timetable", "log assignment", "assignments_section",
+     submit({("text_input", "Assignment Title", 0): "Problem set"}, "➕ Log Assignment")),
+    ("Timetable", "change status filter", "assignment_list",
+     lambda at, i: find(at.selectbox, "Filter by Status").set_value((["All"] + STATUSES)[i % 4])),
+    ("Timetable", "toggle due-in-7-days", "assignment_list",
+     lambda at, i: find(at.checkbox, "Show only due in next 7 days").set_value(i % 2 == 0)),
+    ("Activities", "page load", None, lambda at, i: None),
+    ("Activities", "add event", "events_section",
+     submit({("text_input", "Event Title", 0): "Hack Night", ("text_input", "Location", 0): "Hall A"}, "✅ Add Event")),
+    ("Activities", "add personal task", "personal_schedule",
+     submit({("text_input", "Task Title", 0): "Revise calculus"}, "➕ Add Personal Task")),
+    ("Activities", "show past events", "event_list",
+     lambda at, i: at.toggle[0].set_value(i % 2 == 0)),
+    ("Activities", "change meeting date", "personal_schedule",
+     lambda at, i: find(at.date_input, "Meeting date").set_value(datetime.date.today() + datetime.timedelta(days=i + 1))),
+    ("StudyBot", "page load", None, lambda at, i: None),
+    ("StudyBot", "ask a question", "studybot_box",
+     lambda at, i: find(at.text_input, "Ask StudyBot:").set_value(f"when is my assignment {i} due?")),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=2000, help="events, assignments and expenses each")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    os.chdir(tempfile.mkdtemp(prefix="campus-bench-"))
+    write_data(args.records, datetime.date.today())
+    import components
+
+    components.timings = Timings()
+    at = AppTest.from_file(os.path.join(ROOT, "main.py"), default_timeout=120).run()
+    print(f"{args.records} records per store, median of {args.repeat} interactions (CPU ms)")
+    print(f"{'page':<11} {'interaction':<22} {'full rerun':>11} {'fragment':>9} {'app reruns':>11} {'served':>9}")
+    current = None
+    for page, name, fragment, action in INTERACTIONS:
+        if page != current:
+            goto(at, page)
+            current = page
+        full, part, served, rerun_counts = [], [], [], []
+        # the streak only takes today once
+        for i in range(1 if name == "log streak day" else args.repeat):
+            action(at, i)
+            components.timings.clear()
+            reruns.clear()
+            at.run()
+            if at.exception:
+                sys.exit(f"{page} / {name}: {at.exception[0].message}")
+            if name.startswith(("add ", "log ")) and not at.success:
+                sys.exit(f"{page} / {name}: the submit was rejected")
+            app = components.timings["app"]
+            own = components.timings.get(fragment, 0.0) if fragment else app
+            full.append(app)
+            part.append(own)
+            served.append(own + app * len(reruns) if fragment else app)
+            rerun_counts.append(len(reruns))
+        own = f"{statistics.median(part) * 1e3:.1f}" if fragment else "-"
+        print(f"{page:<11} {name:<22} {statistics.median(full) * 1e3:>11.1f} {own:>9} "
+              f"{max(rerun_counts):>11} {statistics.median(served) * 1e3:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Instrumentation overhead: metrics disabled vs enabled, per call and per load_data/save_data.
+
+Run from the repository root:
+
+    python bench/bench_metrics.py --calls 200000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import metrics  # noqa: E402
+from utils import load_data, save_data  # noqa: E402
+
+
+def per_call(fn, calls):
+    started = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - started) / calls * 1e9
+
+
+def empty_block():
+    with metrics.timer("bench_seconds", "empty"):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200000)
+    parser.add_argument("--records", type=int, default=100, help="records in the file loaded and saved")
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(prefix="campus-bench-"), "events.json")
+    data = [{"id": str(i), "title": f"Event {i}", "date": "2026-10-18"} for i in range(args.records)]
+    save_data(path, data)
+    io_calls = max(args.calls // 100, 100)
+
+    print(f"{'':<28} {'disabled ns':>12} {'enabled ns':>12}")
+    for label, fn, calls in (
+        ("timer() around nothing", empty_block, args.calls),
+        (f"load_data ({args.records} records)", lambda: load_data(path, []), io_calls),
+        (f"save_data ({args.records} records)", lambda: save_data(path, data), io_calls // 10),
+    ):
+        metrics.enabled = False
+        off = per_call(fn, calls)
+        metrics.enabled = True
+        on = per_call(fn, calls)
+        print(f"{label:<28} {off:>12,.0f} {on:>12,.0f}")
+    metrics.enabled = False
+
+
+if __name__ == "__main__":
+    main()
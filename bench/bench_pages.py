@@ -0,0 +1,280 @@
+"""Headless page benchmark: cold start, page renders and form submissions at growing data sizes.
+
+Every page and form is driven with AppTest against generated data/*.json sets
+(events, assignments, classes, incomes/expenses and streak dates, N of each).
+Each size runs in a fresh interpreter so cold start and peak memory are its
+own. Per step the report has the wall time of the AppTest run, the script's
+CPU time (components.timings["app"]) and the bytes the process wrote
+(/proc/self/io wchar, Linux only) once background saves have finished. A form submission that shows no
+success message or writes nothing fails the run.
+
+Run from the repository root:
+
+    python bench/bench_pages.py --sizes 1000 10000 100000 --out bench_pages.json
+    python bench/bench_pages.py --sizes 1000 --compare bench_pages.json
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
+STATUSES = ["Not Started", "In Progress", "Done"]
+# threads whose writes belong to the step that started them
+BACKGROUND = ("archive-events", "save-search", "compact-")
+
+
+def write_data(n, today):
+    rnd = random.Random(n)
+
+    def day(offset):
+        return (today + datetime.timedelta(days=offset)).isoformat()
+
+    data = {
+        "events": [
+            {"id": str(uuid.uuid4()), "title": f"Event {i}", "date": day(rnd.randint(-30, 120)), "time": "06:00 PM",
+             "location": "Main Hall", "type": "Social", "color": "#cfe9ff", "user_pick": i % 50 == 0,
+             "description": "Bring a friend"}
+            for i in range(n)
+        ],
+        "assignments": [
+            {"id": str(uuid.uuid4()), "course": f"C{i % 40}", "title": f"Problem set {i}", "status": rnd.choice(STATUSES),
+             "due_date": day(rnd.randint(-120, 120)), "notes": "Show all working"}
+            for i in range(n)
+        ],
+        "timetable": [
+            {"id": str(uuid.uuid4()), "day": DAYS[i % 6], "time": "09:00 AM", "start_min": 480 + 30 * (i % 24),
+             "duration_min": 60, "course": f"C{i}", "lecturer": "Dr Ada", "notes": "", "color": "#b3e5fc", "reminder": False}
+            for i in range(n)
+        ],
+        # up to yesterday, so logging today writes
+        "streaks": [day(-i) for i in range(1, n + 1)],
+        "budget": {
+            "incomes": [{"id": str(uuid.uuid4()), "source": f"Allowance {i}", "amount": float(rnd.randint(1000, 9000))}
+                        for i in range(n)],
+            "budgets": [{"id": str(uuid.uuid4()), "category": f"Item {i}", "amount": 5000.0, "color": "#ffccbc"}
+                        for i in range(30)],
+            "expenses": [
+                {"id": str(uuid.uuid4()), "expense": f"Item {i % 30}", "amount": float(rnd.randint(100, 5000)),
+                 "color": "#ffccbc", "date": day(-rnd.randint(0, 365))}
+                for i in range(n)
+            ],
+        },
+    }
+    os.makedirs("data", exist_ok=True)
+    size = 0
+    for name, records in data.items():
+        path = os.path.join("data", f"{name}.json")
+        with open(path, "w") as f:
+            json.dump(records, f)
+        size += os.path.getsize(path)
+    return size
+
+
+def written():
+    """Bytes this process has passed to write() so far (None off Linux)."""
+    try:
+        with open("/proc/self/io") as f:
+            return next(int(line.split()[1]) for line in f if line.startswith("wchar:"))
+    except (OSError, StopIteration):
+        return None
+
+
+def settle():
+    for thread in threading.enumerate():
+        if thread.name.startswith(BACKGROUND):
+            thread.join()
+
+
+def goto(at, label):
+    radio = at.sidebar.radio[0]
+    radio.set_value(next(o for o in radio.options if label in o))
+
+
+def find(elements, label, i=0):
+    return [e for e in elements if e.label == label][i]
+
+
+def fill(at, values, submit, run):
+    def action():
+        for (kind, label, i), value in values.items():
+            find(getattr(at, kind), label, i).set_value(value(run) if callable(value) else value)
+        find(at.button, submit).click()
+    return action
+
+
+PAGES = ["Home", "Budget", "Timetable", "Activities", "StudyBot"]
+
+# (page, form, {(widget kind, label, index among same-label widgets): value}, submit button);
+# a callable value gets the run number, for forms that reject a repeat of the same input
+FORMS = [
+    ("Budget", "add income", {("text_input", "Source name", 0): "Bursary", ("number_input", "Amount", 0): 2500.0}, "➕ Add Income"),
+    ("Budget", "add category", {("text_input", "Category name", 0): "Books", ("number_input", "Amount", 1): 3000.0}, "➕ Add Category"),
+    ("Budget", "add expense", {("text_input", "Expense name", 0): "Food", ("number_input", "Amount", 2): 1200.0}, "➕ Add Expense"),
+    ("Budget", "log streak day", {}, "✅ I logged expenses today"),
+    # after the generated classes (which end by 20:30), one hour apart so repeats do not clash either
+    ("Timetable", "add class", {("text_input", "Course Name", 0): "MTH101", ("text_input", "Lecturer", 0): "Dr Ada",
+                                ("selectbox", "Day", 0): lambda run: DAYS[run % 6],
+                                ("time_input", "Class Time", 0): lambda run: datetime.time(21 + run // 6 % 3)}, "➕ Add Class"),
+    ("Timetable", "log assignment", {("text_input", "Assignment Title", 0): "Problem set"}, "➕ Log Assignment"),
+    ("Activities", "add event", {("text_input", "Event Title", 0): "Hack Night", ("text_input", "Location", 0): "Hall A"}, "✅ Add Event"),
+    ("Activities", "add personal task", {("text_input", "Task Title", 0): "Revise calculus"}, "➕ Add Personal Task"),
+    ("Activities", "save all now", {}, "Save All Now"),
+]
+# forms that only write on their first submit of the day
+ONCE = {"log streak day"}
+
+
+def step(at, action, writes=False):
+    """(wall ms, script CPU ms, bytes written) for one AppTest run after `action`.
+
+    With `writes`, a run that shows no success message or writes nothing is an
+    error, so a form that silently rejects its input cannot pass for a fast one.
+    """
+    import components
+
+    settle()
+    before = written()
+    action()
+    started = time.perf_counter()
+    at.run()
+    wall = time.perf_counter() - started
+    settle()
+    after = written()
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    if writes and (not at.success or after == before):
+        shown = [e.value for e in (*at.warning, *at.error, *at.info)]
+        raise RuntimeError(f"submit wrote nothing: {shown}")
+    return wall * 1e3, components.timings.get("app", 0.0) * 1e3, None if before is None else after - before
+
+
+def summary(runs):
+    walls, cpus, writes = zip(*runs)
+    return {
+        "wall_ms": round(statistics.median(walls), 2),
+        "cpu_ms": round(statistics.median(cpus), 2),
+        "bytes_written": None if writes[0] is None else int(statistics.median(writes)),
+    }
+
+
+def run_size(n, repeat):
+    """Benchmark one data size in this process; returns its report entry."""
+    os.chdir(tempfile.mkdtemp(prefix="campus-bench-"))
+    data_bytes = write_data(n, datetime.date.today())
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(os.path.join(ROOT, "main.py"), default_timeout=1800)
+    result = {"records": n, "data_bytes": data_bytes}
+    result["cold_start"] = summary([step(at, lambda: None)])
+    result["cold_start_rss_kib"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    result["pages"] = {}
+    for page in PAGES:
+        runs = [step(at, lambda: goto(at, page))]
+        # later renders of a page are reruns with everything already loaded
+        runs += [step(at, lambda: None) for _ in range(repeat - 1)]
+        result["pages"][page] = summary(runs)
+    result["forms"] = {}
+    for page, name, values, submit in FORMS:
+        step(at, lambda: goto(at, page))
+        runs = 1 if name in ONCE else repeat
+        result["forms"][name] = summary([step(at, fill(at, values, submit, run), writes=True) for run in range(runs)])
+    result["peak_rss_kib"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return result
+
+
+def git_commit():
+    try:
+        out = subprocess.run(["git", "-C", ROOT, "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=10)
+    except OSError:
+        return None
+    return out.stdout.strip() or None
+
+
+def rows(report):
+    for size, result in report["sizes"].items():
+        yield size, "cold start", result["cold_start"]
+        for page, entry in result["pages"].items():
+            yield size, f"page {page}", entry
+        for form, entry in result["forms"].items():
+            yield size, f"form {form}", entry
+
+
+def print_report(report):
+    print(f"{'records':>8} {'step':<26} {'wall ms':>9} {'cpu ms':>9} {'written':>12}")
+    for size, name, entry in rows(report):
+        written_bytes = "-" if entry["bytes_written"] is None else f"{entry['bytes_written']:,}"
+        print(f"{size:>8} {name:<26} {entry['wall_ms']:>9.1f} {entry['cpu_ms']:>9.1f} {written_bytes:>12}")
+    for size, result in report["sizes"].items():
+        print(f"{size:>8} data {result['data_bytes'] / 2**20:.1f} MiB, peak RSS {result['cold_start_rss_kib'] / 1024:.0f} MiB "
+              f"after cold start, {result['peak_rss_kib'] / 1024:.0f} MiB overall")
+
+
+def compare(report, baseline):
+    """Wall-time ratios against an earlier report, for the sizes and steps both have."""
+    old = {(size, name): entry for size, name, entry in rows(baseline)}
+    print(f"\nvs {baseline['meta'].get('commit') or 'baseline'} (new / old wall time)")
+    for size, name, entry in rows(report):
+        before = old.get((size, name))
+        if before and before["wall_ms"]:
+            ratio = entry["wall_ms"] / before["wall_ms"]
+            # small steps are noisy: flag only changes that are large both relatively and absolutely
+            flag = "  <-- slower" if ratio > 1.2 and entry["wall_ms"] - before["wall_ms"] > 10 else ""
+            print(f"{size:>8} {name:<26} {before['wall_ms']:>9.1f} -> {entry['wall_ms']:>9.1f}  x{ratio:.2f}{flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="records per store")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per page render and form submission")
+    parser.add_argument("--out", default="bench_pages.json", help="where the JSON report is written")
+    parser.add_argument("--compare", help="earlier report to compare wall times against")
+    parser.add_argument("--one", type=int, help=argparse.SUPPRESS)  # child process: one size, JSON to stdout
+    args = parser.parse_args()
+
+    if args.one:
+        print(json.dumps(run_size(args.one, args.repeat)))
+        return
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "created": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "storage_backend": os.environ.get("CAMPUS_STORAGE_BACKEND", "json"),
+            "repeat": args.repeat,
+        },
+        "sizes": {},
+    }
+    for n in args.sizes:
+        child = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--one", str(n), "--repeat", str(args.repeat)],
+            capture_output=True, text=True,
+        )
+        if child.returncode:
+            sys.exit(f"{n} records: benchmark failed\n{child.stderr[-2000:]}")
+        report["sizes"][str(n)] = json.loads(child.stdout.strip().splitlines()[-1])
+    print_report(report)
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"report written to {args.out}")
+    if args.compare:
+        with open(args.compare) as f:
+            compare(report, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
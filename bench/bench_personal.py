@@ -0,0 +1,89 @@
+"""Personal schedules: one shared file vs per-user shards, and date lookups vs scanning.
+
+Run from the repository root:
+
+    python bench/bench_personal.py --users 1000 --tasks 500
+"""
+import argparse
+import datetime
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def tasks(n, today, rnd):
+    return [
+        {"id": str(uuid.uuid4()), "title": f"Task {i}", "date": (today + datetime.timedelta(days=rnd.randint(-365, 365))).isoformat(),
+         "time": f"{rnd.randint(1, 12):02d}:{rnd.choice(['00', '30'])} {rnd.choice(['AM', 'PM'])}", "description": "", "color": "#e3f2fd"}
+        for i in range(n)
+    ]
+
+
+def timed(fn, repeat):
+    runs = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        runs.append((time.perf_counter() - started) * 1e3)
+    return statistics.median(runs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--tasks", type=int, default=500, help="tasks per user")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    # config resolves data/ against the working directory
+    os.chdir(tempfile.mkdtemp(prefix="campus-bench-"))
+    import store
+    from backends import JsonBackend
+    from schedule import DatedIndex
+    from utils import save_data
+
+    rnd = random.Random(0)
+    today = datetime.date.today()
+    schedules = {f"user{u}": tasks(args.tasks, today, rnd) for u in range(args.users)}
+    for name, records in schedules.items():
+        save_data(store.shard_path(name), records)
+    save_data("data/personal_all.json", schedules)
+    backend = JsonBackend()
+
+    def add_shared():
+        def add(data):
+            data["user0"].append(tasks(1, today, rnd)[0])
+            return data
+        backend.rewrite("data/personal_all.json", {}, add)
+
+    def add_shard():
+        backend.commit(store.shard_path("user0"), [{"op": "add", "record": tasks(1, today, rnd)[0]}], [])
+
+    total = args.users * args.tasks
+    print(f"{args.users} users x {args.tasks} tasks ({total} in all), median of {args.repeat}")
+    print(f"add a task: one shared file {timed(add_shared, args.repeat):.1f} ms, own shard {timed(add_shard, args.repeat):.2f} ms")
+
+    mine = backend.load(store.shard_path("user0"), [])
+    index = DatedIndex(store._task_span, mine)
+    sunday = today + datetime.timedelta(days=6 - today.weekday())
+
+    def scan():
+        return ([t for t in mine if datetime.date.fromisoformat(t["date"]) == today],
+                [t for t in mine if today < datetime.date.fromisoformat(t["date"]) <= sunday])
+
+    def lookup():
+        return index.between(today, today), index.between(today + datetime.timedelta(days=1), sunday)
+
+    assert [len(x) for x in scan()] == [len(x) for x in lookup()]
+    print(f"today + this week for one user ({len(mine)} tasks): scan {timed(scan, args.repeat):.3f} ms, "
+          f"date index {timed(lookup, args.repeat):.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Page-render query time: Python list scans over JSON data vs the indexed SQLite backend.
+
+Run from the repository root:
+
+    python bench/bench_queries.py --sizes 10000 100000 1000000
+"""
+import argparse
+import datetime
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlite_backend import SqliteBackend  # noqa: E402
+
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
+STATUSES = ["Not Started", "In Progress", "Done"]
+
+
+def dataset(n, today):
+    rnd = random.Random(n)
+
+    def day(offset):
+        return (today + datetime.timedelta(days=offset)).isoformat()
+
+    events = [{"id": str(uuid.uuid4()), "title": f"event {i}", "date": day(rnd.randint(-700, 60))} for i in range(n)]
+    assignments = [
+        {"id": str(uuid.uuid4()), "title": f"task {i}", "status": rnd.choice(STATUSES), "due_date": day(rnd.randint(-700, 60))}
+        for i in range(n)
+    ]
+    timetable = [
+        {"id": str(uuid.uuid4()), "course": f"C{i}", "day": rnd.choice(DAYS),
+         "time": f"{rnd.randint(1, 12):02d}:{rnd.choice(['00', '30'])} {rnd.choice(['AM', 'PM'])}"}
+        for i in range(n)
+    ]
+    return events, assignments, timetable
+
+
+def scan_queries(events, assignments, timetable, today):
+    # the list comprehensions the pages used before the indexed backend
+    def week_in_progress():
+        return [a for a in assignments
+                if a["status"] == "In Progress" and 0 <= (datetime.date.fromisoformat(a["due_date"]) - today).days <= 7]
+
+    def monday():
+        by_day = {}
+        for t in timetable:
+            by_day.setdefault(t["day"], []).append(t)
+        return sorted(by_day.get("Monday", []), key=lambda x: x["time"])
+
+    return {
+        "upcoming events": lambda: len([e for e in events if datetime.date.fromisoformat(e["date"]) >= today]),
+        "pending assignments": lambda: len([a for a in assignments if a.get("status") != "Done"]),
+        "due in 7 days": lambda: len(week_in_progress()),
+        "monday classes": lambda: len(monday()),
+    }
+
+
+def sqlite_queries(backend, today):
+    week = today + datetime.timedelta(days=7)
+    return {
+        "upcoming events": lambda: backend.count_upcoming_events(today),
+        "pending assignments": backend.count_pending_assignments,
+        "due in 7 days": lambda: len(backend.filter_assignments("In Progress", today, week)),
+        "monday classes": lambda: len(backend.timetable_for_day("Monday")),
+    }
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    today = datetime.date.today()
+    tmp = tempfile.mkdtemp()
+    try:
+        print(f"{'rows':>9} {'query':<20} {'scan ms':>10} {'sqlite ms':>10}")
+        for n in args.sizes:
+            events, assignments, timetable = dataset(n, today)
+            files = {name: os.path.join(tmp, f"{name}-{n}.json") for name in ("events", "assignments", "timetable", "budget", "streaks")}
+            backend = SqliteBackend(os.path.join(tmp, f"campus-{n}.db"), files)
+            backend.save(files["events"], events)
+            backend.save(files["assignments"], assignments)
+            backend.save(files["timetable"], timetable)
+
+            scans = scan_queries(events, assignments, timetable, today)
+            for name, query in sqlite_queries(backend, today).items():
+                scan_s, expected = best_of(scans[name], args.repeat)
+                sql_s, result = best_of(query, args.repeat)
+                assert expected == result, (name, expected, result)
+                print(f"{n:>9} {name:<20} {scan_s * 1000:10.2f} {sql_s * 1000:10.2f}")
+    finally:
+        shutil.rmtree(tmp)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Typed records vs JSON dicts: memory per 100k records, conversion cost and field access.
+
+Memory is what tracemalloc sees allocated for the parsed store: json.loads
+output for the dicts, the typed records built from it (after the dicts are
+dropped) for models; the process-wide date and time tables, a few hundred
+entries, are not counted. Every record is checked to convert back to exactly
+the dict it came from, keys in the same order.
+
+Run from the repository root:
+
+    python bench/bench_records.py --records 100000
+"""
+import argparse
+import datetime
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import models  # noqa: E402
+
+COURSES = ["MTH101", "PHY102", "CSC201", "ENG110", "CHM101", "BIO120"]
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
+# field whose read cost is timed, per store (section)
+READ = {"events": "date", "timetable": "time", "assignments": "due_date", "budget.incomes": "amount", "budget.expenses": "date"}
+
+
+def stores(n, today):
+    rnd = random.Random(n)
+
+    def day(lo, hi):
+        return (today + datetime.timedelta(days=rnd.randint(lo, hi))).isoformat()
+
+    def clock():
+        return datetime.time(rnd.randint(8, 19), rnd.choice([0, 30])).strftime("%I:%M %p")
+
+    return {
+        "events": [
+            {"id": str(uuid.uuid4()), "title": f"Event {i}", "date": day(-30, 120), "time": clock(), "location": "Main Hall",
+             "type": rnd.choice(["Social", "Academic", "Club", "Other"]), "color": "#cfe9ff", "user_pick": i % 50 == 0,
+             "description": "No description"}
+            for i in range(n)
+        ],
+        "timetable": [
+            {"id": str(uuid.uuid4()), "day": rnd.choice(DAYS), "time": clock(), "start_min": 480 + 30 * (i % 24),
+             "duration_min": 60, "course": rnd.choice(COURSES), "lecturer": "Dr Ada", "notes": "", "color": "#b3e5fc",
+             "reminder": False}
+            for i in range(n)
+        ],
+        "assignments": [
+            {"id": str(uuid.uuid4()), "course": rnd.choice(COURSES), "title": f"Problem set {i}",
+             "status": rnd.choice(["Not Started", "In Progress", "Done"]), "due_date": day(-120, 120), "notes": ""}
+            for i in range(n)
+        ],
+        "budget": {
+            "incomes": [{"id": str(uuid.uuid4()), "source": f"Allowance {i % 12}", "amount": float(rnd.randint(1000, 9000))}
+                        for i in range(n)],
+            "budgets": [],
+            "expenses": [{"id": str(uuid.uuid4()), "expense": f"Item {i % 30}", "amount": float(rnd.randint(100, 5000)),
+                          "color": "#ffccbc", "date": day(-365, 0)} for i in range(n)],
+        },
+    }
+
+
+def traced(build):
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, result
+
+
+def flatten(name, data):
+    if isinstance(data, dict):
+        return [(f"{name}.{section}", records) for section, records in data.items() if records]
+    return [(name, data)]
+
+
+def per_call(fn, items):
+    started = time.perf_counter()
+    for item in items:
+        fn(item)
+    return (time.perf_counter() - started) / len(items) * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=100000, help="records per store (and per budget section)")
+    args = parser.parse_args()
+
+    generated = stores(args.records, datetime.date.today())
+    print(f"{'store':<18} {'dicts MiB':>10} {'typed MiB':>10} {'saved':>7} {'convert s':>10} "
+          f"{'get ns dict':>12} {'get ns typed':>13} {'lossless':>9}")
+    total_dicts = total_typed = 0
+    for name, data in generated.items():
+        text = json.dumps(data)
+        for label, _ in flatten(name, data):
+            section = label.partition(".")[2] or None
+
+            def load():
+                loaded = json.loads(text)
+                return loaded[section] if section else loaded
+
+            dict_size, dicts = traced(load)
+            started = time.perf_counter()
+            kind = models.TYPES[name][section] if section else models.TYPES[name]
+            typed = [kind.from_json(r) for r in dicts]
+            convert = time.perf_counter() - started
+            lossless = all(t.to_json() == d and list(t.to_json()) == list(t) == list(d) for t, d in zip(typed, dicts))
+            field = READ[label]
+            get_dict = per_call(lambda r: r[field], dicts)
+            get_typed = per_call(lambda r: r[field], typed)
+            del typed
+            typed_size, _ = traced(lambda: [kind.from_json(r) for r in load()])
+            total_dicts += dict_size
+            total_typed += typed_size
+            print(f"{label:<18} {dict_size / 2**20:>10.1f} {typed_size / 2**20:>10.1f} {1 - typed_size / dict_size:>7.0%} "
+                  f"{convert:>10.2f} {get_dict:>12.0f} {get_typed:>13.0f} {str(lossless):>9}")
+    print(f"{'all':<18} {total_dicts / 2**20:>10.1f} {total_typed / 2**20:>10.1f} {1 - total_typed / total_dicts:>7.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Clash detection at insert time: IntervalIndex vs checking every existing entry.
+
+Run from the repository root:
+
+    python bench/bench_schedule.py --entries 10000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from schedule import IntervalIndex, common_free_windows  # noqa: E402
+from timetable import DAYS  # noqa: E402
+
+
+def entries(n, weeks):
+    # classes spread over `weeks` x 6 days (e.g. sections/rooms), 7am-9pm
+    rnd = random.Random(n)
+    keys = [(w, d) for w in range(weeks) for d in DAYS]
+    for i in range(n):
+        start = rnd.randrange(7 * 60, 21 * 60, 5)
+        yield rnd.choice(keys), start, start + rnd.choice([30, 60, 90, 120]), i
+
+
+def indexed(rows):
+    by_key = {}
+    clashes = 0
+    for key, start, end, item in rows:
+        index = by_key.setdefault(key, IntervalIndex())
+        clashes += len(index.overlapping(start, end))
+        index.add(start, end, item)
+    return clashes
+
+
+def naive(rows):
+    existing = []
+    clashes = 0
+    for key, start, end, item in rows:
+        clashes += len([i for k, s, e, i in existing if k == key and s < end and e > start])
+        existing.append((key, start, end, item))
+    return clashes
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=10000)
+    parser.add_argument("--groups", type=int, default=100, help="weekly timetables the entries are spread over")
+    parser.add_argument("--users", type=int, default=50)
+    args = parser.parse_args()
+
+    rows = list(entries(args.entries, args.groups))
+    naive_s, naive_clashes = timed(naive, rows)
+    index_s, index_clashes = timed(indexed, rows)
+    assert naive_clashes == index_clashes
+    n = args.entries
+    print(f"{n} inserts with clash check ({naive_clashes} clashes): naive {naive_s * 1000:.1f} ms ({naive_s / n * 1e6:.1f} us/insert), "
+          f"indexed {index_s * 1000:.1f} ms ({index_s / n * 1e6:.1f} us/insert)")
+
+    busy = {u: [(s, e) for _, s, e, _ in rows[u::args.users]] for u in range(args.users)}
+    free_s, windows = timed(common_free_windows, busy, 7 * 60, 22 * 60)
+    print(f"common free windows for {args.users} users over {n} busy blocks: {free_s * 1000:.1f} ms, {len(windows)} window(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Search index build time, size and query latency at N indexed records.
+
+Records get titles and notes drawn from a Zipf-like vocabulary, so some words
+are in a large share of the records and most are rare, as in real text.
+
+Run from the repository root:
+
+    python bench/bench_search.py --records 1000000 --queries 200
+"""
+import argparse
+import itertools
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import search  # noqa: E402
+
+SYLLABLES = ["ka", "lo", "mi", "ren", "tas", "vo", "qui", "stra", "bel", "dor", "fen", "gu", "hal", "jin", "pe", "sor", "tu", "wy", "xa", "zel"]
+
+
+def vocabulary(size, rnd):
+    words = set()
+    while len(words) < size:
+        words.add("".join(rnd.choice(SYLLABLES) for _ in range(rnd.randint(2, 4))))
+    return sorted(words)
+
+
+def records(n, words, rnd):
+    cumulative = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(words))))
+    for i in range(n):
+        title = rnd.choices(words, cum_weights=cumulative, k=3)
+        notes = rnd.choices(words, cum_weights=cumulative, k=6)
+        yield {"id": str(i), "title": " ".join(title), "course": f"C{i % 300}", "notes": " ".join(notes)}
+
+
+def percentile(samples, p):
+    return sorted(samples)[min(len(samples) - 1, int(len(samples) * p))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=1000000)
+    parser.add_argument("--vocabulary", type=int, default=50000)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    words = vocabulary(args.vocabulary, rnd)
+    index = search.SearchIndex()
+    started = time.perf_counter()
+    index.add_many("assignment", records(args.records, words, rnd))
+    print(f"{args.records} records, {len(index.vocab)} distinct tokens: built in {time.perf_counter() - started:.1f} s")
+    path = os.path.join(tempfile.mkdtemp(prefix="campus-bench-"), "search.index")
+    started = time.perf_counter()
+    search.save(path, index)
+    dumped = time.perf_counter() - started
+    started = time.perf_counter()
+    assert search.load(path) is not None
+    print(f"persisted size {os.path.getsize(path) / 2**20:.0f} MiB, save {dumped:.1f} s, load {time.perf_counter() - started:.1f} s")
+
+    # only words that made it into the index: with few records most of the vocabulary never does
+    by_df = sorted((w for w in words if w in index.postings), key=lambda w: len(index.postings[w][0]))
+    common, rare = by_df[-50:], by_df[: max(1, len(by_df) // 2)]
+    kinds = {
+        "rare word": lambda: rnd.choice(rare),
+        "common word": lambda: rnd.choice(common),
+        "prefix (3 chars)": lambda: rnd.choice(rare)[:3],
+        "two words": lambda: f"{rnd.choice(common)} {rnd.choice(rare)}",
+        "common + prefix": lambda: f"{rnd.choice(common)} {rnd.choice(rare)[:4]}",
+    }
+    print(f"{'query':<18} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+    for name, make in kinds.items():
+        samples = []
+        for _ in range(args.queries):
+            query = make()
+            started = time.perf_counter()
+            index.search(query)
+            samples.append((time.perf_counter() - started) * 1e3)
+        print(f"{name:<18} {statistics.median(samples):>8.2f} {percentile(samples, 0.95):>8.2f} {max(samples):>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Startup import time (python -X importtime) for a set of modules, first-party vs total.
+
+Each run is a fresh interpreter, so nothing is already in sys.modules. The
+default measures what main.py imports before the Home page renders; pass
+--modules to measure anything else (e.g. every page module).
+
+Run from the repository root:
+
+    python bench/bench_startup.py --repeat 5
+    python bench/bench_startup.py --modules main pages.home pages.budget pages.timetable pages.activities pages.chatbot
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def first_party():
+    names = {f[:-3] for f in os.listdir(ROOT) if f.endswith(".py")}
+    names |= {f"pages.{f[:-3]}" for f in os.listdir(os.path.join(ROOT, "pages")) if f.endswith(".py")}
+    return names | {"pages"}
+
+
+def importtime(modules):
+    """{module: (self us, cumulative us)} for one cold interpreter."""
+    code = "import " + ", ".join(modules)
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT,
+                         capture_output=True, text=True, check=True).stderr
+    times = {}
+    for line in out.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        times[name.strip()] = (int(own), int(cumulative))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modules", nargs="+", default=["main", "pages.home"])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    ours = first_party()
+    totals, own, counts = [], [], []
+    for _ in range(args.repeat):
+        times = importtime(args.modules)
+        totals.append(sum(times[m][1] for m in args.modules if m in times))
+        mine = {m: t for m, t in times.items() if m in ours}
+        own.append(sum(t[0] for t in mine.values()))
+        counts.append(len(times))
+    print(f"import {' '.join(args.modules)}  (median of {args.repeat} cold interpreters)")
+    print(f"  total        {statistics.median(totals) / 1e3:8.1f} ms  ({statistics.median(counts):.0f} modules)")
+    print(f"  first-party  {statistics.median(own) / 1e3:8.1f} ms  ({len(mine)} modules: {', '.join(sorted(mine))})")
+
+
+if __name__ == "__main__":
+    main()
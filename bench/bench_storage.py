@@ -0,0 +1,114 @@
+"""Per-write cost of the "json" and "journal" storage backends as history grows.
+
+Besides the raw backend writes, store.add is timed on the journal backend:
+with every add in one run (the session copies the store once, on its first
+change) and with one add per run followed by the end-of-run flush.
+
+Run from the repository root:
+
+    python bench/bench_storage.py --sizes 100 1000 10000 100000 1000000
+"""
+import argparse
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from journal import JournalBackend, apply_op  # noqa: E402
+from utils import load_data, save_data  # noqa: E402
+
+DEFAULT = {"incomes": [], "budgets": [], "expenses": []}
+
+
+def expense(i):
+    return {"id": str(uuid.uuid4()), "expense": f"item {i % 30}", "amount": float(i % 500), "color": "#ffccbc", "date": "2026-10-18"}
+
+
+def history(n):
+    return {"incomes": [], "budgets": [], "expenses": [expense(i) for i in range(n)]}
+
+
+def time_json(path, data, entries):
+    start = time.perf_counter()
+    for entry in entries:
+        apply_op(data, entry)
+        save_data(path, data)
+    return (time.perf_counter() - start) / len(entries)
+
+
+def time_journal(path, entries):
+    # compaction is disabled so only the append path is measured
+    backend = JournalBackend(compact_bytes=float("inf"))
+    start = time.perf_counter()
+    for entry in entries:
+        backend.append(path, entry, DEFAULT)
+    return (time.perf_counter() - start) / len(entries)
+
+
+def time_store_add(path, base, records, per_run):
+    import store
+
+    # bare mode: st.session_state works, but every access warns there is no script run
+    for logger in ("streamlit.runtime.scriptrunner_utils.script_run_context", "streamlit.runtime.state.session_state_proxy"):
+        logging.getLogger(logger).setLevel(logging.ERROR)
+    store.backend = JournalBackend(compact_bytes=float("inf"))
+    store.FILES["budget"] = path
+    save_data(path, base)
+    store._shared.clear()
+    for key in list(store.st.session_state):
+        del store.st.session_state[key]
+    store.init_stores()
+    store.budget_aggregates()  # built by the first page render, not by a write
+    start = time.perf_counter()
+    for record in records:
+        store.add("budget", record, "expenses")
+        if per_run:
+            store.flush()
+            store.init_stores()
+    store.flush()
+    return (time.perf_counter() - start) / len(records)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 100000, 1000000])
+    parser.add_argument("--writes", type=int, default=50)
+    parser.add_argument("--json-max", type=int, default=100000, help="skip the json backend above this history size")
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp()
+    # config resolves data/ against the working directory
+    os.chdir(tmp)
+    try:
+        print(f"{'history':>10} {'json ms/write':>14} {'journal ms/write':>17} {'store.add ms, one run':>22} {'store.add ms, own run':>22}")
+        for n in args.sizes:
+            base = history(n)
+            entries = [{"op": "add", "section": "expenses", "record": expense(i)} for i in range(args.writes)]
+            json_path = os.path.join(tmp, f"json-{n}.json")
+            journal_path = os.path.join(tmp, f"journal-{n}.json")
+            save_data(journal_path, base)
+            journal_ms = time_journal(journal_path, entries) * 1000
+            records = [entry["record"] for entry in entries]
+            one_run_ms = time_store_add(os.path.join(tmp, f"store-{n}.json"), base, records, per_run=False) * 1000
+            per_run_ms = time_store_add(os.path.join(tmp, f"store-{n}.json"), base, records, per_run=True) * 1000
+
+            json_ms = None
+            if n <= args.json_max:
+                save_data(json_path, base)
+                json_ms = time_json(json_path, load_data(json_path, DEFAULT), entries) * 1000
+                # both backends must load the same store
+                assert load_data(json_path, DEFAULT) == JournalBackend(float("inf")).load(journal_path, DEFAULT)
+
+            json_col = f"{json_ms:14.3f}" if json_ms is not None else f"{'skipped':>14}"
+            print(f"{n:>10} {json_col} {journal_ms:17.3f} {one_run_ms:22.3f} {per_run_ms:22.3f}")
+    finally:
+        shutil.rmtree(tmp)
+
+
+if __name__ == "__main__":
+    main()
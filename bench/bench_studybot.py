@@ -0,0 +1,108 @@
+"""StudyBot answer latency (p50/p95) for new and repeated questions.
+
+Run from the repository root:
+
+    python bench/bench_studybot.py --records 100000 --rounds 50
+"""
+import argparse
+import datetime
+import os
+import random
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import budget_agg  # noqa: E402
+import search  # noqa: E402
+import studybot  # noqa: E402
+from assignments import STATUSES, AssignmentIndex  # noqa: E402
+from timetable import DAYS, TimetableIndex  # noqa: E402
+
+QUESTIONS = [
+    "What's due this week?",
+    "any assignments due tomorrow",
+    "what is overdue",
+    "How much did I spend on food?",
+    "how much did I spend this month",
+    "how much money do I have left",
+    "when is my next class",
+    "what classes do I have on Monday",
+    "How do I prepare for exams?",
+    "how to stop procrastinating",
+    "tips for saving money on food",
+    "help with MTH101 revision",
+]
+COURSES = ["MTH101", "PHY102", "CSC201", "ENG110", "CHM101", "BIO120"]
+CATEGORIES = ["Food", "Transport", "Books", "Data", "Rent", "Fun"]
+
+
+def data(n, today):
+    rnd = random.Random(n)
+    assignments = [
+        {"id": str(uuid.uuid4()), "title": f"Problem set {i}", "course": rnd.choice(COURSES),
+         "due_date": (today + datetime.timedelta(days=rnd.randint(-180, 180))).isoformat(),
+         "status": rnd.choice(STATUSES), "notes": "Show all working"}
+        for i in range(n)
+    ]
+    expenses = [
+        {"id": str(uuid.uuid4()), "expense": rnd.choice(CATEGORIES), "amount": float(rnd.randint(100, 5000)),
+         "date": (today - datetime.timedelta(days=rnd.randint(0, 365))).isoformat()}
+        for _ in range(n)
+    ]
+    classes = [
+        {"id": str(uuid.uuid4()), "day": rnd.choice(DAYS), "time": f"{rnd.randint(8, 11):02d}:00 AM",
+         "course": rnd.choice(COURSES), "lecturer": "Dr Ada", "notes": ""}
+        for _ in range(30)
+    ]
+    return assignments, {"incomes": [], "budgets": [], "expenses": expenses}, classes
+
+
+def percentile(samples, q):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=100000, help="assignments and expenses each")
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    now = datetime.datetime.now()
+    assignments, budget, classes = data(args.records, now.date())
+    started = time.perf_counter()
+    index, agg, timetable = AssignmentIndex(assignments), budget_agg.rebuild(budget), TimetableIndex(classes)
+    found = search.SearchIndex()
+    found.add_many("assignment", assignments)
+    found.add_many("class", classes)
+    print(f"{args.records} assignments + {args.records} expenses: indexes built in {time.perf_counter() - started:.1f} s")
+
+    started = time.perf_counter()
+    studybot.tips_index()
+    print(f"tips index ({len(studybot.tips_index()[0])} tips) built in {(time.perf_counter() - started) * 1e3:.1f} ms")
+
+    def related(word):
+        return found.search(word, 5)
+
+    print(f"{'question':<40} {'new p50':>8} {'new p95':>8} {'again p50':>10} {'again p95':>10}  (ms)")
+    overall = {"new": [], "again": []}
+    for question in QUESTIONS:
+        runs = {"new": [], "again": []}
+        for _ in range(args.rounds):
+            studybot.interpret.cache_clear()
+            for kind in ("new", "again"):
+                started = time.perf_counter()
+                studybot.answer(question, now, index, agg, timetable, related)
+                runs[kind].append((time.perf_counter() - started) * 1e3)
+        for kind in runs:
+            overall[kind] += runs[kind]
+        print(f"{question:<40} {percentile(runs['new'], .5):>8.3f} {percentile(runs['new'], .95):>8.3f} "
+              f"{percentile(runs['again'], .5):>10.3f} {percentile(runs['again'], .95):>10.3f}")
+    print(f"{'all questions':<40} {percentile(overall['new'], .5):>8.3f} {percentile(overall['new'], .95):>8.3f} "
+          f"{percentile(overall['again'], .5):>10.3f} {percentile(overall['again'], .95):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Bulk import / export: time and peak memory of CSV and .ics imports and of every export format.
+
+The import is timed end to end (parse, validate, dedupe, the clash check for
+classes, store.add_many and the flush that writes it). Peak memory is
+measured with tracemalloc on a second pass that drains the pipeline without
+keeping the records, which is what the streaming parse itself holds; exports
+are written to a file.
+
+Run from the repository root:
+
+    python bench/bench_transfer.py --rows 100000
+"""
+import argparse
+import csv
+import datetime
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def rows(kind, n, rnd, today):
+    for i in range(n):
+        if kind == "events":
+            yield {"id": f"event-{i}", "title": f"Event {i}", "date": (today + datetime.timedelta(days=rnd.randint(0, 365))).isoformat(),
+                   "time": f"{rnd.randint(8, 20)}:00", "location": "Main Hall", "type": "Social", "description": "Bring a friend"}
+        elif kind == "classes":
+            yield {"id": f"class-{i}", "day": rnd.choice(["Mon", "Tue", "Wed", "Thu", "Fri"]),
+                   "time": f"{rnd.randint(8, 17):02d}:00", "course": f"C{i}", "lecturer": "Dr Ada"}
+        else:
+            yield {"id": f"expense-{i}", "expense": f"Item {i % 30}", "amount": str(rnd.randint(100, 5000)),
+                   "date": (today - datetime.timedelta(days=rnd.randint(0, 365))).isoformat()}
+
+
+def write_inputs(kind, n):
+    """{fmt: path} of the input files; the .ics one holds the same records (ids included) as the CSV."""
+    import transfer
+
+    paths = {"csv": f"{kind}.csv"}
+    generated = rows(kind, n, random.Random(n), datetime.date.today())
+    first = next(generated)
+    with open(paths["csv"], "w", newline="") as f:
+        writer = csv.DictWriter(f, list(first))
+        writer.writeheader()
+        writer.writerow(first)
+        writer.writerows(generated)
+    if kind in transfer.ICS_KINDS:
+        paths["ics"] = f"{kind}.ics"
+        with open(paths["csv"], newline="") as src, open(paths["ics"], "w", newline="") as f:
+            for chunk in transfer.export(kind, "ics", transfer.records(kind, "csv", src, set(), transfer.ImportReport())):
+                f.write(chunk)
+    return paths
+
+
+def import_once(kind, fmt, path):
+    import store
+    import transfer
+
+    name, section, _ = transfer.KINDS[kind]
+    report = transfer.ImportReport()
+    started = time.perf_counter()
+    with open(path, "rb") as f:
+        records = transfer.records(kind, fmt, transfer.text(f), store.record_ids(name, section), report)
+        if kind == "classes":
+            records = transfer.flag_clashes(records, store.get("timetable"), report)
+        report.added = store.add_many(name, records, section)
+    store.flush()
+    return time.perf_counter() - started, report
+
+
+def pipeline_peak(kind, fmt, path):
+    import transfer
+
+    tracemalloc.start()
+    with open(path, "rb") as f:
+        for _ in transfer.records(kind, fmt, transfer.text(f), set(), transfer.ImportReport()):
+            pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def export_once(kind, fmt, path):
+    import store
+    import transfer
+
+    name, section, _ = transfer.KINDS[kind]
+    started = time.perf_counter()
+    with open(path, "w", newline="") as f:
+        for chunk in transfer.export(kind, fmt, store.all_records(name, section)()):
+            f.write(chunk)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--kinds", nargs="+", default=["events", "classes", "expenses"])
+    args = parser.parse_args()
+
+    # config resolves data/ against the working directory
+    os.chdir(tempfile.mkdtemp(prefix="campus-bench-"))
+    import store
+    import transfer
+
+    store.init_stores()
+    print(f"{'import':<16} {'file MiB':>9} {'seconds':>8} {'rows/s':>9} {'added':>8} {'skipped':>8} {'parse peak MiB':>15}")
+    for kind in args.kinds:
+        # the .ics file repeats the CSV's ids, so its import times the dedupe path
+        for fmt, path in write_inputs(kind, args.rows).items():
+            peak = pipeline_peak(kind, fmt, path)
+            elapsed, report = import_once(kind, fmt, path)
+            print(f"{kind + ' ' + fmt:<16} {os.path.getsize(path) / 2**20:>9.1f} {elapsed:>8.2f} {report.read / elapsed:>9,.0f} "
+                  f"{report.added:>8} {report.duplicates + report.invalid:>8} {peak / 2**20:>15.2f}")
+
+    print(f"\n{'export':<16} {'file MiB':>9} {'seconds':>8} {'peak MiB':>9}")
+    for kind in args.kinds:
+        for fmt in (["csv", "ics"] if kind in transfer.ICS_KINDS else ["csv"]) + ["jsonl"]:
+            path = f"out-{kind}.{fmt}"
+            elapsed = export_once(kind, fmt, path)
+            tracemalloc.start()
+            export_once(kind, fmt, path)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{kind + ' ' + fmt:<16} {os.path.getsize(path) / 2**20:>9.1f} {elapsed:>8.2f} {peak / 2**20:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Spawn N processes that add records to one store concurrently and check none are lost.
+
+Run from the repository root:
+
+    python bench/stress_concurrent_writes.py --procs 8 --writes 200 --backend json
+"""
+import argparse
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+import uuid
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from backends import JsonBackend  # noqa: E402
+from journal import JournalBackend  # noqa: E402
+from sqlite_backend import SqliteBackend  # noqa: E402
+
+
+def make(kind, path):
+    if kind == "json":
+        return JsonBackend()
+    if kind == "journal":
+        # a tiny threshold so compactions race with appends from the other processes
+        return JournalBackend(compact_bytes=4096)
+    return SqliteBackend(os.path.join(os.path.dirname(path), "campus.db"), {"events": path})
+
+
+def worker(kind, path, proc, writes, batch):
+    backend = make(kind, path)
+    ids = []
+    pending = []
+    for i in range(writes):
+        record = {"id": str(uuid.uuid4()), "title": f"p{proc}-{i}", "date": "2026-10-18"}
+        ids.append(record["id"])
+        entry = {"op": "add", "section": None, "record": record}
+        if not backend.append(path, entry, []):
+            # json: a session batches its adds until the end-of-run flush
+            pending.append(entry)
+            if len(pending) >= batch:
+                backend.commit(path, pending, [])
+                pending = []
+    if pending:
+        backend.commit(path, pending, [])
+    if kind == "journal":
+        backend.compact(path, [])
+    return ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--procs", type=int, default=8)
+    parser.add_argument("--writes", type=int, default=200)
+    parser.add_argument("--batch", type=int, default=5, help="adds per json flush")
+    parser.add_argument("--backend", choices=["json", "journal", "sqlite"], default="json")
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp()
+    path = os.path.join(tmp, "events.json")
+    try:
+        start = time.perf_counter()
+        with multiprocessing.Pool(args.procs) as pool:
+            results = pool.starmap(worker, [(args.backend, path, p, args.writes, args.batch) for p in range(args.procs)])
+        elapsed = time.perf_counter() - start
+
+        written = {i for ids in results for i in ids}
+        stored = [r["id"] for r in make(args.backend, path).load(path, [])]
+        lost = written - set(stored)
+        duplicated = len(stored) - len(set(stored))
+        print(f"{args.backend}: {args.procs} procs x {args.writes} adds in {elapsed:.2f}s, "
+              f"{len(stored)} stored, {len(lost)} lost, {duplicated} duplicated")
+        assert not lost and not duplicated
+    finally:
+        shutil.rmtree(tmp)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# Running totals and rollups for the budget store, kept next to budget.json so
+# the balance and summary metrics never have to re-sum every record.
+
+SECTIONS = ("incomes", "budgets", "expenses")
+FORMAT = 2  # bump when the rollups change; older saved aggregates are rebuilt
+
+
+def empty(source=None):
+    return {
+        "format": FORMAT,
+        # signature of the stored budget this was built from (utils.sig_marker);
+        # any write to the store, including an edit of an old record, changes it
+        "source": source,
+        "counts": {s: 0 for s in SECTIONS},
+        # id of the last record folded in per section; with the counts this
+        # tells whether the session's unsaved additions were folded in
+        "last_ids": {s: None for s in SECTIONS},
+        "totals": {s: 0.0 for s in SECTIONS},
+        "by_category": {},
+        "by_day": {},
+        "by_category_day": {},  # category -> {day: amount}
+        "by_month": {},
+    }
+
+
+def add(agg, section, record):
+    amount = float(record.get("amount", 0))
+    agg["counts"][section] += 1
+    agg["last_ids"][section] = record.get("id")
+    agg["totals"][section] += amount
+    if section == "expenses":
+        name = record.get("expense", "Other")
+        agg["by_category"][name] = agg["by_category"].get(name, 0.0) + amount
+        day = record.get("date")
+        if day:
+            agg["by_day"][day] = agg["by_day"].get(day, 0.0) + amount
+            by_day = agg["by_category_day"].setdefault(name, {})
+            by_day[day] = by_day.get(day, 0.0) + amount
+            agg["by_month"][day[:7]] = agg["by_month"].get(day[:7], 0.0) + amount
+    return agg
+
+
+def rebuild(budget_store, source=None):
+    agg = empty(source)
+    for section in SECTIONS:
+        for record in budget_store.get(section, []):
+            add(agg, section, record)
+    return agg
+
+
+def in_sync(agg, budget_store, source):
+    """O(1) check that `agg` was built from exactly the records in `budget_store`,
+    the store as saved with signature `source` plus whatever was added since."""
+    try:
+        if agg["format"] != FORMAT or agg["source"] != source:
+            return False
+        for section in SECTIONS:
+            records = budget_store.get(section, [])
+            last_id = records[-1].get("id") if records else None
+            if agg["counts"][section] != len(records) or agg["last_ids"][section] != last_id:
+                return False
+    except (KeyError, TypeError, AttributeError):
+        return False
+    return True
+
+
+def balance(agg):
+    return agg["totals"]["incomes"] - agg["totals"]["expenses"]
@@ -0,0 +1,149 @@
+# HTML card fragments for the list views. Cards are single-line <div>s so a
+# page of them can be joined into one st.markdown call.
+#
+# The static part of each card is built once per record version and kept in a
+# process-wide LRU (keyed on record id + content hash, capped in bytes); only
+# the relative bits ("N day(s) to go", overdue styling) are filled in per render.
+# User-provided text is HTML-escaped when the fragment is built.
+import datetime
+import html
+import threading
+from collections import OrderedDict
+
+from config import CARD_CACHE_BYTES
+
+OVERDUE_BADGE = '<span style="color:red">🚨 Overdue!</span>'
+
+_fragments = OrderedDict()  # (kind, id) -> (content hash, parts, size)
+_lock = threading.Lock()
+_size = 0
+
+
+def _date(value):
+    return datetime.date.fromisoformat(value)
+
+
+def _e(value):
+    # newlines would end the HTML block when a page of cards is joined into one markdown call
+    return html.escape(str(value)).replace("\n", "<br>")
+
+
+def _digest(record):
+    # records of one kind share their key order, so hashing the values is enough
+    try:
+        return hash(tuple(record.values()))
+    except TypeError:
+        return hash(repr(record))
+
+
+def _fragment(kind, record, build):
+    """Static parts of a card, from the cache when the record hasn't changed."""
+    global _size
+    key = (kind, record.get("id"))
+    digest = _digest(record)
+    # single OrderedDict operations are atomic, so the hit path skips the lock
+    hit = _fragments.get(key)
+    if hit is not None and hit[0] == digest:
+        try:
+            _fragments.move_to_end(key)
+        except KeyError:  # evicted by another session in the meantime
+            pass
+        return hit[1]
+    parts = build(record)
+    size = sum(len(p) for p in parts)
+    with _lock:
+        old = _fragments.pop(key, None)
+        if old is not None:
+            _size -= old[2]
+        _fragments[key] = (digest, parts, size)
+        _size += size
+        while _size > CARD_CACHE_BYTES and len(_fragments) > 1:
+            _, (_, _, evicted) = _fragments.popitem(last=False)
+            _size -= evicted
+    return parts
+
+
+def cache_info():
+    with _lock:
+        return {"entries": len(_fragments), "bytes": _size, "limit": CARD_CACHE_BYTES}
+
+
+def _pick_parts(e):
+    return (
+        f'<div class="card" style="margin-bottom:12px;">'
+        f'<h4 style="margin:0">{_e(e["title"])} <span style="color:gold">★</span></h4>'
+        f'<p style="margin:6px 0 0 0;"><b>Date:</b> {_e(e["date"])} | <b>Time:</b> {_e(e["time"])}<br>'
+        f'<b>Type:</b> {_e(e["type"])} | <b>Location:</b> {_e(e["location"])}<br>'
+        f'<small>⏳ ',
+        ' day(s) to go</small></p></div>',
+    )
+
+
+def pick_card(e, today):
+    head, tail = _fragment("pick", e, _pick_parts)
+    return f"{head}{(_date(e['date']) - today).days}{tail}"
+
+
+def _class_parts(e):
+    return (
+        f'<div class="card" style="margin-bottom:8px; background:{_e(e["color"])}">'
+        f'<strong>{_e(e["time"])} - {_e(e["course"])}</strong><br>'
+        f'👩‍🏫 {_e(e["lecturer"])}<br>'
+        f'🗒️ {_e(e["notes"])}<br>'
+        f'{"🔔 Reminder set" if e["reminder"] else ""}'
+        f'</div>',
+    )
+
+
+def class_card(e):
+    return _fragment("class", e, _class_parts)[0]
+
+
+def _assignment_parts(a):
+    return (
+        '<div class="card" style="margin-bottom:8px; background:',
+        '">'
+        f'<strong>📝 {_e(a["title"])}</strong> — {_e(a["course"])}<br>'
+        f'📅 Due: {_e(a["due_date"])} — <em>{_e(a["status"])}</em><br>'
+        f'📌 {_e(a["notes"])}<br>',
+        '</div>',
+    )
+
+
+def assignment_card(a, today):
+    head, middle, tail = _fragment("assignment", a, _assignment_parts)
+    overdue = a["due_date"] < today.isoformat() and a["status"] != "Done"
+    if overdue:
+        return f"{head}#ffdddd{middle}{OVERDUE_BADGE}{tail}"
+    return f"{head}#ffffff{middle}{tail}"
+
+
+def _event_parts(e):
+    return (
+        f'<div class="card" style="margin-bottom:10px; background:{_e(e["color"])}">'
+        f'<strong>🎫 {_e(e["title"])}</strong> — {_e(e["type"])}<br>'
+        f'📍 {_e(e["location"])} | 🕒 {_e(e["time"])} | 📅 {_e(e["date"])}<br>'
+        f'📝 {_e(e["description"])}<br>',
+        '</div>',
+    )
+
+
+def event_card(e, today):
+    head, tail = _fragment("event", e, _event_parts)
+    days_left = (_date(e["date"]) - today).days
+    when = f"⏳ Starts in {days_left} day(s)" if days_left >= 0 else "🚨 Happened already"
+    return f"{head}{when}{tail}"
+
+
+def _task_parts(t):
+    return (
+        f'<div class="card" style="margin-bottom:8px; background:{_e(t["color"])}">'
+        f'📌 <strong>{_e(t["title"])}</strong><br>'
+        f'🕒 {_e(t["time"])}<br>'
+        f'📝 {_e(t["description"])}'
+        f'</div>',
+    )
+
+
+def task_card(t):
+    return _fragment("task", t, _task_parts)[0]
@@ -0,0 +1,87 @@
+import hashlib
+import io
+import json
+import threading
+from collections import OrderedDict
+
+import streamlit as st
+
+import components
+import metrics
+import store
+from config import CHART_CACHE_SIZE, CHART_STYLE, CHART_TOP_N
+
+# content hash -> PNG bytes, shared by every session in the process
+_png_cache = OrderedDict()
+_png_lock = threading.Lock()
+
+
+def group_top(totals, top_n=CHART_TOP_N):
+    """Largest `top_n` categories by amount, with the rest folded into "Other"."""
+    ranked = sorted(((k, v) for k, v in totals.items() if v > 0), key=lambda kv: kv[1], reverse=True)
+    top, rest = ranked[:top_n], ranked[top_n:]
+    if rest:
+        top.append(("Other", sum(v for _, v in rest)))
+    return top
+
+
+def _content_hash(slices, figsize):
+    payload = json.dumps([slices, figsize], separators=(",", ":"))
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def _render_pie(slices, figsize):
+    # imported on first use so pages without charts never pay for matplotlib
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    with metrics.timer("chart_seconds", "pie render") as timer:
+        fig, ax = plt.subplots(figsize=figsize)
+        try:
+            ax.pie([v for _, v in slices], labels=[k for k, _ in slices], autopct="%1.1f%%", startangle=90)
+            ax.axis("equal")
+            buf = io.BytesIO()
+            fig.savefig(buf, format="png", bbox_inches="tight")
+        finally:
+            plt.close(fig)
+        timer.bytes = buf.tell()
+    return buf.getvalue()
+
+
+def pie_png(slices, figsize=(5, 3)):
+    """PNG of a pie chart, memoized on the slice labels/amounts and figure size."""
+    key = _content_hash(slices, figsize)
+    with _png_lock:
+        png = _png_cache.get(key)
+        if png is not None:
+            _png_cache.move_to_end(key)
+            return png
+    png = _render_pie(slices, figsize)
+    with _png_lock:
+        _png_cache[key] = png
+        while len(_png_cache) > CHART_CACHE_SIZE:
+            _png_cache.popitem(last=False)
+    return png
+
+
+def expense_chart(by_category, figsize=(5, 3)):
+    """Expense breakdown from the budget aggregate's per-category totals."""
+    slices = group_top(by_category)
+    if not slices:
+        return
+    with metrics.timer("chart_seconds", f"expense {CHART_STYLE}"):
+        if CHART_STYLE == "bar":
+            st.bar_chart({k: v for k, v in slices})
+        else:
+            st.image(pie_png(slices, figsize))
+
+
+@components.fragment
+def expense_snapshot(figsize):
+    """Expense chart for Home and the budget summary; False when there is nothing to draw."""
+    if st.session_state.budget_store.get("expenses"):
+        expense_chart(store.budget_aggregates()["by_category"], figsize=figsize)
+        return True
+    return False
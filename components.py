@@ -0,0 +1,152 @@
+import functools
+import time
+
+import streamlit as st
+
+import metrics
+import store
+import transfer
+from config import METRICS_FILE, PAGE_SIZE
+
+# st.fragment graduated from st.experimental_fragment in Streamlit 1.37
+_st_fragment = getattr(st, "fragment", None) or st.experimental_fragment
+
+timings = {}  # fragment name -> CPU seconds of its latest run (see bench/bench_fragments.py)
+
+
+def fragment(fn):
+    """Run a page section as an st.fragment, so its own widgets rerun only the section.
+
+    A fragment rerun skips the end of main.run(), so the stores it touched are
+    flushed here instead.
+    """
+    @functools.wraps(fn)
+    def run(*args, **kwargs):
+        started = time.thread_time()
+        try:
+            with metrics.timer("fragment_seconds", fn.__name__):
+                return fn(*args, **kwargs)
+        finally:
+            store.flush()
+            timings[fn.__name__] = time.thread_time() - started
+    return _st_fragment(run)
+
+
+def saved(key, *messages):
+    """After a write that sections outside the current fragment read: rerun the
+    whole app, then show `messages` in `key`.
+
+    Messages are (kind, text) pairs, e.g. ("success", "Saved!"). Forms keep the
+    sections that read them in their own fragment and show st.success inline
+    instead; only writes whose readers are elsewhere (bulk imports) need this.
+    """
+    st.session_state[f"{key}_flash"] = messages
+    st.rerun()
+
+
+def flash(key):
+    for kind, text in st.session_state.pop(f"{key}_flash", ()):
+        getattr(st, kind)(text)
+
+
+def _load_more(shown_key, shown, page_size):
+    st.session_state[shown_key] = shown + page_size
+
+
+def card_list(items, render, key, page_size=PAGE_SIZE, empty=None):
+    """Render `items` as HTML cards, one page per st.markdown call, with "Load more".
+
+    Only the cards that are shown are built and sent to the browser; `key` keeps
+    each list's window size separate in session_state.
+    """
+    if not items:
+        if empty:
+            st.info(empty)
+        return
+    shown_key = f"{key}_shown"
+    shown = st.session_state.get(shown_key, page_size)
+    st.markdown("\n".join(render(item) for item in items[:shown]), unsafe_allow_html=True)
+    remaining = len(items) - shown
+    if remaining > 0:
+        # a callback rather than st.rerun(), so inside a fragment only the fragment reruns
+        st.button(f"Load more ({remaining} more)", key=f"{key}_more", on_click=_load_more, args=(shown_key, shown, page_size))
+
+
+def collapsed_list(items, render, key, label, page_size=PAGE_SIZE):
+    """Like card_list, but nothing is rendered until the user asks for it."""
+    if items and st.toggle(f"{label} ({len(items)})", key=f"{key}_open"):
+        card_list(items, render, key, page_size)
+
+
+def _import_messages(kind, report):
+    messages = [("success", f"Imported {report.added} {kind}.") if report.added else ("info", f"No new {kind} to import.")]
+    if report.duplicates:
+        messages.append(("info", f"{report.duplicates} already saved, skipped."))
+    if report.invalid:
+        problems = "\n".join(f"- {'line ' + str(line) if line else 'file'}: {message}" for line, message in report.errors)
+        more = report.invalid - len(report.errors)
+        messages.append(("warning", f"{report.invalid} row(s) skipped:\n{problems}" + (f"\n- ... and {more} more" if more > 0 else "")))
+    if report.clashed:
+        clashes = "\n".join(f"- {message}" for message in report.clashes)
+        more = report.clashed - len(report.clashes)
+        messages.append(("warning", f"{report.clashed} imported class(es) overlap another class:\n{clashes}"
+                                    + (f"\n- ... and {more} more" if more > 0 else "")))
+    return messages
+
+
+@fragment
+def bulk_transfer(kind):
+    """Import `kind` (see transfer.KINDS) from an uploaded file and export it for download.
+
+    Picking a file or an export format reruns only this expander; an import
+    reruns the app, since the lists and totals it changes are outside it.
+    """
+    name, section, columns = transfer.KINDS[kind]
+    formats = ["csv", "ics"] if kind in transfer.ICS_KINDS else ["csv"]
+    key = f"{kind}_transfer"
+    flash(key)
+    with st.expander(f"📥 Import / export {kind}"):
+        upload = st.file_uploader(
+            f"Import from {' or '.join('.' + f for f in formats)}", type=formats, key=f"{key}_file",
+            help="CSV columns: " + ", ".join(columns) + ". Rows with an id that's already saved are skipped.",
+        )
+        if upload is not None and st.button(f"Import {kind}", key=f"{key}_import"):
+            fmt = "ics" if upload.name.lower().endswith(".ics") else "csv"
+            report = transfer.ImportReport()
+            records = transfer.records(kind, fmt, transfer.text(upload), store.record_ids(name, section), report)
+            if kind == "classes":
+                records = transfer.flag_clashes(records, store.get("timetable"), report)
+            report.added = store.add_many(name, records, section)
+            saved(key, *_import_messages(kind, report))
+        fmt = st.radio("Export as", formats + ["jsonl"], horizontal=True, key=f"{key}_format")
+        records = store.all_records(name, section)
+        # built only when clicked, on Streamlit's download thread
+        st.download_button(
+            f"📤 Export {kind}", data=lambda: transfer.download(transfer.export(kind, fmt, records())),
+            file_name=f"{kind}.{fmt}", mime=transfer.MIME[fmt], key=f"{key}_export",
+        )
+
+
+def diagnostics_panel():
+    """Rolling p50/p95 of every instrumented call in this process (see metrics.py)."""
+    rows = metrics.snapshot()
+    if not rows:
+        st.caption("Nothing recorded yet.")
+        return
+    table = []
+    for row in rows:
+        scale, unit = (1e3, "ms") if row["metric"].endswith("_seconds") else (1 / 1024, "KiB")
+        table.append({
+            "what": f"{row['metric'].rsplit('_', 1)[0]} · {row['name']}",
+            "n": row["count"],
+            "p50": f"{row['p50'] * scale:,.1f} {unit}",
+            "p95": f"{row['p95'] * scale:,.1f} {unit}",
+            "I/O": f"{row['bytes'] / 1024:,.0f} KiB" if row["bytes"] else "",
+        })
+    st.dataframe(table, hide_index=True)
+    c1, c2 = st.columns(2)
+    if c1.button("Reset", key="diagnostics_reset"):
+        metrics.reset()
+    if METRICS_FILE and c2.button("Export", key="diagnostics_export"):
+        metrics.export(METRICS_FILE)
+        st.caption(f"Written to {METRICS_FILE}")
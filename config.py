@@ -11,3 +11,81 @@ FILES = {
     "streaks": os.path.join(DATA_DIR, "streaks.json"),
     "budget": os.path.join(DATA_DIR, "budget.json"),
 }
+# past months of events.json, one file per month (YYYY-MM.json), loaded on request
+EVENTS_ARCHIVE_DIR = os.path.join(DATA_DIR, "events_archive")
+# archived months kept parsed in memory per process
+ARCHIVE_CACHE_MONTHS = 12
+# personal schedules, one file per user (percent-encoded name + .json), loaded on first use
+PERSONAL_DIR = os.path.join(DATA_DIR, "personal")
+# full-text search index over events, assignments and classes (rebuilt if unreadable)
+SEARCH_FILE = os.path.join(DATA_DIR, "search.index")
+# changes to the search index are written back at most this often (seconds)
+SEARCH_SAVE_SECONDS = 60
+# running totals and rollups derived from budget.json (rebuilt when out of sync)
+BUDGET_AGG_FILE = os.path.join(DATA_DIR, "budget.agg.json")
+
+# storage backend for the stores in FILES: "json" rewrites the whole file on
+# flush, "journal" appends each change to a per-store JSON Lines journal,
+# "sqlite" keeps indexed tables in SQLITE_PATH (migrate with
+# `python sqlite_backend.py`)
+STORAGE_BACKEND = os.environ.get("CAMPUS_STORAGE_BACKEND", "json")
+# compact a journal into its snapshot once it grows past this many bytes
+JOURNAL_COMPACT_BYTES = int(os.environ.get("CAMPUS_JOURNAL_COMPACT_BYTES", 1024 * 1024))
+SQLITE_PATH = os.environ.get("CAMPUS_SQLITE_PATH", os.path.join(DATA_DIR, "campus.db"))
+
+# JSON encoder for the data files (serialization.py): "auto" (orjson when
+# installed, else the standard library), "orjson" or "json". Archived months
+# are written gzip-compressed; either kind of file loads whatever the setting.
+DATA_CODEC = os.environ.get("CAMPUS_DATA_CODEC", "auto")
+ARCHIVE_GZIP = os.environ.get("CAMPUS_ARCHIVE_GZIP", "1").lower() in ("1", "true", "yes")
+GZIP_LEVEL = 6
+# each save keeps the version it replaces as <file>.bak, loaded instead if the file is unreadable
+BACKUP_SUFFIX = ".bak"
+
+# expense charts: "pie" (matplotlib, cached PNG) or "bar" (native st.bar_chart)
+CHART_STYLE = os.environ.get("CAMPUS_CHART_STYLE", "pie")
+# slices shown before the rest are grouped into "Other"
+CHART_TOP_N = 8
+# rendered chart images kept per process
+CHART_CACHE_SIZE = 64
+
+# timetable: assumed class length and the day window searched for free slots (minutes)
+CLASS_MINUTES = 60
+DAY_START = 8 * 60
+DAY_END = 20 * 60
+# assumed length of events and personal tasks when checking for clashes (minutes)
+EVENT_MINUTES = 60
+TASK_MINUTES = 60
+
+# cards rendered per page in the event / assignment / class lists
+PAGE_SIZE = int(os.environ.get("CAMPUS_PAGE_SIZE", 20))
+# memory cap for the process-wide cache of rendered card HTML
+CARD_CACHE_BYTES = 8 * 1024 * 1024
+
+# StudyBot: bundled study tips ("## Title" sections) and the questions whose interpretation is kept per process
+STUDY_TIPS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus", "study_tips.md")
+STUDYBOT_CACHE_SIZE = 1024
+
+# logo and fonts served by Streamlit from static/ next to main.py
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+# never fetch anything from the network (fonts fall back to the system stack)
+OFFLINE = os.environ.get("CAMPUS_OFFLINE", "").lower() in ("1", "true", "yes")
+# without font files in static/fonts the theme uses the system font stack;
+# set this to @import them from Google Fonts instead
+REMOTE_FONTS = not OFFLINE and os.environ.get("CAMPUS_REMOTE_FONTS", "").lower() in ("1", "true", "yes")
+
+# developer diagnostics: record page, fragment, load/save, chart and session-size
+# timings (rolling p50/p95 over the last METRICS_WINDOW of each) and offer the
+# sidebar panel; off by default, and then every instrumented call costs one bool check
+DIAGNOSTICS = os.environ.get("CAMPUS_DIAGNOSTICS", "").lower() in ("1", "true", "yes")
+METRICS_WINDOW = 1000
+# session_state is measured at most this often per session (seconds)
+SESSION_SIZE_SECONDS = 30
+# where diagnostics are exported: Prometheus text, or JSON lines for a .jsonl path
+METRICS_FILE = os.environ.get("CAMPUS_METRICS_FILE") or None
+METRICS_EXPORT_SECONDS = 60
+
+# bulk import / export (transfer.py): problems listed after an import and records
+# written per chunk
+IMPORT_ERRORS_SHOWN = 20
+EXPORT_CHUNK_ROWS = 1000
@@ -0,0 +1,148 @@
+import contextlib
+import json
+import os
+import threading
+from collections.abc import Mapping
+
+import models
+from utils import file_lock, file_signature, load_data, save_data
+
+JOURNAL_SUFFIX = ".journal.jsonl"
+
+_locks = {}
+_locks_guard = threading.Lock()
+_compacting = set()
+
+
+def journal_path(path):
+    return os.path.splitext(path)[0] + JOURNAL_SUFFIX
+
+
+@contextlib.contextmanager
+def _locked(path):
+    # thread lock for sessions in this process, file lock for other server processes
+    with _locks_guard:
+        lock = _locks.setdefault(path, threading.Lock())
+    with lock, file_lock(path):
+        yield
+
+
+def record_key(item):
+    """Records are matched by their uuid `id`; plain values (streak dates) by themselves."""
+    return item.get("id") if isinstance(item, Mapping) else item
+
+
+def _matches(item, key):
+    return record_key(item) == key
+
+
+def apply_op(data, entry):
+    """Apply one journal entry (add / update / delete) to a loaded store in place."""
+    section = entry.get("section")
+    target = data.setdefault(section, []) if section else data
+    op = entry["op"]
+    if op == "add":
+        target.append(entry["record"])
+    elif op == "update":
+        # replace rather than mutate: loaded records may be shared between sessions
+        for i, item in enumerate(target):
+            if _matches(item, entry["id"]):
+                target[i] = {**item, **entry["changes"]}
+                break
+    elif op == "delete":
+        target[:] = [item for item in target if not _matches(item, entry["id"])]
+    return data
+
+
+def _replay(path, data):
+    jpath = journal_path(path)
+    if not os.path.exists(jpath):
+        return data
+    with open(jpath, "r") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # a crash mid-append can leave a torn last line; skip it
+                continue
+            apply_op(data, entry)
+    return data
+
+
+class JournalBackend:
+    """Snapshot (the regular JSON file) plus an append-only journal of changes."""
+
+    incremental = True
+    indexed = False
+
+    def __init__(self, compact_bytes):
+        self.compact_bytes = compact_bytes
+
+    def signature(self, path):
+        return file_signature(path, journal_path(path))
+
+    def load(self, path, default):
+        with _locked(path):
+            return _replay(path, load_data(path, default))
+
+    def save(self, path, data):
+        # a full save replaces the snapshot, so the journal is no longer needed
+        with _locked(path):
+            save_data(path, data)
+            jpath = journal_path(path)
+            if os.path.exists(jpath):
+                os.remove(jpath)
+
+    def append(self, path, entry, default):
+        return self.append_many(path, [entry], default)
+
+    def append_many(self, path, entries, default):
+        """Append several entries under one lock and one open of the journal.
+
+        Returns the signature before and after the write, both read under the
+        lock: when the first is the one a session loaded, nobody else wrote in between.
+        """
+        with _locked(path):
+            before = self.signature(path)
+            with open(journal_path(path), "a") as f:
+                f.writelines(json.dumps(entry, default=models.to_json) + "\n" for entry in entries)
+                size = f.tell()
+            after = self.signature(path)
+        if size >= self.compact_bytes:
+            self.compact_async(path, default)
+        return before, after
+
+    def compact(self, path, default):
+        with _locked(path):
+            jpath = journal_path(path)
+            if not os.path.exists(jpath):
+                return
+            data = _replay(path, load_data(path, default))
+            save_data(path, data)
+            os.remove(jpath)
+
+    def rewrite(self, path, default, transform):
+        """Replace snapshot and journal with `transform(data)`; None from `transform` leaves them alone."""
+        with _locked(path):
+            data = transform(_replay(path, load_data(path, default)))
+            if data is not None:
+                save_data(path, data)
+                jpath = journal_path(path)
+                if os.path.exists(jpath):
+                    os.remove(jpath)
+        return data
+
+    def compact_async(self, path, default):
+        with _locks_guard:
+            if path in _compacting:
+                return
+            _compacting.add(path)
+
+        def run():
+            try:
+                self.compact(path, default)
+            finally:
+                with _locks_guard:
+                    _compacting.discard(path)
+
+        threading.Thread(target=run, name=f"compact-{os.path.basename(path)}", daemon=True).start()
@@ -0,0 +1,96 @@
+# campus_companion.py -- entry point: streamlit run main.py
+import importlib
+import time
+
+import streamlit as st
+
+import components
+import metrics
+import store
+import theme
+import utils
+
+# ----------------------------
+# 🧭 Page registry: key -> (sidebar label, module imported on first visit)
+# ----------------------------
+PAGES = {
+    "home": ("🏠 Home", "pages.home"),
+    "budget": ("💰 Budget Tracker", "pages.budget"),
+    "timetable": ("📅 Timetable", "pages.timetable"),
+    "activities": ("🎉 Activities", "pages.activities"),
+    "chatbot": ("🤖 StudyBot", "pages.chatbot"),
+}
+
+
+def render_page(key):
+    # importlib caches the module, so only the first visit pays for its imports
+    with metrics.timer("page_seconds", key):
+        importlib.import_module(PAGES[key][1]).render()
+
+
+def run():
+    started = time.thread_time()
+    # ----------------------------
+    # 🌈 CONFIG
+    # ----------------------------
+    st.set_page_config(page_title="Campus Companion", page_icon="🎓", layout="wide")
+
+    # ----------------------------
+    # 🎨 THEME & GLOBAL FONT (built once per process in theme.py)
+    # ----------------------------
+    theme.apply_theme()
+
+    # ----------------------------
+    # 🔁 Initialize / Load Data into session_state
+    # ----------------------------
+    if "page" not in st.session_state:
+        st.session_state.page = "home"
+
+    # load stores
+    store.init_stores()
+    for message in utils.recovered.values():
+        st.warning(f"⚠️ {message}")
+
+    # ----------------------------
+    # 🧭 Sidebar Navigation (high contrast & clear)
+    # ----------------------------
+    with st.sidebar:
+        st.markdown(theme.logo_html(72), unsafe_allow_html=True)
+        st.markdown("<h2 style='color:white; margin:6px 0 0 0;'>Campus Companion</h2>", unsafe_allow_html=True)
+        st.markdown("<div style='color:#dbeaff; margin-bottom:8px;'>Your  luxury planner</div>", unsafe_allow_html=True)
+        st.markdown("---", unsafe_allow_html=True)
+
+        mapping = {label: key for key, (label, _) in PAGES.items()}
+        page_choice = st.radio("Navigate", list(mapping))
+        st.session_state.page = mapping.get(page_choice, "home")
+
+        st.markdown("---", unsafe_allow_html=True)
+        if st.button("Save All Now"):
+            store.flush(force=True)
+            st.success("All data saved ✅")
+
+        # developer opt-in (CAMPUS_DIAGNOSTICS=1); filled after the page so it includes this run
+        diagnostics = st.container() if metrics.enabled and st.toggle("🩺 Diagnostics") else None
+
+    # ----------------------------
+    # 🧭 Page Router
+    # ----------------------------
+    render_page(st.session_state.page)
+
+    # ----------------------------
+    # 🔁 Auto-save: flush only the stores mutated during this rerun
+    # (fragment reruns stop before this line and flush in components.fragment)
+    # ----------------------------
+    store.flush()
+    components.timings["app"] = time.thread_time() - started
+
+    if metrics.enabled:
+        metrics.observe_session(st.session_state, store.shared_objects())
+        metrics.maybe_export()
+        if diagnostics is not None:
+            with diagnostics:
+                components.diagnostics_panel()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,209 @@
+# Process-wide timings for the diagnostics panel: page renders, fragments,
+# load_data / save_data (with bytes moved), chart rendering and the size of
+# each session's st.session_state.
+#
+# A series keeps its last METRICS_WINDOW observations, so p50/p95 roll with
+# the traffic. Nothing is recorded unless DIAGNOSTICS is set: timer() then
+# hands back a shared no-op and observe() returns after one bool check.
+# export() writes Prometheus text or, for a .jsonl path, appends JSON lines.
+import json
+import sys
+import threading
+import time
+import types
+from collections import deque
+
+from config import DIAGNOSTICS, METRICS_EXPORT_SECONDS, METRICS_FILE, METRICS_WINDOW, SESSION_SIZE_SECONDS
+
+enabled = DIAGNOSTICS
+
+_series = {}  # (metric, name) -> _Series
+_lock = threading.Lock()
+_exported = 0.0
+
+
+class _Series:
+    __slots__ = ("values", "count", "total", "bytes")
+
+    def __init__(self):
+        self.values = deque(maxlen=METRICS_WINDOW)
+        self.count = 0
+        self.total = 0.0
+        self.bytes = 0
+
+
+def observe(metric, name, value, nbytes=0):
+    """Record one observation of `metric` (e.g. "page_seconds") for `name` (e.g. "home")."""
+    if not enabled:
+        return
+    with _lock:
+        series = _series.get((metric, name))
+        if series is None:
+            series = _series[(metric, name)] = _Series()
+        series.values.append(value)
+        series.count += 1
+        series.total += value
+        series.bytes += nbytes
+
+
+class _Timer:
+    __slots__ = ("metric", "name", "bytes", "started")
+
+    def __init__(self, metric, name):
+        self.metric = metric
+        self.name = name
+        self.bytes = 0
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        observe(self.metric, self.name, time.perf_counter() - self.started, self.bytes)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __setattr__(self, attr, value):
+        pass  # `timer.bytes = n` is ignored when disabled
+
+
+_NULL = _NullTimer()
+
+
+def timer(metric, name):
+    """Context manager recording its block's wall time; set `.bytes` on it to count I/O."""
+    return _Timer(metric, name) if enabled else _NULL
+
+
+def _percentile(ordered, q):
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+def snapshot():
+    """[{metric, name, count, sum, p50, p95, max, bytes}] for every series, sorted by metric and name."""
+    with _lock:
+        items = [(key, sorted(s.values), s.count, s.total, s.bytes) for key, s in _series.items()]
+    return [
+        {"metric": metric, "name": name, "count": count, "sum": total,
+         "p50": _percentile(ordered, 0.5), "p95": _percentile(ordered, 0.95), "max": ordered[-1] if ordered else 0.0,
+         "bytes": nbytes}
+        for (metric, name), ordered, count, total, nbytes in sorted(items, key=lambda item: item[0])
+    ]
+
+
+def reset():
+    with _lock:
+        _series.clear()
+
+
+# ----------------------------
+# Session size: session_state minus the shared store data it points at
+# ----------------------------
+# counted themselves but never walked into: their attributes are code, not session data
+_OPAQUE = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType)
+
+
+def deep_size(root, exclude=frozenset()):
+    """Bytes reachable from `root`, not descending into objects whose id() is in `exclude`."""
+    seen = set(exclude)
+    stack = [root]
+    size = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+            stack.extend(obj)
+        elif isinstance(obj, _OPAQUE):
+            continue
+        elif hasattr(obj, "__dict__"):
+            stack.append(obj.__dict__)
+        elif hasattr(obj, "__slots__"):
+            stack.extend(getattr(obj, slot) for slot in obj.__slots__ if hasattr(obj, slot))
+    return size
+
+
+def observe_session(session_state, shared):
+    """Record the session's own state size, at most every SESSION_SIZE_SECONDS per session.
+
+    `shared` yields the process-wide store objects (and records) the session
+    only references; they are counted once for the process, not per session.
+    """
+    if not enabled:
+        return
+    now = time.monotonic()
+    if now - session_state.get("_metrics_sized_at", 0.0) < SESSION_SIZE_SECONDS:
+        return
+    session_state["_metrics_sized_at"] = now
+    started = time.perf_counter()
+    state = {key: session_state[key] for key in session_state}
+    size = deep_size(state, {id(obj) for obj in shared})
+    observe("session_state_bytes", "session", size)
+    observe("session_size_seconds", "deep_size", time.perf_counter() - started)
+
+
+# ----------------------------
+# Export
+# ----------------------------
+def prometheus():
+    """The series as Prometheus text exposition: one summary per metric, then the byte counters."""
+    summaries = {}
+    counters = {}
+    for row in snapshot():
+        label = row["name"].replace("\\", "\\\\").replace('"', '\\"')
+        family = f"campus_{row['metric']}"
+        lines = summaries.setdefault(family, [])
+        for q in ("0.5", "0.95"):
+            lines.append(f'{family}{{name="{label}",quantile="{q}"}} {row["p50" if q == "0.5" else "p95"]:.6g}')
+        lines.append(f'{family}_sum{{name="{label}"}} {row["sum"]:.6g}')
+        lines.append(f'{family}_count{{name="{label}"}} {row["count"]}')
+        if row["bytes"]:
+            counter = f"campus_{row['metric'].removesuffix('_seconds')}_bytes_total"
+            counters.setdefault(counter, []).append(f'{counter}{{name="{label}"}} {row["bytes"]}')
+    out = []
+    for kind, families in (("summary", summaries), ("counter", counters)):
+        for family, lines in families.items():
+            out.append(f"# TYPE {family} {kind}")
+            out.extend(lines)
+    return "\n".join(out) + "\n"
+
+
+def export(path=METRICS_FILE):
+    """Write the current series to `path`: JSON lines appended for .jsonl, Prometheus text otherwise."""
+    if path.endswith(".jsonl"):
+        stamp = time.time()
+        with open(path, "a") as f:
+            for row in snapshot():
+                f.write(json.dumps({"ts": stamp, **row}) + "\n")
+        return
+    # replaced atomically, so a node-exporter textfile collector never reads half a file
+    from utils import atomic_write  # utils times its own writes with this module
+
+    with atomic_write(path, ".prom") as f:
+        f.write(prometheus().encode())
+
+
+def maybe_export():
+    """export() to METRICS_FILE at most every METRICS_EXPORT_SECONDS."""
+    global _exported
+    if not enabled or not METRICS_FILE:
+        return
+    with _lock:
+        if time.monotonic() - _exported < METRICS_EXPORT_SECONDS:
+            return
+        _exported = time.monotonic()
+    export(METRICS_FILE)
@@ -0,0 +1,242 @@
+# Compact typed records for the stores that grow large: events, classes,
+# assignments, incomes and expenses.
+#
+# The shared copy of a store (store._cached_load) holds these instead of the
+# dicts json.load returns. Each record keeps its fields in __slots__: dates as
+# day ordinals, "09:00 AM" times as minutes, and repeated labels (type,
+# status, day, course, ...) interned, so equal values are one object however
+# many records carry them. The ordinals and minutes themselves are shared the
+# same way.
+#
+# A record still reads like the dict it came from (r["date"], r.get("time"),
+# {**r, **changes}, iteration, ==), giving back exactly the JSON values it was
+# built from, so the pages, indexes and backends don't tell the difference.
+# Values that wouldn't survive the round trip unchanged (a date that isn't
+# ISO, a time in another format) and unknown keys are kept as they are in
+# `extra`, and keys that weren't in FIELDS order have their order kept in
+# `order`. to_json() gives the original dict back, keys in the same order.
+import datetime
+import operator
+import sys
+from collections.abc import Mapping
+
+_MISSING = object()
+
+# shared value <-> stored value, so each distinct date or time exists once per process
+_ordinals = {}  # "2026-10-18" -> 739907
+_dates = {}  # 739907 -> "2026-10-18"
+_minutes = {}  # "09:00 AM" -> 540
+_labels = {}  # 540 -> "09:00 AM"
+_orders = {}  # key order of records not in FIELDS order, one tuple per distinct order
+
+
+def _encode_date(value):
+    ordinal = _ordinals.get(value)
+    if ordinal is None:
+        try:
+            date = datetime.date.fromisoformat(value)
+        except (TypeError, ValueError):
+            return _MISSING
+        if date.isoformat() != value:
+            return _MISSING  # "20261018" parses too, but wouldn't come back the same
+        ordinal = _ordinals[value] = date.toordinal()
+        _dates[ordinal] = value
+    return ordinal
+
+
+def _encode_time(value):
+    minutes = _minutes.get(value)
+    if minutes is None:
+        try:
+            t = datetime.datetime.strptime(value, "%I:%M %p")
+        except (TypeError, ValueError):
+            return _MISSING
+        if t.strftime("%I:%M %p") != value:
+            return _MISSING  # "9:00 AM" parses too, but wouldn't come back the same
+        minutes = _minutes[value] = t.hour * 60 + t.minute
+        _labels[minutes] = value
+    return minutes
+
+
+def _encode_label(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+DATE, TIME, LABEL = "date", "time", "label"
+_ENCODERS = {DATE: _encode_date, TIME: _encode_time, LABEL: _encode_label}
+_DECODERS = {DATE: _dates.__getitem__, TIME: _labels.__getitem__}
+
+
+class Record(Mapping):
+    """Base of the typed records; subclasses list their JSON keys in __slots__ and FIELDS."""
+
+    __slots__ = ("extra", "order")
+    FIELDS = {}  # JSON key -> DATE / TIME / LABEL, or None for a value kept as is
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._keys = tuple(cls.FIELDS)
+        # (key, slot setter, encoder) per field: from_json runs once per record on every load
+        cls._plan = tuple((key, getattr(cls, key).__set__, _ENCODERS.get(kind)) for key, kind in cls.FIELDS.items())
+        # and (key, decoder) plus one getter for every slot: to_json runs once per record on every save
+        cls._decoders = tuple((key, _DECODERS.get(kind)) for key, kind in cls.FIELDS.items())
+        cls._values = operator.attrgetter(*cls.FIELDS)
+
+    @classmethod
+    def from_json(cls, data):
+        """A record holding `data`; records and anything that isn't a dict are returned unchanged."""
+        if not isinstance(data, dict):
+            return data
+        record = cls.__new__(cls)
+        extra = None
+        present = 0
+        for key, set_slot, encode in cls._plan:
+            value = data.get(key, _MISSING)
+            if value is not _MISSING:
+                present += 1
+                if encode is not None:
+                    stored = encode(value)
+                    if stored is _MISSING:
+                        extra = extra or {}
+                        extra[key] = value
+                    value = stored
+            set_slot(record, value)
+        if len(data) > present:
+            extra = extra or {}
+            extra.update((key, value) for key, value in data.items() if key not in cls.FIELDS)
+        _set_extra(record, extra)
+        order = None
+        if present < len(cls._keys) or len(data) > present or tuple(data) != cls._keys:
+            keys = tuple(data)
+            if keys != tuple(record._canonical()):
+                order = _orders.setdefault(keys, keys)
+        _set_order(record, order)
+        return record
+
+    def _canonical(self):
+        # key order without `order`: FIELDS, then the unknown keys
+        for key in self._keys:
+            if getattr(self, key) is not _MISSING:
+                yield key
+            elif self.extra is not None and key in self.extra:
+                yield key
+        if self.extra is not None:
+            yield from (key for key in self.extra if key not in self.FIELDS)
+
+    def to_json(self):
+        data = {}
+        extra = self.extra
+        for (key, decode), value in zip(self._decoders, self._values(self)):
+            if value is not _MISSING:
+                data[key] = value if decode is None else decode(value)
+            elif extra is not None and key in extra:
+                data[key] = extra[key]
+        if extra is not None:
+            for key, value in extra.items():
+                if key not in data:
+                    data[key] = value
+        if self.order is not None:
+            return {key: data[key] for key in self.order}
+        return data
+
+    def __setattr__(self, name, value):
+        # shared between sessions: changes replace the record ({**r, **changes}), never edit it
+        raise AttributeError(f"{type(self).__name__} records are read-only")
+
+    def __getitem__(self, key):
+        kind = self.FIELDS.get(key, _MISSING)
+        if kind is not _MISSING:
+            value = getattr(self, key)
+            if value is not _MISSING:
+                decode = _DECODERS.get(kind)
+                return value if decode is None else decode(value)
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        if key in self.FIELDS and getattr(self, key) is not _MISSING:
+            return True
+        return self.extra is not None and key in self.extra
+
+    def __iter__(self):
+        return iter(self.order) if self.order is not None else self._canonical()
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_json()!r})"
+
+    def __reduce__(self):
+        return type(self).from_json, (self.to_json(),)
+
+
+_set_extra = Record.extra.__set__
+_set_order = Record.order.__set__
+
+
+class Event(Record):
+    __slots__ = ("id", "title", "date", "time", "location", "type", "color", "user_pick", "description")
+    FIELDS = {"id": None, "title": None, "date": DATE, "time": TIME, "location": LABEL, "type": LABEL,
+              "color": LABEL, "user_pick": None, "description": LABEL}
+
+
+class ClassEntry(Record):
+    __slots__ = ("id", "day", "time", "start_min", "duration_min", "course", "lecturer", "notes", "color", "reminder")
+    FIELDS = {"id": None, "day": LABEL, "time": TIME, "start_min": None, "duration_min": None, "course": LABEL,
+              "lecturer": LABEL, "notes": LABEL, "color": LABEL, "reminder": None}
+
+
+class Assignment(Record):
+    __slots__ = ("id", "course", "title", "status", "due_date", "notes")
+    FIELDS = {"id": None, "course": LABEL, "title": None, "status": LABEL, "due_date": DATE, "notes": LABEL}
+
+
+class Income(Record):
+    __slots__ = ("id", "source", "amount")
+    FIELDS = {"id": None, "source": LABEL, "amount": None}
+
+
+class Expense(Record):
+    __slots__ = ("id", "expense", "amount", "color", "date")
+    FIELDS = {"id": None, "expense": LABEL, "amount": None, "color": LABEL, "date": DATE}
+
+
+# store name (key in config.FILES) -> record type, or {section: record type}
+TYPES = {
+    "events": Event,
+    "timetable": ClassEntry,
+    "assignments": Assignment,
+    "budget": {"incomes": Income, "expenses": Expense},
+}
+
+
+def compact(name, data):
+    """A store's loaded data with its records as typed records; stores without a type come back unchanged."""
+    kind = TYPES.get(name)
+    if kind is None:
+        return data
+    if isinstance(kind, dict):
+        return {section: [kind[section].from_json(r) for r in records] if section in kind else records
+                for section, records in data.items()}
+    return [kind.from_json(r) for r in data]
+
+
+def to_json(obj):
+    """`default` hook for the JSON encoders: typed records as their dicts, dates and times as str.
+
+    Anything else is a bug in the caller and raises TypeError, rather than
+    being saved as its repr and read back as a string.
+    """
+    if isinstance(obj, Record):
+        return obj.to_json()
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -0,0 +1,7 @@
+# Page modules, imported by main.py the first time each page is visited.
+#
+# Every page module exposes render(). Its sections are components.fragment
+# functions: interacting with one reruns only that section. A form shares its
+# fragment with every section that reads what it writes (nested fragments
+# inside keep their own widgets local), so a submit never reruns the app;
+# only bulk imports, read outside their fragment, end with components.saved().
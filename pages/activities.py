@@ -0,0 +1,135 @@
+# Activities: campus events and personal schedules.
+import datetime
+import uuid
+
+import streamlit as st
+
+import cards
+import components
+import schedule
+import store
+import timetable
+import transfer
+from config import DAY_END, DAY_START, TASK_MINUTES
+
+
+def event_form():
+    with st.form("public_event_form"):
+        ev_title = st.text_input("Event Title")
+        ev_date = st.date_input("Event Date", value=datetime.date.today())
+        ev_time = st.time_input("Event Time")
+        ev_loc = st.text_input("Location")
+        ev_type = st.selectbox("Event Type", transfer.EVENT_TYPES)
+        ev_color = st.color_picker("Event Color", value="#cfe9ff")
+        ev_pick = st.checkbox("Mark as User's Pick (spotlight)")
+        ev_desc = st.text_area("Description")
+        add_ev = st.form_submit_button("✅ Add Event")
+        if add_ev and ev_title:
+            event = {
+                "id": str(uuid.uuid4()),
+                "title": ev_title,
+                "date": ev_date.isoformat(),
+                "time": ev_time.strftime("%I:%M %p"),
+                "location": ev_loc,
+                "type": ev_type,
+                "color": ev_color,
+                "user_pick": ev_pick,
+                "description": ev_desc or "No description"
+            }
+            store.add_event(event)
+            st.success("🎉 Event added!")
+    components.bulk_transfer("events")
+
+
+@components.fragment
+def event_list():
+    today = datetime.date.today()
+    if st.session_state.all_events:
+        upcoming, past = store.upcoming_and_past_events(today)
+        components.card_list(upcoming, lambda e: cards.event_card(e, today), key="events", empty="No upcoming events.")
+        components.collapsed_list(past, lambda e: cards.event_card(e, today), key="events_past", label="Show past events")
+    else:
+        st.info("No campus events yet — add one above!")
+
+    # earlier months live in the archive and are only read when one is picked
+    months = store.archived_months()
+    if months:
+        month = st.selectbox("Browse archived events", ["—"] + months)
+        if month != "—":
+            components.card_list(store.archived_events(month), lambda e: cards.event_card(e, today), key=f"events_{month}")
+
+
+@components.fragment
+def personal_schedule():
+    # the task form, today's list and the free-slot finder all read the same
+    # schedules, so they share one fragment and a new task never needs a full rerun
+    today = datetime.date.today()
+    username = st.text_input("Your name (for personal schedule)", value="Daniella")
+    # other pages (search) only look at this user's tasks
+    st.session_state.current_user = username
+    if not username:
+        st.info("Enter your name to see your personal schedule.")
+        return
+
+    with st.form("personal_event_form"):
+        ptitle = st.text_input("Task Title")
+        pdate = st.date_input("Task Date", value=today)
+        ptime = st.time_input("Task Time")
+        pdesc = st.text_area("Notes")
+        pcolor = st.color_picker("Color tag", value="#e3f2fd")
+        psave = st.form_submit_button("➕ Add Personal Task")
+        if psave and ptitle:
+            start_min = ptime.hour * 60 + ptime.minute
+            clashes = store.schedule_clashes(username, pdate, start_min, start_min + TASK_MINUTES)
+            store.add_personal_task(username, {
+                "id": str(uuid.uuid4()),
+                "title": ptitle,
+                "date": pdate.isoformat(),
+                "time": ptime.strftime("%I:%M %p"),
+                "description": pdesc,
+                "color": pcolor
+            })
+            st.success(f"Added personal task '{ptitle}'")
+            if clashes:
+                st.warning("⚠️ Overlaps with " + ", ".join(c.get("course") or c.get("title", "") for c in clashes))
+
+    st.markdown(f"#### Tasks for {username} (today)")
+    components.card_list(store.tasks_between(username, today, today), cards.task_card, key="tasks_today")
+    sunday = today + datetime.timedelta(days=6 - today.weekday())
+    if sunday > today:
+        later = store.tasks_between(username, today + datetime.timedelta(days=1), sunday)
+        components.collapsed_list(later, cards.task_card, key="tasks_week", label="Later this week")
+
+    st.markdown("#### 👥 Find a common free slot")
+    people = st.multiselect("Who's meeting?", sorted(set(store.personal_users()) | {username}), default=[username])
+    meet_date = st.date_input("Meeting date", value=today)
+    if people:
+        busy = {p: store.busy_on(p, meet_date) for p in people}
+        windows = schedule.common_free_windows(busy, DAY_START, DAY_END)
+        if windows:
+            st.write("Everyone is free: " + ", ".join(
+                f"{timetable.minutes_to_label(a)}–{timetable.minutes_to_label(b)}" for a, b in windows))
+        else:
+            st.info("No common free window that day.")
+
+
+@components.fragment
+def events_section():
+    # a new event goes straight into the list below, in the same fragment run
+    st.subheader("Create an Event for Everyone")
+    event_form()
+
+    st.markdown("---")
+    st.subheader("Upcoming Campus Events")
+    event_list()
+
+
+def render():
+    st.title("🎉 Campus Activities")
+    st.write("Create public events and personal schedule items.")
+
+    events_section()
+
+    st.markdown("---")
+    st.subheader("Your Personal Schedule")
+    personal_schedule()
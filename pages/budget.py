@@ -0,0 +1,122 @@
+# Budget Tracker: incomes, planned budgets, expenses, the logging streak and a summary.
+import datetime
+import uuid
+
+import streamlit as st
+
+import charts
+import components
+import store
+
+
+def income_section():
+    st.subheader("💵 Add Income")
+    with st.form("income_form"):
+        source = st.text_input("Source name")
+        amount = st.number_input("Amount", min_value=0.0, format="%f")
+        submit = st.form_submit_button("➕ Add Income")
+        if submit and source and amount:
+            store.add("budget", {"id": str(uuid.uuid4()), "source": source, "amount": float(amount)}, section="incomes")
+            st.success(f"Added income: {source} — ₦{amount:,.2f}")
+
+    if st.session_state.budget_store.get("incomes"):
+        st.markdown("**Your incomes**")
+        for inc in st.session_state.budget_store["incomes"]:
+            st.write(f"• {inc['source']} — ₦{inc['amount']:,.2f}")
+
+
+def budget_categories_section():
+    st.subheader("📊 Budget Categories (Planned Allocations)")
+    with st.form("budget_cat_form"):
+        cat = st.text_input("Category name")
+        amt = st.number_input("Amount", min_value=0.0, format="%f")
+        color = st.color_picker("Color tag", value="#b3e5fc")
+        add = st.form_submit_button("➕ Add Category")
+        if add and cat and amt:
+            store.add("budget", {"id": str(uuid.uuid4()), "category": cat, "amount": float(amt), "color": color}, section="budgets")
+            st.success(f"Added category: {cat} — ₦{amt:,.2f}")
+
+    if st.session_state.budget_store.get("budgets"):
+        for b in st.session_state.budget_store["budgets"]:
+            st.markdown(f"- {b['category']} — ₦{b['amount']:,.2f}")
+
+
+def expense_section():
+    st.subheader("📉 Log Expense")
+    with st.form("expense_form"):
+        name = st.text_input("Expense name")
+        amt = st.number_input("Amount", min_value=0.0, format="%f")
+        color = st.color_picker("Color tag", value="#ffccbc")
+        submit = st.form_submit_button("➕ Add Expense")
+        if submit and name and amt:
+            store.add("budget", {"id": str(uuid.uuid4()), "expense": name, "amount": float(amt), "color": color, "date": datetime.date.today().isoformat()}, section="expenses")
+            st.success(f"Logged expense: {name} — ₦{amt:,.2f}")
+    components.bulk_transfer("expenses")
+
+
+@components.fragment
+def streak_section():
+    # nothing else on the page reads the streak, so logging a day stays inside the fragment
+    st.subheader("🔥 Expense Logging Streak")
+    if st.button("✅ I logged expenses today"):
+        if store.log_streak_day(datetime.date.today()):
+            st.success("Nice! Today added to your streak 🔥")
+        else:
+            st.info("You already logged today 👏")
+    tracker = store.streak_tracker()
+    s1, s2 = st.columns(2)
+    s1.metric("🔥 Current Streak", f"{tracker.current} day(s)")
+    s2.metric("🏆 Longest Streak", f"{tracker.longest} day(s)")
+    if tracker.month_counts:
+        st.markdown("**📆 Days logged per month**")
+        months = sorted(tracker.month_counts)[-12:]
+        st.bar_chart({m: tracker.month_counts[m] for m in months})
+
+
+def summary_section():
+    st.subheader("📋 Financial Summary")
+    totals = store.budget_aggregates()["totals"]
+    total_income = totals["incomes"]
+    total_exp = totals["expenses"]
+    total_budgeted = totals["budgets"]
+    net = total_income - total_exp
+
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("💰 Total Income", f"₦{total_income:,.2f}")
+    c2.metric("📉 Total Expenses", f"₦{total_exp:,.2f}")
+    c3.metric("📊 Budgeted", f"₦{total_budgeted:,.2f}")
+    c4.metric("💼 Net Balance", f"₦{net:,.2f}")
+
+    st.markdown("### 🥧 Expense Breakdown")
+    if not charts.expense_snapshot((5, 4)):
+        st.info("No expenses yet — add some to see a breakdown.")
+
+
+@components.fragment
+def budget_sheet():
+    # the summary tab reads what the three forms write, so the forms and the
+    # summary share one fragment and a submit reruns only the tabs
+    tabs = st.tabs(["💵 Log Income", "📊 Budget Categories", "📉 Log Expenses", "📋 Summary Sheet"])
+
+    # --- income
+    with tabs[0]:
+        income_section()
+
+    # --- budgets (planned)
+    with tabs[1]:
+        budget_categories_section()
+
+    # --- expenses (actual)
+    with tabs[2]:
+        expense_section()
+        st.markdown("---")
+        streak_section()
+
+    # --- summary
+    with tabs[3]:
+        summary_section()
+
+
+def render():
+    st.title("💰 Budget Tracker")
+    budget_sheet()
@@ -0,0 +1,31 @@
+# StudyBot: answers from the user's own data and offline study tips (studybot.py).
+import datetime
+
+import streamlit as st
+
+import components
+import store
+import studybot
+
+
+@components.fragment
+def studybot_box():
+    q = st.text_input("Ask StudyBot:", placeholder="e.g. what's due this week? how much did I spend on food?")
+    if q:
+        username = st.session_state.get("current_user", "Daniella")
+        reply = studybot.answer(
+            q,
+            datetime.datetime.now(),
+            store.assignment_index(),
+            store.budget_aggregates(),
+            store.timetable_index(),
+            related=lambda word: store.search_all(word, username, limit=5),
+        )
+        st.markdown("**StudyBot says:**")
+        st.markdown(reply)
+
+
+def render():
+    st.title("🤖 StudyBot")
+    st.info("Ask about your deadlines, spending and classes, or for study tips — everything is answered offline on this device.")
+    studybot_box()
@@ -1,8 +1,32 @@
-import streamlit as st
+# Home: quick glance metrics, next class, picks and the budget snapshot.
 import datetime
 
+import streamlit as st
+
+import budget_agg
+import cards
+import charts
+import components
+import store
+import timetable
+
+
+KIND_ICONS = {"event": "🎫", "assignment": "📝", "class": "📘", "task": "📌"}
+
+
+@components.fragment
+def search_box():
+    query = st.text_input("🔎 Search events, assignments, classes and your tasks", placeholder="e.g. calculus, library, Dr Ada")
+    if query:
+        hits = store.search_all(query, st.session_state.get("current_user", "Daniella"))
+        if hits:
+            st.markdown("\n".join(
+                f"- {KIND_ICONS[kind]} **{title}** — {detail}" for _, (kind, _, title, detail) in hits))
+        else:
+            st.info("Nothing matches that search.")
+
 
-def home_page():
+def render():
     st.markdown("""
     <div class="title-container">
         <h1>🌤️ Welcome back, Daniella!</h1>
@@ -10,50 +34,43 @@ def home_page():
     </div>
     """, unsafe_allow_html=True)
 
+    search_box()
+
     st.markdown('<div class="card">', unsafe_allow_html=True)
     st.markdown("#### Quick glance at your week")
     col1, col2, col3 = st.columns(3)
-
     with col1:
-        total_income = sum(i["amount"] for i in st.session_state.budget_store.get("incomes", []))
-        total_expenses = sum(e["amount"] for e in st.session_state.budget_store.get("expenses", []))
-        st.metric("💸 Balance", f"₦{total_income - total_expenses:,.2f}")
-
+        st.metric("💸 Balance", f"₦{budget_agg.balance(store.budget_aggregates()):,.2f}")
     with col2:
-        due_assignments = [a for a in st.session_state.assignments if a.get("status") != "Done"]
-        st.metric("📚 Assignments Pending", str(len(due_assignments)))
-
+        st.metric("📚 Assignments Pending", str(store.count_pending_assignments()))
     with col3:
-        upcoming = [e for e in st.session_state.all_events if datetime.date.fromisoformat(e["date"]) >= datetime.date.today()]
-        st.metric("🎉 Upcoming Events", str(len(upcoming)))
-
+        st.metric("🎉 Upcoming Events", str(store.count_upcoming_events(datetime.date.today())))
     st.markdown('</div>', unsafe_allow_html=True)
 
+    index = store.timetable_index()
+    now = datetime.datetime.now()
+    upcoming_class = index.next_class(now)
+    if upcoming_class:
+        when, entry = upcoming_class
+        label = "Today" if when == now.date() else when.strftime("%A")
+        st.markdown(f"**⏰ Next class:** {entry['course']} — {label}, {entry['time']}")
+    today_name = timetable.WEEKDAYS[now.weekday()]
+    if today_name in timetable.DAYS:
+        slots = index.free_slots(today_name)
+        if slots:
+            st.markdown("**🕊️ Free today:** " + ", ".join(
+                f"{timetable.minutes_to_label(a)}–{timetable.minutes_to_label(b)}" for a, b in slots))
+
     st.markdown("---")
     st.subheader("✨ Daniella’s Picks")
     picks = [e for e in st.session_state.all_events if e.get("user_pick")]
     if not picks:
         st.info("You don't have any picks yet — go to Activities to spotlight your faves!")
     else:
-        for e in picks[:4]:
-            days_left = (datetime.date.fromisoformat(e["date"]) - datetime.date.today()).days
-            st.markdown(f"""
-                <div class="card">
-                    <h4>{e['title']} <span style='color:gold'>★</span></h4>
-                    <p><b>Date:</b> {e['date']} | <b>Time:</b> {e['time']}<br>
-                    <b>Type:</b> {e['type']} | <b>Location:</b> {e['location']}<br>
-                    <small>⏳ {days_left} day(s) to go</small></p>
-                </div>
-            """, unsafe_allow_html=True)
+        today = datetime.date.today()
+        st.markdown("\n".join(cards.pick_card(e, today) for e in picks[:4]), unsafe_allow_html=True)
 
     st.markdown("---")
     st.subheader("📊 Quick Budget Snapshot")
-    if st.session_state.budget_store.get("expenses"):
-        labels = [e["expense"] for e in st.session_state.budget_store["expenses"]]
-        sizes = [e["amount"] for e in st.session_state.budget_store["expenses"]]
-        fig, ax = plt.subplots(figsize=(5, 3))
-        ax.pie(sizes, labels=labels, autopct="%1.1f%%", startangle=90)
-        ax.axis("equal")
-        st.pyplot(fig)
-    else:
+    if not charts.expense_snapshot((5, 3)):
         st.info("Add expenses in Budget Tracker to see a visual snapshot here.")
@@ -0,0 +1,139 @@
+# Timetable: weekly classes and class assignments.
+import datetime
+import uuid
+
+import streamlit as st
+
+import assignments
+import cards
+import components
+import store
+import timetable
+from config import CLASS_MINUTES
+
+
+def class_form():
+    with st.form("add_class_form"):
+        col1, col2 = st.columns(2)
+        with col1:
+            day = st.selectbox("Day", timetable.DAYS)
+            time = st.time_input("Class Time")
+            duration = st.number_input("Duration (minutes)", min_value=15, max_value=300, value=CLASS_MINUTES, step=15)
+            color = st.color_picker("Class Color", value="#b3e5fc")
+        with col2:
+            course = st.text_input("Course Name")
+            lecturer = st.text_input("Lecturer")
+            notes = st.text_area("Notes / Location")
+        reminder = st.checkbox("Set Reminder (simulated)")
+        allow_clash = st.checkbox("Add even if it overlaps another class")
+        submit = st.form_submit_button("➕ Add Class")
+        start_min = time.hour * 60 + time.minute
+        clashes = store.timetable_index().clashes(day, start_min, start_min + int(duration)) if submit and course else []
+        if clashes:
+            st.warning("⚠️ Overlaps with " + ", ".join(f"{c['course']} ({c['time']})" for c in clashes))
+        if submit and course and (allow_clash or not clashes):
+            store.add_class({
+                "id": str(uuid.uuid4()),
+                "day": day,
+                "time": time.strftime("%I:%M %p"),
+                "start_min": start_min,
+                "duration_min": int(duration),
+                "course": course,
+                "lecturer": lecturer,
+                "notes": notes,
+                "color": color,
+                "reminder": reminder
+            })
+            st.success(f"{course} added!")
+    components.bulk_transfer("classes")
+
+
+@components.fragment
+def weekly_timetable():
+    if st.session_state.timetable_entries:
+        for d in timetable.DAYS:
+            entries = store.timetable_for_day(d)
+            if entries:
+                st.markdown(f"#### {d}")
+                components.card_list(entries, cards.class_card, key=f"classes_{d}")
+    else:
+        st.info("No classes yet — add one above!")
+
+
+def assignment_form():
+    class_choices = [e["course"] for e in st.session_state.timetable_entries] or ["General"]
+    with st.form("assignment_form"):
+        selected_course = st.selectbox("Select Course", class_choices)
+        title = st.text_input("Assignment Title")
+        status = st.selectbox("Status", assignments.STATUSES)
+        due_date = st.date_input("Due Date", value=datetime.date.today())
+        notes = st.text_area("Notes")
+        add = st.form_submit_button("➕ Log Assignment")
+        if add and title:
+            store.add_assignment({
+                "id": str(uuid.uuid4()),
+                "course": selected_course,
+                "title": title,
+                "status": status,
+                "due_date": due_date.isoformat(),
+                "notes": notes
+            })
+            st.success(f"Assignment '{title}' added for {selected_course}!")
+
+
+@components.fragment
+def assignment_list():
+    overdue_count = len(store.overdue_assignments(datetime.date.today()))
+    if overdue_count:
+        st.error(f"🚨 {overdue_count} overdue assignment(s)")
+    status_filter = st.selectbox("Filter by Status", ["All"] + assignments.STATUSES)
+    upcoming_only = st.checkbox("Show only due in next 7 days")
+    today = datetime.date.today()
+    matches = store.filter_assignments(
+        status=None if status_filter == "All" else status_filter,
+        due_from=today if upcoming_only else None,
+        due_to=today + datetime.timedelta(days=7) if upcoming_only else None,
+    )
+    # finished work that is already past due is collapsed unless asked for
+    today_iso = today.isoformat()
+    finished = [a for a in matches if a["status"] == "Done" and a["due_date"] < today_iso]
+    current = [a for a in matches if not (a["status"] == "Done" and a["due_date"] < today_iso)]
+    if matches:
+        components.card_list(current, lambda a: cards.assignment_card(a, today), key="assignments")
+        components.collapsed_list(finished, lambda a: cards.assignment_card(a, today), key="assignments_done", label="Show finished assignments")
+    else:
+        st.info("No assignments match the filters.")
+
+
+@components.fragment
+def assignments_section():
+    # a new assignment shows up in the list below without rerunning the timetable
+    assignment_form()
+
+    # assignment filters
+    st.subheader("Your Assignments")
+    assignment_list()
+
+
+@components.fragment
+def classes_section():
+    # the weekly view and the assignment form's course list read the classes,
+    # so a new class reruns them with the form and nothing outside this fragment
+    class_form()
+
+    # display timetable grouped by day
+    st.subheader("Weekly Timetable")
+    weekly_timetable()
+
+    # assignments
+    st.markdown("---")
+    st.subheader("📚 Class Assignments")
+    assignments_section()
+
+
+def render():
+    st.title("📅 Timetable & Assignments")
+    st.markdown("Add classes, color-code them, and track assignments.")
+
+    # add class form
+    classes_section()
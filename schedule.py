@@ -0,0 +1,109 @@
+import datetime
+from bisect import bisect_left, bisect_right, insort
+
+
+def _iso(date):
+    return date.isoformat() if isinstance(date, datetime.date) else date
+
+
+class IntervalIndex:
+    """Intervals kept sorted by start, for clash checks at insert time.
+
+    Tracking the longest interval bounds where an overlapping one can start, so
+    `overlapping()` only looks at starts in [start - longest, end): two bisects
+    plus the candidates in that window rather than a pass over every interval.
+    """
+
+    def __init__(self):
+        self._items = []  # (start, seq, end, item)
+        self._longest = 0
+        self._seq = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        for start, _, end, item in self._items:
+            yield start, end, item
+
+    def add(self, start, end, item):
+        # seq keeps insertion order among intervals starting at the same minute
+        self._seq += 1
+        insort(self._items, (start, self._seq, end, item))
+        self._longest = max(self._longest, end - start)
+
+    def overlapping(self, start, end):
+        lo = bisect_left(self._items, (start - self._longest,))
+        hi = bisect_left(self._items, (end,))
+        return [item for s, _, e, item in self._items[lo:hi] if e > start]
+
+    def first_from(self, minute):
+        """First interval starting at or after `minute` (None if there is none)."""
+        i = bisect_left(self._items, (minute,))
+        return self._items[i][3] if i < len(self._items) else None
+
+
+class DatedIndex:
+    """One IntervalIndex per ISO date, for events and personal tasks.
+
+    `span(record)` gives a record's (start, end) in minutes since midnight.
+    The dates are also kept sorted, so a range of days is two bisects away.
+    """
+
+    def __init__(self, span, records=()):
+        self.span = span
+        self.by_date = {}
+        self.dates = []
+        for record in records:
+            self.add(record)
+
+    def add(self, record):
+        start, end = self.span(record)
+        day = self.by_date.get(record["date"])
+        if day is None:
+            day = self.by_date[record["date"]] = IntervalIndex()
+            insort(self.dates, record["date"])
+        day.add(start, end, record)
+
+    def on(self, date):
+        return self.by_date.get(_iso(date), IntervalIndex())
+
+    def between(self, first, last):
+        """Records dated first..last (inclusive), by date and start time."""
+        lo = bisect_left(self.dates, _iso(first))
+        hi = bisect_right(self.dates, _iso(last))
+        return [item for date in self.dates[lo:hi] for _, _, item in self.by_date[date]]
+
+    def overlapping(self, date, start, end):
+        return self.on(date).overlapping(start, end)
+
+
+def merge_busy(intervals):
+    """Sort and merge (start, end) pairs into disjoint busy blocks."""
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def free_windows(busy, start, end, min_length=30):
+    """Gaps of at least `min_length` minutes in [start, end) not covered by `busy`."""
+    windows = []
+    cursor = start
+    for b_start, b_end in merge_busy(busy):
+        if b_start >= end:
+            break
+        if b_start - cursor >= min_length:
+            windows.append((cursor, b_start))
+        cursor = max(cursor, b_end)
+    if end - cursor >= min_length:
+        windows.append((cursor, end))
+    return windows
+
+
+def common_free_windows(busy_by_user, start, end, min_length=30):
+    """Windows where everyone in `busy_by_user` ({user: [(start, end), ...]}) is free."""
+    return free_windows([iv for busy in busy_by_user.values() for iv in busy], start, end, min_length)
@@ -0,0 +1,328 @@
+# Full-text search over events, assignments, classes and personal tasks.
+#
+# SearchIndex is an inverted index: each token maps to the ids of the documents
+# containing it (an array kept sorted because ids only grow) plus a parallel
+# array of field weights. A sorted vocabulary gives prefix expansion by
+# bisection, so "calc" also finds "calculus" (for the last query term, the one
+# still being typed). Results are ranked by the sum of idf(token) x field
+# weight over the query terms, every term being required.
+#
+# An edited or removed record leaves a dead document behind in the postings
+# (it never matches again); once dead documents are over a quarter of the
+# index, the postings are rebuilt without them. The index is saved as JSON,
+# its arrays base64-encoded, never pickled.
+import base64
+import heapq
+import math
+import re
+import sys
+import threading
+import zlib
+from array import array
+from bisect import bisect_left, insort
+
+import serialization
+from utils import atomic_write
+
+FORMAT = 2  # bump when the saved layout changes; older files are rebuilt
+
+_WORD = re.compile(r"\w+")
+STOPWORDS = frozenset("a an and at by for in is of on or the to with".split())
+
+# kind -> ((field, weight), ...) indexed for each record of that kind
+FIELDS = {
+    "event": (("title", 3), ("location", 2), ("description", 1)),
+    "assignment": (("title", 3), ("course", 2), ("notes", 1)),
+    "class": (("course", 3), ("lecturer", 2), ("notes", 1)),
+    "task": (("title", 3), ("description", 1)),
+}
+
+PREFIX_MIN = 2  # shorter terms only match whole tokens
+MAX_EXPANSIONS = 16  # most frequent vocabulary words a prefix expands to
+MAX_CANDIDATES = 2000  # very broad queries are ranked among their newest matches only
+PREFIX_FACTOR = 0.5  # a prefix match scores half of a whole-token match
+COMPACT_RATIO = 4  # postings are rebuilt once more than 1 in COMPACT_RATIO documents is dead
+COMPACT_MIN = 64  # ... and there are at least this many
+
+
+def tokenize(text):
+    return [t for t in _WORD.findall(str(text).casefold()) if t not in STOPWORDS]
+
+
+def describe(kind, record):
+    """(title, detail) shown for a search hit."""
+    if kind == "event":
+        return record.get("title", ""), f"{record.get('date', '')} · {record.get('location', '')}"
+    if kind == "assignment":
+        return record.get("title", ""), f"{record.get('course', '')} · due {record.get('due_date', '')}"
+    if kind == "class":
+        return record.get("course", ""), f"{record.get('day', '')} {record.get('time', '')} · {record.get('lecturer', '')}"
+    return record.get("title", ""), f"{record.get('date', '')} {record.get('time', '')}"
+
+
+def fingerprint(kind, record):
+    """Checksum of what a record's document is built from, to tell an edited record from an unchanged one."""
+    parts = [str(record.get(field) or "") for field, _ in FIELDS[kind]]
+    parts.extend(describe(kind, record))
+    return zlib.crc32("\x1f".join(parts).encode())
+
+
+class SearchIndex:
+    """Inverted index with incremental adds; documents are (kind, id, title, detail)."""
+
+    def __init__(self):
+        self.docs = []  # doc id -> (kind, record id, title, detail), None once replaced or removed
+        self.hashes = array("I")  # doc id -> fingerprint() of its record
+        self.doc_of = {}  # (kind, record id) -> doc id
+        self.postings = {}  # token -> (array of doc ids, array of weights)
+        self.vocab = []  # sorted tokens, for prefix expansion
+        self.live = 0  # documents not replaced
+        self.sources = {}  # source name -> marker of what has been indexed from it
+        self.members = {}  # source name -> (kind, set of record ids indexed from it)
+        self.changed = False  # not yet persisted
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self.live
+
+    def _add(self, kind, record, new_tokens, source=None, fp=None):
+        key = (kind, record.get("id"))
+        self._drop(key)
+        if source is not None:
+            self.members.setdefault(source, (kind, set()))[1].add(key[1])
+        doc = len(self.docs)
+        self.docs.append((kind, key[1]) + describe(kind, record))
+        self.hashes.append(fingerprint(kind, record) if fp is None else fp)
+        self.doc_of[key] = doc
+        self.live += 1
+        weights = {}
+        for field, weight in FIELDS[kind]:
+            for token in tokenize(record.get(field) or ""):
+                weights[token] = weights.get(token, 0) + weight
+        for token, weight in weights.items():
+            entry = self.postings.get(token)
+            if entry is None:
+                entry = self.postings[token] = (array("I"), array("B"))
+                new_tokens.append(token)
+            entry[0].append(doc)
+            entry[1].append(min(weight, 255))
+        self.changed = True
+
+    def _drop(self, key):
+        # the document stays in the postings, dead, until the next _compact()
+        doc = self.doc_of.pop(key, None)
+        if doc is not None:
+            self.docs[doc] = None
+            self.live -= 1
+            self.changed = True
+
+    def _claimed(self, kind, record_id):
+        # archived events come from a month file after leaving events.json
+        return any(k == kind and record_id in ids for k, ids in self.members.values())
+
+    def _finish(self, new_tokens):
+        dead = len(self.docs) - self.live
+        if dead >= COMPACT_MIN and dead * COMPACT_RATIO > len(self.docs):
+            self._compact()
+        elif len(new_tokens) > 64:
+            self.vocab = sorted(self.postings)
+        else:
+            for token in new_tokens:
+                insort(self.vocab, token)
+
+    def _compact(self):
+        """Renumber the live documents and rebuild the postings without the dead ones."""
+        renumber = array("l", [-1]) * len(self.docs)
+        docs, hashes = [], array("I")
+        for doc, info in enumerate(self.docs):
+            if info is not None:
+                renumber[doc] = len(docs)
+                docs.append(info)
+                hashes.append(self.hashes[doc])
+        postings = {}
+        for token, (ids, weights) in self.postings.items():
+            kept = [(renumber[doc], weight) for doc, weight in zip(ids, weights) if renumber[doc] >= 0]
+            if kept:
+                postings[token] = (array("I", (doc for doc, _ in kept)), array("B", (weight for _, weight in kept)))
+        self.docs, self.hashes, self.postings = docs, hashes, postings
+        self.doc_of = {(info[0], info[1]): doc for doc, info in enumerate(docs)}
+        self.vocab = sorted(postings)
+
+    def add(self, kind, record, source=None):
+        """Index `record`, replacing the document of an earlier version of it."""
+        with self._lock:
+            new_tokens = []
+            self._add(kind, record, new_tokens, source)
+            self._finish(new_tokens)
+
+    def add_many(self, kind, records, source=None):
+        """Index the records not indexed yet; returns how many were added."""
+        with self._lock:
+            new_tokens = []
+            added = 0
+            for record in records:
+                if (kind, record.get("id")) not in self.doc_of:
+                    self._add(kind, record, new_tokens, source)
+                    added += 1
+                elif source is not None:
+                    self.members.setdefault(source, (kind, set()))[1].add(record.get("id"))
+            self._finish(new_tokens)
+            return added
+
+    def remove(self, kind, record_id, source=None):
+        """Stop matching a deleted record (unless another source still holds it)."""
+        with self._lock:
+            if source in self.members:
+                self.members[source][1].discard(record_id)
+            if not self._claimed(kind, record_id):
+                self._drop((kind, record_id))
+                self._finish([])
+
+    def sync(self, source, kind, records):
+        """Make what is indexed from `source` match `records`: new and edited records are
+        (re)indexed, records that are gone are dropped. Returns how many documents changed."""
+        with self._lock:
+            new_tokens = []
+            changed = 0
+            _, before = self.members.get(source, (kind, set()))
+            ids = set()
+            self.members[source] = (kind, ids)
+            for record in records:
+                record_id = record.get("id")
+                ids.add(record_id)
+                doc = self.doc_of.get((kind, record_id))
+                fp = fingerprint(kind, record)
+                if doc is None or self.hashes[doc] != fp:
+                    self._add(kind, record, new_tokens, fp=fp)
+                    changed += 1
+            for record_id in before - ids:
+                if not self._claimed(kind, record_id):
+                    self._drop((kind, record_id))
+                    changed += 1
+            self._finish(new_tokens)
+            return changed
+
+    def _expand(self, term, prefix):
+        """[(postings, factor)] for the vocabulary words `term` matches."""
+        exact = self.postings.get(term)
+        matches = [(exact, 1.0)] if exact is not None else []
+        if prefix and len(term) >= PREFIX_MIN:
+            lo = bisect_left(self.vocab, term)
+            hi = bisect_left(self.vocab, term + "\uffff", lo)
+            words = [w for w in self.vocab[lo:hi] if w != term]
+            if len(words) > MAX_EXPANSIONS:
+                words = heapq.nlargest(MAX_EXPANSIONS, words, key=lambda w: len(self.postings[w][0]))
+            matches.extend((self.postings[w], PREFIX_FACTOR) for w in words)
+        return matches
+
+    def search(self, query, limit=20, kinds=None):
+        """[(score, (kind, id, title, detail))] best first."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+        with self._lock:
+            total = max(self.live, 1)
+            expanded = []
+            for i, term in enumerate(terms):
+                matches = self._expand(term, prefix=i == len(terms) - 1)
+                if not matches:
+                    return []
+                expanded.append([(p, factor * math.log(1 + total / len(p[0]))) for p, factor in matches])
+            # start from the rarest term, so the candidate set is as small as it gets
+            expanded.sort(key=lambda matches: sum(len(p[0]) for p, _ in matches))
+            scores = {}
+            budget = MAX_CANDIDATES
+            for (docs, weights), idf in expanded[0]:
+                take = min(budget, len(docs))
+                for doc, weight in zip(docs[len(docs) - take:], weights[len(docs) - take:]):
+                    score = idf * weight
+                    if score > scores.get(doc, 0):
+                        scores[doc] = score
+                budget -= take
+                if not budget:
+                    break
+            for matches in expanded[1:]:
+                if not scores:
+                    return []
+                scores = self._intersect(scores, matches)
+            hits = []
+            for doc, score in scores.items():
+                info = self.docs[doc]
+                if info is not None and (kinds is None or info[0] in kinds):
+                    hits.append((score, doc, info))
+        return [(score, info) for score, _, info in heapq.nlargest(limit, hits, key=lambda h: (h[0], h[1]))]
+
+    @staticmethod
+    def _intersect(scores, matches):
+        best = {}
+        first = min(scores)
+        for (docs, weights), idf in matches:
+            lo = bisect_left(docs, first)
+            if len(docs) - lo <= 4 * len(scores):
+                # walk the part of the posting list that can hold a candidate
+                for i in range(lo, len(docs)):
+                    doc = docs[i]
+                    if doc in scores and idf * weights[i] > best.get(doc, 0):
+                        best[doc] = idf * weights[i]
+            else:
+                # long posting list: look each candidate up by bisection instead
+                for doc in scores:
+                    i = bisect_left(docs, doc, lo)
+                    if i < len(docs) and docs[i] == doc and idf * weights[i] > best.get(doc, 0):
+                        best[doc] = idf * weights[i]
+        return {doc: score + best[doc] for doc, score in scores.items() if doc in best}
+
+
+def merge(limit, *results):
+    """Combine several indexes' search() results into one ranking."""
+    return heapq.nlargest(limit, (hit for hits in results for hit in hits), key=lambda h: h[0])
+
+
+def _b64(values):
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return base64.b64encode(values.tobytes()).decode()
+
+
+def _unb64(typecode, text):
+    values = array(typecode, base64.b64decode(text))
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def load(path):
+    """The index saved at `path`, or None if it is missing, unreadable or an older format."""
+    try:
+        with open(path, "rb") as f:
+            state = serialization.parse(f.read())
+        if state.get("format") != FORMAT:
+            return None
+        index = SearchIndex()
+        index.docs = [tuple(info) if info is not None else None for info in state["docs"]]
+        index.hashes = _unb64("I", state["hashes"])
+        index.postings = {token: (_unb64("I", ids), _unb64("B", weights)) for token, (ids, weights) in state["postings"].items()}
+        index.sources = state["sources"]
+        index.members = {source: (kind, set(ids)) for source, (kind, ids) in state["members"].items()}
+    except (OSError, ValueError, KeyError, TypeError, AttributeError, EOFError, zlib.error):
+        return None
+    index.doc_of = {(info[0], info[1]): doc for doc, info in enumerate(index.docs) if info is not None}
+    index.live = len(index.doc_of)
+    index.vocab = sorted(index.postings)
+    return index
+
+
+def save(path, index):
+    with index._lock:
+        payload = serialization.codec.dumps({
+            "format": FORMAT,
+            "docs": index.docs,
+            "hashes": _b64(index.hashes),
+            "postings": {token: [_b64(ids), _b64(weights)] for token, (ids, weights) in index.postings.items()},
+            "sources": index.sources,
+            "members": {source: [kind, sorted(ids, key=str)] for source, (kind, ids) in index.members.items()},
+        })
+        index.changed = False
+    with atomic_write(path, ".index") as f:
+        f.write(payload)
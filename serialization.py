@@ -0,0 +1,115 @@
+# Encoders behind utils.save_data / load_data. The fastest one installed is
+# used (orjson, else the standard library); both write the same JSON (NaN and
+# Infinity, which JSON has no literal for, become null with either), so a
+# file saved by one loads with the other. Lists (a store, or a section of the
+# budget) are encoded a batch of records at a time and written as they go,
+# so a save never holds a second full copy of the data as text. Files may be
+# gzip-compressed: parse() recognises them by their magic bytes.
+import gzip
+import json
+
+import models
+from config import DATA_CODEC, GZIP_LEVEL
+
+try:
+    import orjson
+except ImportError:  # optional: the standard library encoder is used instead
+    orjson = None
+
+GZIP_MAGIC = b"\x1f\x8b"
+BATCH_RECORDS = 1000
+
+
+class JsonCodec:
+    """The standard library's json module (its C encoder, one batch at a time)."""
+
+    name = "json"
+
+    def __init__(self):
+        options = {"default": models.to_json, "ensure_ascii": False, "separators": (",", ":")}
+        self._encode = json.JSONEncoder(allow_nan=False, **options).encode
+        self._encode_nan = json.JSONEncoder(**options).encode
+
+    def dumps(self, obj):
+        try:
+            return self._encode(obj).encode()
+        except ValueError:
+            # NaN / Infinity: null, as orjson writes them (rare, so the slow way round)
+            return self._encode(json.loads(self._encode_nan(obj), parse_constant=lambda name: None)).encode()
+
+    def loads(self, raw):
+        return json.loads(raw)
+
+
+class OrjsonCodec:
+    """orjson: several times faster both ways; dates, datetimes and non-str keys come out as with json."""
+
+    name = "orjson"
+
+    def __init__(self):
+        self._options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+    def dumps(self, obj):
+        return orjson.dumps(obj, default=models.to_json, option=self._options)
+
+    def loads(self, raw):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # NaN / Infinity, which json writes and orjson refuses to read
+            return json.loads(raw)
+
+
+def make_codec(kind):
+    if kind == "auto":
+        kind = "json" if orjson is None else "orjson"
+    if kind == "json":
+        return JsonCodec()
+    if kind == "orjson":
+        if orjson is None:
+            raise ValueError("CAMPUS_DATA_CODEC=orjson but orjson is not installed")
+        return OrjsonCodec()
+    raise ValueError(f"Unknown data codec: {kind!r}")
+
+
+codec = make_codec(DATA_CODEC)
+
+
+def chunks(data, codec=codec):
+    """`data` as JSON, in pieces of at most BATCH_RECORDS list items."""
+    if isinstance(data, list):
+        yield b"["
+        for start in range(0, len(data), BATCH_RECORDS):
+            if start:
+                yield b","
+            yield codec.dumps(data[start:start + BATCH_RECORDS])[1:-1]
+        yield b"]"
+    elif isinstance(data, dict) and all(isinstance(key, str) for key in data):
+        # one level down: the budget's sections
+        yield b"{"
+        for i, (key, value) in enumerate(data.items()):
+            yield (b"," if i else b"") + codec.dumps(key) + b":"
+            if isinstance(value, list):
+                yield from chunks(value, codec)
+            else:
+                yield codec.dumps(value)
+        yield b"}"
+    else:
+        yield codec.dumps(data)
+
+
+def write(f, data, compress=False, codec=codec):
+    """Stream `data` into the binary file `f`, gzip-compressed if asked."""
+    if compress:
+        # mtime=0: the same data always gives the same bytes
+        with gzip.GzipFile(fileobj=f, mode="wb", compresslevel=GZIP_LEVEL, mtime=0) as z:
+            z.writelines(chunks(data, codec))
+    else:
+        f.writelines(chunks(data, codec))
+
+
+def parse(raw, codec=codec):
+    """The data in `raw`, the bytes of a file written by write()."""
+    if raw[:2] == GZIP_MAGIC:
+        raw = gzip.decompress(raw)
+    return codec.loads(raw)
@@ -0,0 +1,274 @@
+import json
+import os
+import sqlite3
+import sys
+import threading
+import uuid
+from collections.abc import Mapping, Sequence
+
+import models
+from timetable import start_of
+
+# every store keeps its records as JSON in `data`, next to the columns its pages filter on
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT, id TEXT UNIQUE, date TEXT, data TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS idx_events_date ON events (date);
+
+CREATE TABLE IF NOT EXISTS assignments (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT, id TEXT UNIQUE, status TEXT, due_date TEXT, data TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS idx_assignments_status_due ON assignments (status, due_date);
+
+CREATE TABLE IF NOT EXISTS timetable (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT, id TEXT UNIQUE, day TEXT, start_min INTEGER, data TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS idx_timetable_day_time ON timetable (day, start_min);
+
+CREATE TABLE IF NOT EXISTS budget (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT, id TEXT UNIQUE, section TEXT, data TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS idx_budget_section ON budget (section);
+
+CREATE TABLE IF NOT EXISTS streaks (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT, id TEXT UNIQUE, data TEXT NOT NULL);
+
+-- a new random version per table on every write that changes it: the table's signature
+CREATE TABLE IF NOT EXISTS versions (name TEXT PRIMARY KEY, version TEXT NOT NULL);
+"""
+
+# indexed columns per table, filled from each record by _columns()
+COLUMNS = {
+    "events": ("date",),
+    "assignments": ("status", "due_date"),
+    "timetable": ("day", "start_min"),
+    "budget": ("section",),
+    "streaks": (),
+}
+
+
+def _columns(table, record, section):
+    if table == "budget":
+        return (section,)
+    if table == "timetable":
+        return (record.get("day"), start_of(record))
+    return tuple(record.get(c) for c in COLUMNS[table])
+
+
+def _record_id(record):
+    return record.get("id") if isinstance(record, Mapping) else record
+
+
+def _version(conn, table):
+    row = conn.execute("SELECT version FROM versions WHERE name = ?", (table,)).fetchone()
+    return row[0] if row else None
+
+
+def _bump(conn, table):
+    version = uuid.uuid4().hex
+    conn.execute("INSERT OR REPLACE INTO versions (name, version) VALUES (?, ?)", (table, version))
+    return version
+
+
+class _Rows(Sequence):
+    """Records matching one events query, counted once and fetched a slice at a time (LIMIT / OFFSET).
+
+    Card lists only take len() and the slice they show, so a page render
+    decodes one page of records however many match.
+    """
+
+    def __init__(self, backend, where, args, order):
+        self._backend = backend
+        self._where, self._args, self._order = where, args, order
+        self._len = None
+
+    def _select(self, limit=-1, offset=0):
+        rows = self._backend._conn().execute(
+            f"SELECT data FROM events WHERE {self._where} ORDER BY {self._order} LIMIT ? OFFSET ?",
+            self._args + (limit, offset),
+        )
+        return [json.loads(raw) for (raw,) in rows]
+
+    def __len__(self):
+        if self._len is None:
+            sql = f"SELECT COUNT(*) FROM events WHERE {self._where}"
+            self._len = self._backend._conn().execute(sql, self._args).fetchone()[0]
+        return self._len
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, step = i.indices(len(self))
+            rows = self._select(max(stop - start, 0), start)
+            return rows if step == 1 else rows[::step]
+        if i < 0:
+            i += len(self)
+        rows = self._select(1, i) if i >= 0 else []
+        if not rows:
+            raise IndexError(i)
+        return rows[0]
+
+    def __iter__(self):
+        return iter(self._select())
+
+
+class SqliteBackend:
+    """Local SQLite database (WAL mode) with one indexed table per store."""
+
+    incremental = True
+    indexed = True
+
+    def __init__(self, db_path, files):
+        self.db_path = db_path
+        self.tables = {path: name for name, path in files.items()}
+        self._local = threading.local()
+        self._conn().executescript(SCHEMA)
+
+    def _conn(self):
+        # Streamlit runs sessions on separate threads; sqlite connections can't be shared
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def signature(self, path):
+        # per table, so a write to one store leaves the other stores' cached copies valid
+        return _version(self._conn(), self.tables[path])
+
+    def load(self, path, default):
+        table = self.tables[path]
+        rows = self._conn().execute(
+            f"SELECT {'section, ' if table == 'budget' else ''}data FROM {table} ORDER BY seq"
+        )
+        if table == "budget":
+            data = {k: list(v) for k, v in default.items()}
+            for section, raw in rows:
+                data.setdefault(section, []).append(json.loads(raw))
+            return data
+        return [json.loads(raw) for (raw,) in rows]
+
+    def _insert(self, conn, table, record, section):
+        cols = COLUMNS[table]
+        names = ", ".join(("id",) + cols + ("data",))
+        marks = ", ".join("?" * (len(cols) + 2))
+        conn.execute(
+            f"INSERT OR REPLACE INTO {table} ({names}) VALUES ({marks})",
+            (_record_id(record),) + _columns(table, record, section) + (json.dumps(record, default=models.to_json),),
+        )
+
+    def save(self, path, data):
+        """Replace a whole table with `data` (used by the JSON migration)."""
+        table = self.tables[path]
+        with self._conn() as conn:
+            conn.execute(f"DELETE FROM {table}")
+            if table == "budget":
+                for section, records in data.items():
+                    for record in records:
+                        self._insert(conn, table, record, section)
+            else:
+                for record in data:
+                    self._insert(conn, table, record, None)
+            _bump(conn, table)
+
+    def _apply(self, conn, table, entry):
+        op = entry["op"]
+        if op == "add":
+            self._insert(conn, table, entry["record"], entry.get("section"))
+        elif op == "update":
+            row = conn.execute(f"SELECT data FROM {table} WHERE id = ?", (entry["id"],)).fetchone()
+            if row:
+                record = {**json.loads(row[0]), **entry["changes"]}
+                cols = COLUMNS[table]
+                sets = ", ".join(f"{c} = ?" for c in cols + ("data",))
+                conn.execute(
+                    f"UPDATE {table} SET {sets} WHERE id = ?",
+                    _columns(table, record, entry.get("section")) + (json.dumps(record, default=models.to_json), entry["id"]),
+                )
+        elif op == "delete":
+            conn.execute(f"DELETE FROM {table} WHERE id = ?", (entry["id"],))
+
+    def append(self, path, entry, default):
+        return self.append_many(path, [entry], default)
+
+    def append_many(self, path, entries, default):
+        """Apply several entries in one transaction; returns the table's version before and after it."""
+        table = self.tables[path]
+        with self._conn() as conn:
+            # take the write lock first, so no other writer commits between reading the version and bumping it
+            conn.execute("BEGIN IMMEDIATE")
+            before = _version(conn, table)
+            for entry in entries:
+                self._apply(conn, table, entry)
+            after = _bump(conn, table)
+        return before, after
+
+    def compact(self, path, default):
+        self._conn().execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    # ----------------------------
+    # Indexed page queries, dispatched to from the query helpers in store.py
+    # ----------------------------
+    def count_upcoming_events(self, today):
+        return self._conn().execute("SELECT COUNT(*) FROM events WHERE date >= ?", (today.isoformat(),)).fetchone()[0]
+
+    def upcoming_and_past_events(self, today):
+        day = (today.isoformat(),)
+        return _Rows(self, "date >= ?", day, "date, seq"), _Rows(self, "date < ?", day, "date DESC, seq DESC")
+
+    def count_pending_assignments(self):
+        total, done = self._conn().execute(
+            "SELECT (SELECT COUNT(*) FROM assignments), (SELECT COUNT(*) FROM assignments WHERE status = 'Done')"
+        ).fetchone()
+        return total - done
+
+    def filter_assignments(self, status=None, due_from=None, due_to=None):
+        where, args = [], []
+        if status is not None:
+            where.append("status = ?")
+            args.append(status)
+        if due_from is not None:
+            where.append("due_date >= ?")
+            args.append(due_from.isoformat())
+        if due_to is not None:
+            where.append("due_date <= ?")
+            args.append(due_to.isoformat())
+        sql = "SELECT data FROM assignments" + (" WHERE " + " AND ".join(where) if where else "") + " ORDER BY due_date, seq"
+        return [json.loads(raw) for (raw,) in self._conn().execute(sql, args)]
+
+    def overdue_assignments(self, today):
+        rows = self._conn().execute(
+            "SELECT data FROM assignments WHERE status != 'Done' AND due_date < ? ORDER BY due_date, seq",
+            (today.isoformat(),),
+        )
+        return [json.loads(raw) for (raw,) in rows]
+
+    def timetable_for_day(self, day):
+        rows = self._conn().execute("SELECT data FROM timetable WHERE day = ? ORDER BY start_min, seq", (day,))
+        return [json.loads(raw) for (raw,) in rows]
+
+
+def migrate_from_json(db_path, files):
+    """One-shot copy of the JSON stores (snapshot plus any journal, and archived events) into SQLite."""
+    import archive
+    from journal import JournalBackend
+    from store import STORES
+
+    source = JournalBackend(compact_bytes=float("inf"))
+    target = SqliteBackend(db_path, files)
+    counts = {}
+    for name, path in files.items():
+        data = source.load(path, STORES[name][1]())
+        if name == "events":
+            data = list(archive.load_all()) + data
+        target.save(path, data)
+        counts[name] = sum(len(v) for v in data.values()) if isinstance(data, dict) else len(data)
+    return counts
+
+
+if __name__ == "__main__":
+    # python sqlite_backend.py  ->  migrate data/*.json into config.SQLITE_PATH
+    from config import FILES, SQLITE_PATH
+
+    if os.path.exists(SQLITE_PATH) and "--force" not in sys.argv:
+        sys.exit(f"{SQLITE_PATH} already exists; pass --force to overwrite its tables")
+    for name, count in migrate_from_json(SQLITE_PATH, FILES).items():
+        print(f"{name}: {count} record(s)")
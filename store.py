@@ -0,0 +1,642 @@
+import bisect
+import datetime
+import itertools
+import os
+import threading
+import time
+from urllib.parse import quote, unquote
+
+import streamlit as st
+
+import archive
+import assignments
+import budget_agg
+import models
+import schedule
+import search
+import streaks
+import timetable
+from backends import JsonBackend, make_backend
+from config import (BUDGET_AGG_FILE, EVENT_MINUTES, FILES, PERSONAL_DIR, SEARCH_FILE, SEARCH_SAVE_SECONDS,
+                    STORAGE_BACKEND, TASK_MINUTES)
+from journal import JOURNAL_SUFFIX, apply_op, record_key
+from utils import DataFileError, file_signature, load_data, save_data, sig_marker
+
+# store name (key in FILES) -> (st.session_state key, default factory)
+STORES = {
+    "events": ("all_events", list),
+    "timetable": ("timetable_entries", list),
+    "assignments": ("assignments", list),
+    "streaks": ("streak_dates", list),
+    "budget": ("budget_store", lambda: {"incomes": [], "budgets": [], "expenses": []}),
+}
+
+# stores the json backend writes in another form than the app holds them:
+# (file data -> held data, held data -> file data). Ops always apply to the
+# held form, so a streak day can be deleted from the middle of an interval.
+NORMALIZERS = {
+    "streaks": (streaks.days, streaks.compact),
+}
+
+backend = make_backend(STORAGE_BACKEND)
+
+# ----------------------------
+# Process-wide cache: every session reads the same parsed copy of a store
+# until it mutates it (copy-on-write). Entries are keyed on path and
+# invalidated when the backend's files change under another writer. The
+# large stores are held as compact typed records (see models.py).
+# ----------------------------
+_shared = {}
+_shared_lock = threading.Lock()
+
+
+def _cached_entry(source, path, default, convert=None):
+    sig = source.signature(path)
+    with _shared_lock:
+        entry = _shared.get(path)
+        if entry is None or entry[0] != sig:
+            data = source.load(path, default())
+            entry = (sig, data if convert is None else convert(data))
+            _shared[path] = entry
+        return entry
+
+
+def _cached_load(source, path, default, convert=None):
+    return _cached_entry(source, path, default, convert)[1]
+
+
+def _shared_entry(name):
+    """(signature, data) of a store's shared copy."""
+    expand = NORMALIZERS[name][0] if name in NORMALIZERS else None
+    return _cached_entry(backend, FILES[name], STORES[name][1],
+                         lambda data: models.compact(name, data if expand is None else expand(data)))
+
+
+def _publish(path, sig, data):
+    # the session's copy now matches the file, so it becomes the shared copy
+    with _shared_lock:
+        _shared[path] = (sig, data)
+
+
+def shared_objects():
+    """The shared store copies and their records: per process, not per session (see metrics.observe_session)."""
+    with _shared_lock:
+        entries = [data for _, data in _shared.values()]
+    for data in entries:
+        yield data
+        for records in data.values() if isinstance(data, dict) else [data]:
+            if records is not data:
+                yield records
+            if isinstance(records, list):
+                yield from records
+
+
+def _copy(data):
+    if isinstance(data, dict):
+        return {k: list(v) if isinstance(v, list) else v for k, v in data.items()}
+    return list(data)
+
+
+def init_stores():
+    """Point session_state at the shared copy of every store this session hasn't modified."""
+    if "dirty_stores" not in st.session_state:
+        st.session_state.dirty_stores = set()
+    if "owned_stores" not in st.session_state:
+        st.session_state.owned_stores = set()
+    if "pending_ops" not in st.session_state:
+        # changes not yet written by the json backend, replayed onto the file at flush
+        st.session_state.pending_ops = {}
+    if "appended_stores" not in st.session_state:
+        # name -> whether the session's copy is what's stored, for stores an
+        # incremental backend wrote this run; shared by the next flush()
+        st.session_state.appended_stores = {}
+    if "store_sigs" not in st.session_state:
+        # signature of the file each store's copy was read from (or last written to) by this session
+        st.session_state.store_sigs = {}
+    if not backend.indexed:
+        # past months move out of events.json in the background (once a day per process)
+        archive.archive_async(backend, FILES["events"], datetime.date.today())
+    for name, (key, _) in STORES.items():
+        if name not in st.session_state.owned_stores:
+            st.session_state.store_sigs[name], st.session_state[key] = _shared_entry(name)
+
+
+def get(name):
+    return st.session_state[STORES[name][0]]
+
+
+def mark_dirty(name):
+    st.session_state.dirty_stores.add(name)
+
+
+def _own(name):
+    owned = st.session_state.owned_stores
+    if name not in owned:
+        key = STORES[name][0]
+        st.session_state[key] = _copy(st.session_state[key])
+        owned.add(name)
+
+
+def _appended(name, written):
+    # an incremental backend wrote this session's change: if nobody else wrote
+    # since the session's copy was read, the copy is now what's stored. The
+    # session keeps owning it for the rest of the run, so further changes don't
+    # copy it again; flush() then makes it the shared copy, or lets the next
+    # run reload the store with every writer's changes.
+    before, after = written
+    sigs = st.session_state.store_sigs
+    clean = before == sigs.get(name)
+    if clean:
+        _search_written(name, before, after)
+        if name == "budget":
+            _budget_agg_written(before, after)
+        sigs[name] = after
+    st.session_state.appended_stores[name] = clean
+
+
+def _record(name, entry):
+    _own(name)
+    apply_op(get(name), entry)
+    if name == "budget":
+        _update_budget_agg(entry)
+    # incremental backends persist the change right away; the rest wait for flush()
+    written = backend.append(FILES[name], entry, STORES[name][1]())
+    if written:
+        _appended(name, written)
+    else:
+        st.session_state.pending_ops.setdefault(name, []).append(entry)
+        mark_dirty(name)
+
+
+def add(name, record, section=None):
+    """Append a record to a store (or to one of its sections, e.g. budget "expenses")."""
+    _record(name, {"op": "add", "section": section, "record": record})
+    return record
+
+
+def add_many(name, records, section=None):
+    """Append `records` (any iterable, consumed once) with one write for the whole batch.
+
+    Used by bulk imports. The session's derived indexes are dropped and rebuilt
+    on next use rather than extended record by record. Returns how many were added.
+    """
+    _own(name)
+    data = get(name)
+    target = data.setdefault(section, []) if section else data
+    start = len(target)
+    target.extend(records)
+    added = target[start:]
+    if not added:
+        return 0
+    entries = [{"op": "add", "section": section, "record": record} for record in added]
+    if name in DERIVED:
+        st.session_state.pop(DERIVED[name], None)
+    if name == "budget":
+        st.session_state.budget_agg = None
+    written = backend.append_many(FILES[name], entries, STORES[name][1]())
+    if written:
+        _appended(name, written)
+    else:
+        st.session_state.pending_ops.setdefault(name, []).extend(entries)
+        mark_dirty(name)
+    if _search is not None and name in SEARCHED:
+        _search.add_many(SEARCHED[name], added, source=name)
+    return len(added)
+
+
+def record_ids(name, section=None):
+    """Ids of the records already stored (archived events included), for deduplicating imports."""
+    data = get(name)
+    ids = {record_key(r) for r in (data.get(section, []) if section else data)}
+    if name == "events" and not backend.indexed:
+        ids.update(record_key(e) for e in archive.load_all())
+    return ids
+
+
+def all_records(name, section=None):
+    """A function iterating every record of a store for export: the session's copy, then archived events.
+
+    The session's copy is looked up now, so the function can run off the
+    script thread (Streamlit's deferred downloads), as often as needed.
+    """
+    data = get(name)
+    records = data.get(section, []) if section else data
+    archived = name == "events" and not backend.indexed
+    return lambda: itertools.chain(records, archive.load_all() if archived else ())
+
+
+def update(name, record_id, changes, section=None):
+    _record(name, {"op": "update", "section": section, "id": record_id, "changes": changes})
+    if _search is not None and name in SEARCHED:
+        record = next((r for r in get(name) if record_key(r) == record_id), None)
+        if record is not None:
+            _search.add(SEARCHED[name], record, source=name)
+
+
+def remove(name, record_id, section=None):
+    """Delete a record by id (or by value for plain lists such as streak dates)."""
+    _record(name, {"op": "delete", "section": section, "id": record_id})
+    if _search is not None and name in SEARCHED:
+        _search.remove(SEARCHED[name], record_id, source=name)
+
+
+def flush(force=False):
+    """Write the stores mutated since the last flush (all of them when forced),
+    and share the ones an incremental backend already wrote this run."""
+    dirty = st.session_state.dirty_stores
+    owned = st.session_state.owned_stores
+    appended = st.session_state.appended_stores
+    for name, clean in appended.items():
+        if clean:
+            _publish(FILES[name], st.session_state.store_sigs[name], get(name))
+        owned.discard(name)
+        if name == "budget":
+            _save_budget_agg()
+    appended.clear()
+    names = list(STORES) if force else [n for n in STORES if n in dirty]
+    for name in names:
+        if backend.incremental:
+            # every change is already in the journal; forcing folds it into the snapshot
+            backend.compact(FILES[name], STORES[name][1]())
+        else:
+            # the ops stay pending until they are on disk: a failed commit is retried by the next flush
+            ops = st.session_state.pending_ops.get(name, [])
+            copy = get(name)
+            sig, data, before = backend.commit(FILES[name], ops, STORES[name][1](), *NORMALIZERS.get(name, ()))
+            st.session_state.pending_ops.pop(name, None)
+            clean = before == st.session_state.store_sigs.get(name)
+            if clean:
+                # nobody else wrote since the copy was read, so the file now holds the
+                # copy's records: keep them, and the indexes built over them
+                data = copy
+            data = models.compact(name, data)
+            st.session_state[STORES[name][0]] = data
+            if clean:
+                _rebind_derived(name, copy, data)
+                _search_written(name, before, sig)
+                if name == "budget":
+                    _budget_agg_written(before, sig)
+            _publish(FILES[name], sig, data)
+            st.session_state.store_sigs[name] = sig
+            if name == "budget":
+                _save_budget_agg()
+        owned.discard(name)
+        dirty.discard(name)
+    return names
+
+
+# ----------------------------
+# Budget aggregates: the session keeps running totals in sync with its copy
+# of the budget store and persists them to BUDGET_AGG_FILE.
+# ----------------------------
+def budget_aggregates():
+    """Totals and rollups for the session's budget store, rebuilt only if they drifted."""
+    data = get("budget")
+    source = sig_marker(st.session_state.store_sigs.get("budget"))
+    agg = st.session_state.get("budget_agg")
+    if agg is None or not budget_agg.in_sync(agg, data, source):
+        try:
+            agg = load_data(BUDGET_AGG_FILE, None)
+        except DataFileError:
+            agg = None  # derived data: rebuilt below
+        if agg is None or not budget_agg.in_sync(agg, data, source):
+            agg = budget_agg.rebuild(data, source)
+            save_data(BUDGET_AGG_FILE, agg)
+        st.session_state.budget_agg = agg
+    return agg
+
+
+def _update_budget_agg(entry):
+    agg = st.session_state.get("budget_agg")
+    records = get("budget").get(entry.get("section"), [])
+    if agg is not None and entry["op"] == "add" and agg["counts"].get(entry["section"]) == len(records) - 1:
+        budget_agg.add(agg, entry["section"], entry["record"])
+    else:
+        # updates and deletes are rare; rebuild lazily on the next read
+        st.session_state.budget_agg = None
+
+
+def _budget_agg_written(before, after):
+    # the session's own write, with nobody else's in between: the running
+    # totals already include it, so they now describe the store as saved
+    agg = st.session_state.get("budget_agg")
+    if agg is not None and agg["source"] == sig_marker(before):
+        agg["source"] = sig_marker(after)
+
+
+def _save_budget_agg():
+    save_data(BUDGET_AGG_FILE, budget_aggregates())
+
+
+# ----------------------------
+# Derived indexes (streak tracker, timetable index, ...) are built once per
+# session copy of a store and updated in place as records are added.
+# ----------------------------
+# store name -> session_state key of the index derived from it
+DERIVED = {
+    "streaks": "streak_tracker",
+    "timetable": "timetable_index",
+    "events": "event_index",
+    "assignments": "assignment_index",
+}
+
+
+def _derived(key, name, build):
+    data = get(name)
+    cached = st.session_state.get(key)
+    if cached is None or cached[0] is not data:
+        cached = (data, build(data))
+        st.session_state[key] = cached
+    return cached[1]
+
+
+def _rebind(key, name, index):
+    # the store was copied on write; keep the updated index attached to the copy
+    st.session_state[key] = (get(name), index)
+
+
+def _rebind_derived(name, old, data):
+    # `data` holds the same records as `old` (flush() replaced the list): move the index over
+    key = DERIVED.get(name)
+    cached = st.session_state.get(key) if key else None
+    if cached is not None and cached[0] is old:
+        st.session_state[key] = (data, cached[1])
+
+
+def streak_tracker():
+    return _derived("streak_tracker", "streaks", streaks.StreakTracker)
+
+
+def log_streak_day(day):
+    """Record `day` as logged; returns False if it already was."""
+    tracker = streak_tracker()
+    if day in tracker:
+        return False
+    add("streaks", day.isoformat())
+    tracker.add(day)
+    _rebind("streak_tracker", "streaks", tracker)
+    return True
+
+
+def timetable_index():
+    return _derived("timetable_index", "timetable", timetable.TimetableIndex)
+
+
+def add_class(entry):
+    index = timetable_index()
+    add("timetable", entry)
+    index.add(entry)
+    _rebind("timetable_index", "timetable", index)
+    _index_record("timetable", entry)
+    return entry
+
+
+def _event_span(event):
+    return timetable.span_of(event, EVENT_MINUTES)
+
+
+def event_index():
+    return _derived("event_index", "events", lambda events: schedule.DatedIndex(_event_span, events))
+
+
+def add_event(event):
+    index = event_index()
+    add("events", event)
+    index.add(event)
+    _rebind("event_index", "events", index)
+    _index_record("events", event)
+    return event
+
+
+def assignment_index():
+    return _derived("assignment_index", "assignments", assignments.AssignmentIndex)
+
+
+def add_assignment(record):
+    index = assignment_index()
+    add("assignments", record)
+    index.add(record)
+    _rebind("assignment_index", "assignments", index)
+    _index_record("assignments", record)
+    return record
+
+
+# ----------------------------
+# Personal schedules: one shard per user under PERSONAL_DIR, read the first
+# time a session asks for that user and shared between sessions like the
+# stores above. A new task is written to its user's shard straight away, so
+# one user's writes never rewrite anyone else's schedule. The sqlite backend
+# has no table per user, so the shards stay JSON files there.
+# ----------------------------
+_shards = JsonBackend() if backend.indexed else backend
+os.makedirs(PERSONAL_DIR, exist_ok=True)
+
+
+def shard_path(username):
+    # percent-encoded, dots included, so any name gives a safe and non-hidden file name
+    return os.path.join(PERSONAL_DIR, quote(username, safe="").replace(".", "%2E") + ".json")
+
+
+def personal_users():
+    """Names of the users with a saved personal schedule."""
+    try:
+        files = os.listdir(PERSONAL_DIR)
+    except FileNotFoundError:
+        return []
+    # a shard written by the journal backend may not have a snapshot yet
+    names = {f.removesuffix(".json").removesuffix(JOURNAL_SUFFIX) for f in files if not f.startswith(".")}
+    return sorted(unquote(n) for n in names if "." not in n)
+
+
+def _task_span(task):
+    return timetable.span_of(task, TASK_MINUTES)
+
+
+def personal_tasks(username):
+    return _cached_load(_shards, shard_path(username), list)
+
+
+def _user_derived(key, username, build):
+    # like _derived, one entry per user whose shard this session has looked at
+    tasks = personal_tasks(username)
+    cache = st.session_state.setdefault(key, {})
+    cached = cache.get(username)
+    if cached is None or cached[0] is not tasks:
+        cached = cache[username] = (tasks, build(tasks))
+    return cached[1]
+
+
+def task_index(username):
+    return _user_derived("task_indexes", username, lambda tasks: schedule.DatedIndex(_task_span, tasks))
+
+
+def add_personal_task(username, task):
+    before = personal_tasks(username)
+    index = task_index(username)
+    found = task_search(username)
+    path = shard_path(username)
+    entry = {"op": "add", "section": None, "record": task}
+    if not _shards.append(path, entry, []):
+        sig, data, _ = _shards.commit(path, [entry], [])
+        _publish(path, sig, data)
+    tasks = personal_tasks(username)
+    if len(tasks) == len(before) + 1:
+        # nobody else wrote to the shard in between: extend the indexes instead of rebuilding them
+        index.add(task)
+        found.add("task", task)
+        st.session_state.task_indexes[username] = (tasks, index)
+        st.session_state.task_search[username] = (tasks, found)
+    return task
+
+
+def tasks_between(username, first, last):
+    """`username`'s tasks dated first..last (inclusive), by date and time."""
+    return task_index(username).between(first, last)
+
+
+def schedule_clashes(username, date, start, end):
+    """Classes, campus events and `username`'s tasks overlapping [start, end) on `date`."""
+    day = timetable.WEEKDAYS[date.weekday()]
+    return (
+        timetable_index().clashes(day, start, end)
+        + event_index().overlapping(date, start, end)
+        + task_index(username).overlapping(date, start, end)
+    )
+
+
+def busy_on(username, date):
+    """(start, end) blocks taken by classes and `username`'s tasks on `date`."""
+    day = timetable.WEEKDAYS[date.weekday()]
+    tasks = task_index(username).on(date)
+    return timetable_index().busy(day) + [(start, end) for start, end, _ in tasks]
+
+
+# ----------------------------
+# Full-text search: one process-wide index over the shared stores (events,
+# archived events included, assignments and classes), caught up with the
+# session's copies on use and saved to SEARCH_FILE in the background.
+# Personal tasks are indexed per user and only searched for the current one.
+# ----------------------------
+SEARCHED = {"events": "event", "assignments": "assignment", "timetable": "class"}
+_search = None
+_search_lock = threading.Lock()
+_search_saved = 0.0
+
+
+def _search_written(name, before, after):
+    # the session's writes reached the index as they were made (_index_record,
+    # update, remove, add_many): if it was current with the copy before they
+    # were stored, it is current with what's stored now
+    if _search is not None and name in SEARCHED and _search.sources.get(name) == sig_marker(before):
+        _search.sources[name] = sig_marker(after)
+
+
+def _save_search_async(index):
+    global _search_saved
+    with _search_lock:
+        if not index.changed or time.monotonic() - _search_saved < SEARCH_SAVE_SECONDS:
+            return
+        _search_saved = time.monotonic()
+    threading.Thread(target=search.save, args=(SEARCH_FILE, index), name="save-search", daemon=True).start()
+
+
+def search_index():
+    global _search
+    with _search_lock:
+        if _search is None:
+            _search = search.load(SEARCH_FILE) or search.SearchIndex()
+    index = _search
+    for name, kind in SEARCHED.items():
+        marker = sig_marker(st.session_state.store_sigs.get(name))
+        if index.sources.get(name) != marker:
+            # written by another session or process since: catch up with the
+            # added, edited and deleted records
+            index.sync(name, kind, get(name))
+            index.sources[name] = marker
+    if not backend.indexed:
+        for month in archive.months():
+            path = archive.month_path(month)
+            sig = sig_marker(file_signature(path))
+            if index.sources.get(path) != sig:
+                index.sync(path, "event", archive.load_month(month))
+                index.sources[path] = sig
+    _save_search_async(index)
+    return index
+
+
+def _index_record(name, record):
+    # keep the shared index current without a catch-up pass on the next search
+    if _search is not None:
+        _search.add(SEARCHED[name], record, source=name)
+
+
+def _task_search_index(tasks):
+    index = search.SearchIndex()
+    index.add_many("task", tasks)
+    return index
+
+
+def task_search(username):
+    return _user_derived("task_search", username, _task_search_index)
+
+
+def search_all(query, username=None, limit=20):
+    """Best matches for `query` across the shared stores and `username`'s tasks."""
+    hits = search_index().search(query, limit)
+    if username:
+        hits = search.merge(limit, hits, task_search(username).search(query, limit))
+    return hits
+
+
+# ----------------------------
+# Page queries: indexed backends answer them directly, the file backends
+# fall back to scanning the session's copy.
+# ----------------------------
+def count_upcoming_events(today):
+    if backend.indexed:
+        return backend.count_upcoming_events(today)
+    cutoff = today.isoformat()
+    return sum(1 for e in get("events") if e["date"] >= cutoff)
+
+
+def upcoming_and_past_events(today):
+    """Events dated `today` or later, soonest first, and earlier ones, latest first."""
+    if backend.indexed:
+        return backend.upcoming_and_past_events(today)
+    events = sorted(get("events"), key=lambda x: x["date"])
+    split = bisect.bisect_left(events, today.isoformat(), key=lambda e: e["date"])
+    return events[split:], events[:split][::-1]
+
+
+def archived_months():
+    """Months moved out of the live events, newest first (the sqlite backend keeps them all live)."""
+    return [] if backend.indexed else archive.months()[::-1]
+
+
+def archived_events(month):
+    return sorted(archive.load_month(month), key=lambda e: e["date"], reverse=True)
+
+
+def count_pending_assignments():
+    if backend.indexed:
+        return backend.count_pending_assignments()
+    return assignment_index().pending_count()
+
+
+def filter_assignments(status=None, due_from=None, due_to=None):
+    """Assignments with the given status (None = any) due within [due_from, due_to], most urgent first."""
+    if backend.indexed:
+        return backend.filter_assignments(status, due_from, due_to)
+    return assignment_index().filter(status, due_from, due_to)
+
+
+def overdue_assignments(today):
+    if backend.indexed:
+        return backend.overdue_assignments(today)
+    return assignment_index().overdue(today)
+
+
+def timetable_for_day(day):
+    if backend.indexed:
+        return backend.timetable_for_day(day)
+    return timetable_index().day(day)
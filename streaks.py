@@ -0,0 +1,94 @@
+import datetime
+from array import array
+from bisect import bisect_left, insort
+
+
+def _ordinal(day):
+    if isinstance(day, datetime.date):
+        return day.toordinal()
+    return datetime.date.fromisoformat(day).toordinal()
+
+
+def _iso(ordinal):
+    return datetime.date.fromordinal(ordinal).isoformat()
+
+
+def expand(entries):
+    """Ordinals for streaks.json entries.
+
+    Entries are plain ISO dates ("2026-10-18", the original format) or ISO 8601
+    intervals ("2026-10-01/P5D" = five consecutive days) written by compact().
+    """
+    for entry in entries:
+        if "/P" in entry:
+            start, length = entry.split("/P")
+            first = _ordinal(start)
+            yield from range(first, first + int(length.rstrip("D")))
+        else:
+            yield _ordinal(entry)
+
+
+def days(entries):
+    """streaks.json entries with every interval expanded: one ISO date per day, the form the app holds and edits."""
+    return [_iso(ordinal) for ordinal in expand(entries)]
+
+
+def compact(entries):
+    """Rewrite streaks.json entries as runs of consecutive days (single days stay plain dates)."""
+    runs = []
+    for ordinal in sorted(set(expand(entries))):
+        if runs and runs[-1][0] + runs[-1][1] == ordinal:
+            runs[-1][1] += 1
+        else:
+            runs.append([ordinal, 1])
+    return [_iso(start) if length == 1 else f"{_iso(start)}/P{length}D" for start, length in runs]
+
+
+class StreakTracker:
+    """Logged days as a sorted array of date ordinals, with streak counters kept up to date."""
+
+    __slots__ = ("days", "current", "longest", "month_counts")
+
+    def __init__(self, entries=()):
+        self.days = array("l", sorted(set(expand(entries))))
+        self.month_counts = {}
+        for ordinal in self.days:
+            month = _iso(ordinal)[:7]
+            self.month_counts[month] = self.month_counts.get(month, 0) + 1
+        self._recount()
+
+    def _recount(self):
+        # full pass, only needed when a day lands before the last logged one
+        self.current = self.longest = 0
+        prev = None
+        for ordinal in self.days:
+            self.current = self.current + 1 if prev is not None and ordinal == prev + 1 else 1
+            self.longest = max(self.longest, self.current)
+            prev = ordinal
+
+    def _has(self, ordinal):
+        i = bisect_left(self.days, ordinal)
+        return i < len(self.days) and self.days[i] == ordinal
+
+    def __contains__(self, day):
+        return self._has(_ordinal(day))
+
+    def __len__(self):
+        return len(self.days)
+
+    def add(self, day):
+        """Log a day; returns False if it was already logged."""
+        ordinal = _ordinal(day)
+        last = self.days[-1] if self.days else None
+        if last is not None and ordinal <= last:
+            if self._has(ordinal):
+                return False
+            insort(self.days, ordinal)
+            self._recount()
+        else:
+            self.days.append(ordinal)
+            self.current = self.current + 1 if last is not None and ordinal == last + 1 else 1
+            self.longest = max(self.longest, self.current)
+        month = _iso(ordinal)[:7]
+        self.month_counts[month] = self.month_counts.get(month, 0) + 1
+        return True
@@ -0,0 +1,322 @@
+# StudyBot: offline answers to study questions, no external service involved.
+#
+# Questions about the user's own data are recognised by keyword and answered
+# from the store indexes: what's due (AssignmentIndex), what was spent (the
+# budget aggregates) and which classes are on (TimetableIndex). Anything else
+# is ranked with BM25 against the bundled tips in corpus/study_tips.md, and the
+# user's records mentioning the question's words are listed under the tip.
+#
+# The tips index is built once per process. interpret() -- a question's intent
+# and tip ranking -- is cached per normalized question, so asking again only
+# re-runs the indexed lookup against the current data.
+import datetime
+import functools
+import heapq
+import math
+import re
+from collections import Counter
+
+import search
+import timetable
+from config import STUDY_TIPS_FILE, STUDYBOT_CACHE_SIZE
+
+_WORD = re.compile(r"\w+")
+
+# words that carry no topic, dropped before ranking tips or looking up records
+FILLER = search.STOPWORDS | frozenset(
+    "about any are be best can could did do does get give good got had has have help how i if im it its just me more "
+    "much my need please s should show so tell than that there these this those tip tips us was way we what whats "
+    "when where which who why will would you your".split()
+)
+
+ASSIGNMENT_WORDS = {"assignment", "assignments", "homework", "coursework", "project", "projects", "deadline", "deadlines"}
+SPEND_WORDS = {"spend", "spent", "spending", "expense", "expenses", "cost", "costs"}
+CLASS_WORDS = {"class", "classes", "lecture", "lectures", "timetable"}
+ASKING = {"what", "whats", "which", "any", "pending", "left", "list", "show", "much", "total", "when"}
+SHOWN = 10  # records listed per answer
+
+
+def normalize(question):
+    return " ".join(_WORD.findall(question.casefold()))
+
+
+SUFFIXES = ("ations", "ation", "ings", "ing", "ions", "ion", "ies", "es", "ed", "ly", "s")
+
+
+def _stem(token):
+    # suffix stripping plus truncation: "exams" ~ "exam", "procrastinating" ~ "procrastination"
+    for suffix in SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            token = token[: -len(suffix)]
+            break
+    return token[:6]
+
+
+def terms(words):
+    return [w for w in words if w not in FILLER and not w.isdigit()]
+
+
+class BM25:
+    """Okapi BM25 over tokenized documents."""
+
+    def __init__(self, docs, k1=1.5, b=0.75):
+        self.k1 = k1
+        self.postings = {}  # token -> [(doc, term frequency)]
+        lengths = [len(tokens) for tokens in docs]
+        average = sum(lengths) / len(lengths) if docs else 1
+        for doc, tokens in enumerate(docs):
+            for token, tf in Counter(tokens).items():
+                self.postings.setdefault(token, []).append((doc, tf))
+        n = len(docs)
+        self.idf = {t: math.log(1 + (n - len(p) + 0.5) / (len(p) + 0.5)) for t, p in self.postings.items()}
+        self.norm = [k1 * (1 - b + b * length / average) for length in lengths]
+
+    def rank(self, tokens, limit=3):
+        """[(score, doc)] best first."""
+        scores = {}
+        for token in set(tokens):
+            idf = self.idf.get(token)
+            if idf is None:
+                continue
+            for doc, tf in self.postings[token]:
+                scores[doc] = scores.get(doc, 0.0) + idf * tf * (self.k1 + 1) / (tf + self.norm[doc])
+        return heapq.nlargest(limit, ((score, doc) for doc, score in scores.items()))
+
+
+def load_tips(path):
+    """[(title, text)] from a markdown file of "## Title" sections."""
+    tips = []
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("## "):
+                    tips.append([line[3:].strip(), ""])
+                elif tips and line.strip():
+                    tips[-1][1] = f"{tips[-1][1]} {line.strip()}".strip()
+    except OSError:
+        return []
+    return [tuple(tip) for tip in tips]
+
+
+@functools.lru_cache(maxsize=1)
+def tips_index():
+    """(tips, BM25 index), built once per process; titles count twice."""
+    tips = load_tips(STUDY_TIPS_FILE)
+    docs = [[_stem(t) for t in terms(_WORD.findall(f"{title} {title} {text}".casefold()))] for title, text in tips]
+    return tips, BM25(docs)
+
+
+def _period(words):
+    """The time span a question asks about: "today", "tomorrow", "week", "next_week", "month", a weekday or None."""
+    text = " ".join(words)
+    if "next week" in text:
+        return "next_week"
+    for word in words:
+        if word in ("today", "tonight"):
+            return "today"
+        if word == "tomorrow":
+            return "tomorrow"
+        if word in ("week", "weekend"):
+            return "week"
+        if word == "month":
+            return "month"
+        if word.capitalize() in timetable.WEEKDAYS:
+            return word.capitalize()
+    return None
+
+
+def period_range(period, today, default_days=7):
+    """(first, last) dates covered by a _period() value."""
+    if period == "today":
+        return today, today
+    if period == "tomorrow":
+        day = today + datetime.timedelta(days=1)
+        return day, day
+    if period == "week":
+        return today, today + datetime.timedelta(days=6 - today.weekday())
+    if period == "next_week":
+        monday = today + datetime.timedelta(days=7 - today.weekday())
+        return monday, monday + datetime.timedelta(days=6)
+    if period == "month":
+        following = (today.replace(day=28) + datetime.timedelta(days=4)).replace(day=1)
+        return today.replace(day=1), following - datetime.timedelta(days=1)
+    if period in timetable.WEEKDAYS:
+        day = today + datetime.timedelta(days=(timetable.WEEKDAYS.index(period) - today.weekday()) % 7)
+        return day, day
+    return today, today + datetime.timedelta(days=default_days)
+
+
+def _label(period):
+    if period in timetable.WEEKDAYS:
+        return f"on {period}"
+    labels = {None: "in the next 7 days", "week": "this week", "next_week": "next week", "month": "this month"}
+    return labels.get(period, period)
+
+
+@functools.lru_cache(maxsize=STUDYBOT_CACHE_SIZE)
+def interpret(normalized):
+    """(intent, args) for a normalized question; the tip ranking is done here for "tips"."""
+    words = normalized.split()
+    present = set(words)
+    period = _period(words)
+    asking = bool(present & ASKING) or period is not None
+    if "overdue" in present or ("late" in present and present & ASSIGNMENT_WORDS):
+        return "overdue", ()
+    if "due" in present or (present & ASSIGNMENT_WORDS and asking):
+        return "due", (period,)
+    if present & SPEND_WORDS and asking:
+        return "spent", (period, tuple(terms(words)))
+    if "balance" in present or ("money" in present and "left" in present):
+        return "balance", ()
+    if present & CLASS_WORDS and "next" in present:
+        return "next_class", ()
+    if present & CLASS_WORDS and asking:
+        return "classes", (period,)
+    topic = terms(words)
+    _, index = tips_index()
+    ranked = index.rank([_stem(t) for t in topic], limit=3)
+    return "tips", (tuple(doc for _, doc in ranked), tuple(topic))
+
+
+def _money(amount):
+    return f"₦{amount:,.2f}"
+
+
+def _assignments(heading, index, first, last):
+    total = index.count_unfinished(first, last)
+    lines = [f"**{heading}** ({total}):"]
+    for a in index.unfinished(first, last, limit=SHOWN):
+        due = datetime.date.fromisoformat(a["due_date"]).strftime("%a %d %b")
+        lines.append(f"- 📝 **{a['title']}** ({a['course']}) — due {due} · {a['status']}")
+    if total > SHOWN:
+        lines.append(f"…and {total - SHOWN} more.")
+    return "\n".join(lines)
+
+
+def answer_due(index, today, period):
+    first, last = period_range(period, today)
+    if not index.count_unfinished(first, last):
+        return f"Nothing due {_label(period)} 🎉"
+    return _assignments(f"Due {_label(period)}", index, first, last)
+
+
+def answer_overdue(index, today):
+    yesterday = today - datetime.timedelta(days=1)
+    if not index.count_unfinished(None, yesterday):
+        return "Nothing overdue — nice work! ✅"
+    return _assignments("Overdue", index, None, yesterday)
+
+
+def _spent_between(by_day, first, last):
+    days = (first + datetime.timedelta(days=i) for i in range((last - first).days + 1))
+    return sum(by_day.get(day.isoformat(), 0.0) for day in days)
+
+
+def _spent_window(period, today):
+    """(first, last) days a spending question looks back over, or None for all time.
+
+    Spending looks back: "this week" is Monday to today, "this month" the 1st to
+    today and a weekday its latest occurrence.
+    """
+    if period == "month":
+        return today.replace(day=1), today
+    if period == "week":
+        return today - datetime.timedelta(days=today.weekday()), today
+    if period == "today" or period in timetable.WEEKDAYS:
+        back = 0 if period == "today" else (today.weekday() - timetable.WEEKDAYS.index(period)) % 7
+        day = today - datetime.timedelta(days=back)
+        return day, day
+    return None
+
+
+def answer_spent(agg, today, period, topic):
+    words = {_stem(t) for t in topic}
+    categories = [c for c in agg["by_category"] if {_stem(t) for t in terms(_WORD.findall(c.casefold()))} & words]
+    window = _spent_window(period, today)
+    if categories:
+        if window is None:
+            return "\n\n".join(f"You've spent **{_money(agg['by_category'][c])}** on {c} in total." for c in categories)
+        return "\n\n".join(
+            f"You've spent **{_money(_spent_between(agg['by_category_day'].get(c, {}), *window))}** on {c} {_label(period)}."
+            for c in categories
+        )
+    if period == "month":
+        return f"You've spent **{_money(agg['by_month'].get(today.isoformat()[:7], 0.0))}** this month."
+    if window is not None:
+        return f"You've spent **{_money(_spent_between(agg['by_day'], *window))}** {_label(period)}."
+    text = f"You've spent **{_money(agg['totals']['expenses'])}** in total."
+    top = heapq.nlargest(3, agg["by_category"].items(), key=lambda kv: kv[1])
+    if top:
+        text += " Biggest categories: " + ", ".join(f"{c} {_money(amount)}" for c, amount in top) + "."
+    return text
+
+
+def answer_balance(agg):
+    totals = agg["totals"]
+    return (f"Your balance is **{_money(totals['incomes'] - totals['expenses'])}** "
+            f"({_money(totals['incomes'])} in, {_money(totals['expenses'])} spent).")
+
+
+def answer_classes(index, today, period):
+    first, last = period_range(period or "today", today)
+    lines = []
+    day = first
+    while day <= last:
+        classes = index.day(timetable.WEEKDAYS[day.weekday()])
+        if classes:
+            lines.append(f"**{day.strftime('%A')}:** " + ", ".join(f"{c['course']} at {c['time']}" for c in classes))
+        day += datetime.timedelta(days=1)
+    return "\n\n".join(lines) or f"No classes {_label(period or 'today')}."
+
+
+def answer_next_class(index, now):
+    found = index.next_class(now)
+    if found is None:
+        return "No classes in the coming week."
+    when, entry = found
+    label = "today" if when == now.date() else when.strftime("%A")
+    return f"Your next class is **{entry['course']}** {label} at {entry['time']}."
+
+
+def answer_tips(ranked, topic, related=None):
+    tips, _ = tips_index()
+    if ranked:
+        title, text = tips[ranked[0]]
+        parts = [f"**{title}**\n\n{text}"]
+        if len(ranked) > 1:
+            parts.append("See also: " + ", ".join(f"*{tips[doc][0]}*" for doc in ranked[1:]))
+    else:
+        parts = ["I don't have a tip for that yet — try asking about exams, deadlines, focus, notes or budgeting, "
+                 "or ask what's due this week, how much you spent on food, or when your next class is."]
+    if related is not None and topic:
+        # the user's own records for the question's words, from the shared search index
+        hits = {}
+        for _, info in search.merge(5, *(related(word) for word in topic[:5])):
+            hits.setdefault(info[:2], (info[2], info[3]))
+        if hits:
+            parts.append("From your data:\n" + "\n".join(f"- **{title}** — {detail}" for title, detail in hits.values()))
+    return "\n\n".join(parts)
+
+
+def answer(question, now, assignments, budget, classes, related=None):
+    """Markdown reply to `question`.
+
+    `assignments` is an AssignmentIndex, `budget` the budget aggregates,
+    `classes` a TimetableIndex and `related(word)` returns search hits from
+    the user's records.
+    """
+    intent, args = interpret(normalize(question))
+    today = now.date()
+    if intent == "due":
+        return answer_due(assignments, today, *args)
+    if intent == "overdue":
+        return answer_overdue(assignments, today)
+    if intent == "spent":
+        return answer_spent(budget, today, *args)
+    if intent == "balance":
+        return answer_balance(budget)
+    if intent == "next_class":
+        return answer_next_class(classes, now)
+    if intent == "classes":
+        return answer_classes(classes, today, *args)
+    return answer_tips(*args, related=related)
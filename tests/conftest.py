@@ -0,0 +1,29 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# config creates data/ relative to the working directory when it is imported
+os.chdir(tempfile.mkdtemp(prefix="campus-tests-"))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def session():
+    """An empty st.session_state and empty data files, with the stores initialised on top."""
+    import streamlit as st
+
+    import store
+    from config import FILES
+    from journal import journal_path
+
+    for key in list(st.session_state):
+        del st.session_state[key]
+    for path in FILES.values():
+        for stale in (path, path + ".bak", journal_path(path)):
+            if os.path.exists(stale):
+                os.unlink(stale)
+    store._shared.clear()
+    store.init_stores()
+    return st.session_state
@@ -0,0 +1,49 @@
+import datetime
+import os
+
+import pytest
+
+import archive
+from backends import JsonBackend
+from utils import load_data, save_data
+
+TODAY = datetime.date(2026, 10, 18)
+
+
+def event(i, date):
+    return {"id": f"e{i}", "title": f"Event {i}", "date": date, "time": "10:00 AM"}
+
+
+@pytest.fixture
+def events_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(archive, "EVENTS_ARCHIVE_DIR", str(tmp_path / "archive"))
+    archive._months.clear()
+    path = str(tmp_path / "events.json")
+    save_data(path, [event(1, "2026-08-31"), event(2, "2026-10-01"), event(3, "2026-09-15"), event(4, "2027-01-02")])
+    return path
+
+
+def test_past_months_move_out_of_the_live_file(events_file):
+    assert archive.archive_past(JsonBackend(), events_file, TODAY) == 2
+    assert [e["id"] for e in load_data(events_file, [])] == ["e2", "e4"]
+    assert archive.months() == ["2026-08", "2026-09"]
+    assert [e["id"] for e in archive.load_month("2026-09")] == ["e3"]
+    assert [e["id"] for e in archive.load_all()] == ["e1", "e3"]
+    # nothing left to move
+    assert archive.archive_past(JsonBackend(), events_file, TODAY) == 0
+
+
+def test_a_rerun_after_an_interrupted_pass_archives_each_event_once(events_file):
+    # the month file was written but the live file never rewritten
+    os.makedirs(archive.EVENTS_ARCHIVE_DIR)
+    archive._append_month("2026-09", [event(3, "2026-09-15")])
+    assert archive.archive_past(JsonBackend(), events_file, TODAY) == 2
+    assert [e["id"] for e in archive.load_month("2026-09")] == ["e3"]
+
+
+def test_month_files_are_reread_only_when_they_change(events_file):
+    archive.archive_past(JsonBackend(), events_file, TODAY)
+    first = archive.load_month("2026-09")
+    assert archive.load_month("2026-09") is first
+    archive._append_month("2026-09", [event(5, "2026-09-20")])
+    assert [e["id"] for e in archive.load_month("2026-09")] == ["e3", "e5"]
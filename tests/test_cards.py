@@ -0,0 +1,44 @@
+import datetime
+
+import cards
+
+TODAY = datetime.date(2026, 10, 18)
+EVENT = {"id": "e1", "title": "<script>alert(1)</script>", "date": "2026-10-20", "time": "10:00 AM",
+         "location": "Hall & Annex", "type": "Social", "color": "#cfe9ff", "description": 'Say "hi"\nbring food'}
+
+
+def test_user_text_is_escaped():
+    html = cards.event_card(EVENT, TODAY)
+    assert "<script>" not in html
+    assert "&lt;script&gt;alert(1)&lt;/script&gt;" in html
+    assert "Hall &amp; Annex" in html
+    # a newline would end the markdown HTML block the page of cards is joined into
+    assert "\n" not in html and "Say &quot;hi&quot;<br>bring food" in html
+
+
+def test_relative_parts_follow_today_and_status():
+    assert "⏳ Starts in 2 day(s)" in cards.event_card(EVENT, TODAY)
+    assert "🚨 Happened already" in cards.event_card(EVENT, TODAY + datetime.timedelta(days=3))
+    assert "⏳ 2 day(s) to go" in cards.pick_card(EVENT, TODAY)
+    assignment = {"id": "a1", "title": "Essay", "course": "History", "due_date": "2026-10-17", "status": "Pending", "notes": ""}
+    assert cards.OVERDUE_BADGE in cards.assignment_card(assignment, TODAY)
+    assert cards.OVERDUE_BADGE not in cards.assignment_card({**assignment, "status": "Done"}, TODAY)
+
+
+def test_fragments_are_rebuilt_only_when_the_record_changes(monkeypatch):
+    builds = []
+    parts = cards._task_parts
+    monkeypatch.setattr(cards, "_task_parts", lambda t: builds.append(t["id"]) or parts(t))
+    task = {"id": "t-cache", "title": "Read", "time": "09:00", "description": "", "color": "#fff"}
+    first = cards.task_card(task)
+    assert cards.task_card(dict(task)) == first
+    assert "Reread" in cards.task_card({**task, "title": "Reread"})
+    assert builds == ["t-cache", "t-cache"]
+
+
+def test_cache_stays_within_its_byte_limit(monkeypatch):
+    monkeypatch.setattr(cards, "CARD_CACHE_BYTES", 2000)
+    for i in range(50):
+        cards.task_card({"id": f"t{i}", "title": "x" * 100, "time": "09:00", "description": "", "color": "#fff"})
+    info = cards.cache_info()
+    assert info["bytes"] <= 2000 and 0 < info["entries"] < 50
@@ -0,0 +1,32 @@
+import charts
+
+
+def test_small_categories_are_folded_into_other():
+    totals = {"Food": 500.0, "Rent": 900.0, "Books": 50.0, "Snacks": 20.0, "Refund": -10.0, "Gym": 0.0}
+    assert charts.group_top(totals, top_n=2) == [("Rent", 900.0), ("Food", 500.0), ("Other", 70.0)]
+    assert charts.group_top({"Food": 1.0}, top_n=2) == [("Food", 1.0)]
+    assert charts.group_top({}) == []
+
+
+def test_pie_is_rendered_once_per_content(monkeypatch):
+    renders = []
+    render = charts._render_pie
+    monkeypatch.setattr(charts, "_render_pie", lambda slices, figsize: renders.append(slices) or render(slices, figsize))
+    charts._png_cache.clear()
+
+    png = charts.pie_png([("Food", 500.0), ("Rent", 900.0)])
+    assert png.startswith(b"\x89PNG")
+    assert charts.pie_png([("Food", 500.0), ("Rent", 900.0)]) is png
+    charts.pie_png([("Food", 501.0), ("Rent", 900.0)])
+    assert len(renders) == 2
+
+
+def test_png_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(charts, "CHART_CACHE_SIZE", 2)
+    monkeypatch.setattr(charts, "_render_pie", lambda slices, figsize: repr(slices).encode())
+    charts._png_cache.clear()
+    for amount in (1.0, 2.0, 3.0):
+        charts.pie_png([("Food", amount)])
+    assert len(charts._png_cache) == 2
+    charts.pie_png([("Food", 1.0)])  # evicted, rendered again
+    assert list(charts._png_cache.values())[-1] == repr([("Food", 1.0)]).encode()
@@ -0,0 +1,28 @@
+from streamlit.testing.v1 import AppTest
+
+
+def paged_list():
+    import components
+
+    items = [{"id": i} for i in range(25)]
+    components.card_list(items, lambda item: f'<div class="card">{item["id"]}</div>', "things", page_size=10)
+    components.card_list([], str, "nothing", empty="Nothing yet.")
+
+
+def shown(at):
+    return at.markdown[0].value.count('<div class="card">')
+
+
+def test_card_list_shows_a_page_at_a_time():
+    at = AppTest.from_function(paged_list, default_timeout=30).run()
+    assert shown(at) == 10
+    assert len(at.markdown) == 1  # the whole page is one element
+    assert at.info[0].value == "Nothing yet."
+
+    at.button(key="things_more").click().run()
+    assert shown(at) == 20
+    assert at.button(key="things_more").label == "Load more (5 more)"
+
+    at.button(key="things_more").click().run()
+    assert shown(at) == 25
+    assert not at.button
@@ -0,0 +1,42 @@
+import os
+
+from journal import JournalBackend, journal_path
+from utils import load_data, save_data
+
+DEFAULT = {"incomes": [], "budgets": [], "expenses": []}
+
+
+def expense(i, amount=100.0):
+    return {"id": f"x{i}", "expense": "Food", "amount": amount, "date": "2026-10-18"}
+
+
+def test_changes_replay_over_the_snapshot(tmp_path):
+    path = str(tmp_path / "budget.json")
+    save_data(path, {**DEFAULT, "expenses": [expense(1)]})
+    backend = JournalBackend(compact_bytes=float("inf"))
+    backend.append_many(path, [{"op": "add", "section": "expenses", "record": expense(i)} for i in (2, 3)], DEFAULT)
+    backend.append(path, {"op": "update", "section": "expenses", "id": "x1", "changes": {"amount": 50.0}}, DEFAULT)
+    backend.append(path, {"op": "delete", "section": "expenses", "id": "x2"}, DEFAULT)
+    # a crash mid-append leaves a torn last line
+    with open(journal_path(path), "a") as f:
+        f.write('{"op": "add", "sect')
+
+    expected = {**DEFAULT, "expenses": [expense(1, 50.0), expense(3)]}
+    assert backend.load(path, DEFAULT) == expected
+    assert load_data(path, DEFAULT) == {**DEFAULT, "expenses": [expense(1)]}  # the snapshot is untouched
+
+    backend.compact(path, DEFAULT)
+    assert not os.path.exists(journal_path(path))
+    assert load_data(path, DEFAULT) == backend.load(path, DEFAULT) == expected
+
+
+def test_append_reports_whether_anyone_else_wrote(tmp_path):
+    path = str(tmp_path / "streaks.json")
+    backend = JournalBackend(compact_bytes=float("inf"))
+    seen = backend.signature(path)
+    before, after = backend.append(path, {"op": "add", "section": None, "record": "2026-10-01"}, [])
+    assert before == seen and after != before
+    backend.append(path, {"op": "add", "section": None, "record": "2026-10-02"}, [])  # another writer
+    before, _ = backend.append(path, {"op": "add", "section": None, "record": "2026-10-03"}, [])
+    assert before != after
+    assert backend.load(path, []) == ["2026-10-01", "2026-10-02", "2026-10-03"]
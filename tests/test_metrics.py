@@ -0,0 +1,49 @@
+import os
+
+import pytest
+
+import metrics
+
+
+@pytest.fixture
+def recording(monkeypatch):
+    monkeypatch.setattr(metrics, "enabled", True)
+    metrics.reset()
+    metrics.observe("load_data_seconds", "budget.json", 0.25, nbytes=100)
+    metrics.observe("load_data_seconds", 'say "hi".json', 0.5, nbytes=50)
+    metrics.observe("page_seconds", "home", 1.0)
+    metrics.observe("save_data_seconds", "budget.json", 0.125, nbytes=30)
+    yield
+    metrics.reset()
+
+
+def test_prometheus_groups_each_family_under_its_type(recording):
+    lines = metrics.prometheus().splitlines()
+    assert [line for line in lines if line.startswith("#")] == [
+        "# TYPE campus_load_data_seconds summary",
+        "# TYPE campus_page_seconds summary",
+        "# TYPE campus_save_data_seconds summary",
+        "# TYPE campus_load_data_bytes_total counter",
+        "# TYPE campus_save_data_bytes_total counter",
+    ]
+    # every sample follows the TYPE line of its own family
+    family = None
+    for line in lines:
+        if line.startswith("# TYPE "):
+            family = line.split()[2]
+            continue
+        assert line.split("{")[0] in (family, family + "_sum", family + "_count")
+    assert 'campus_load_data_seconds{name="say \\"hi\\".json",quantile="0.5"} 0.5' in lines
+    assert 'campus_load_data_bytes_total{name="budget.json"} 100' in lines
+    assert not any(line.startswith("campus_page_bytes_total") for line in lines)
+
+
+def test_export_replaces_the_file_and_keeps_its_mode(recording, tmp_path):
+    path = str(tmp_path / "campus.prom")
+    with open(path, "w") as f:
+        f.write("stale\n")
+    os.chmod(path, 0o644)
+    metrics.export(path)
+    with open(path) as f:
+        assert f.read() == metrics.prometheus()
+    assert os.stat(path).st_mode & 0o777 == 0o644
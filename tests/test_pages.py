@@ -0,0 +1,24 @@
+import os
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+MAIN = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+
+
+def test_form_submit_updates_the_page_without_an_app_rerun(session, monkeypatch):
+    reruns = []
+    rerun = st.rerun
+    monkeypatch.setattr(st, "rerun", lambda *args, **kwargs: reruns.append(args or kwargs) or rerun(*args, **kwargs))
+    at = AppTest.from_file(MAIN, default_timeout=60).run()
+    at.sidebar.radio[0].set_value(next(o for o in at.sidebar.radio[0].options if "Budget" in o)).run()
+
+    next(e for e in at.text_input if e.label == "Source name").set_value("Bursary")
+    at.number_input[0].set_value(2500.0)
+    next(e for e in at.button if e.label == "➕ Add Income").click().run()
+
+    assert not at.exception
+    assert [e.value for e in at.success] == ["Added income: Bursary — ₦2,500.00"]
+    # the summary tab shares the form's fragment, so it is current in the same run
+    assert next(m for m in at.metric if m.label == "💰 Total Income").value == "₦2,500.00"
+    assert reruns == []
@@ -0,0 +1,47 @@
+import datetime
+import os
+import shutil
+
+import pytest
+
+import store
+from config import PERSONAL_DIR
+
+
+def task(i, date, time):
+    return {"id": f"t{i}", "title": f"Task {i}", "date": date, "time": time, "description": "", "color": "#e3f2fd"}
+
+
+@pytest.fixture
+def personal(session):
+    shutil.rmtree(PERSONAL_DIR, ignore_errors=True)
+    os.makedirs(PERSONAL_DIR)
+    return session
+
+
+def test_each_user_has_a_shard_with_a_safe_name(personal):
+    store.add_personal_task("../ada", task(1, "2026-10-19", "09:00 AM"))
+    store.add_personal_task(".grace", task(2, "2026-10-19", "10:00 AM"))
+    assert sorted(f for f in os.listdir(PERSONAL_DIR) if f.endswith(".json")) == ["%2E%2E%2Fada.json", "%2Egrace.json"]
+    assert store.personal_users() == ["../ada", ".grace"]
+    assert [t["id"] for t in store.personal_tasks("../ada")] == ["t1"]
+
+
+def test_tasks_are_indexed_by_date_and_time(personal):
+    for i, (date, time) in enumerate([("2026-10-20", "02:00 PM"), ("2026-10-19", "11:00 AM"), ("2026-10-20", "08:00 AM"),
+                                      ("2026-10-25", "09:00 AM")]):
+        store.add_personal_task("ada", task(i, date, time))
+    tasks = store.tasks_between("ada", datetime.date(2026, 10, 19), datetime.date(2026, 10, 20))
+    assert [t["id"] for t in tasks] == ["t1", "t2", "t0"]
+    assert store.busy_on("ada", datetime.date(2026, 10, 19)) == [(660, 660 + store.TASK_MINUTES)]
+    assert [c["id"] for c in store.schedule_clashes("ada", datetime.date(2026, 10, 20), 8 * 60 + 15, 9 * 60)] == ["t2"]
+    assert store.schedule_clashes("grace", datetime.date(2026, 10, 20), 8 * 60 + 15, 9 * 60) == []
+
+
+def test_tasks_are_read_back_by_a_new_session(personal):
+    store.add_personal_task("ada", task(1, "2026-10-19", "09:00 AM"))
+    store._shared.clear()
+    for key in list(personal):
+        del personal[key]
+    store.init_stores()
+    assert [t["id"] for t in store.tasks_between("ada", datetime.date(2026, 10, 19), datetime.date(2026, 10, 19))] == ["t1"]
@@ -0,0 +1,70 @@
+import os
+import pickle
+
+import search
+import utils
+
+FAIR = {"id": "e1", "title": "Freshers fair", "date": "2026-10-20", "location": "Main Hall", "description": ""}
+HACK = {"id": "e2", "title": "Hack night", "date": "2026-11-02", "location": "Lab 3", "description": ""}
+
+
+def ids(index, query):
+    return [info[1] for _, info in index.search(query)]
+
+
+def test_sync_replaces_edited_records_and_drops_deleted_ones():
+    index = search.SearchIndex()
+    assert index.sync("events", "event", [FAIR, HACK]) == 2
+    assert ids(index, "freshers") == ["e1"]
+
+    assert index.sync("events", "event", [dict(FAIR, title="Careers fair")]) == 2
+    assert ids(index, "freshers") == []
+    assert ids(index, "careers") == ["e1"]
+    assert ids(index, "hack") == []
+    assert len(index) == 1
+    # unchanged records are left alone
+    assert index.sync("events", "event", [dict(FAIR, title="Careers fair")]) == 0
+
+
+def test_record_held_by_another_source_stays():
+    index = search.SearchIndex()
+    index.sync("events", "event", [FAIR])
+    # archived: the month file has the event by the time events.json drops it
+    index.sync("2026-10", "event", [FAIR])
+    index.sync("events", "event", [])
+    assert ids(index, "freshers") == ["e1"]
+
+
+def test_dead_documents_are_compacted_away():
+    index = search.SearchIndex()
+    records = [dict(HACK, id=f"e{i}") for i in range(200)]
+    index.sync("events", "event", records)
+    index.sync("events", "event", records[:50])
+    assert len(index.docs) == 50
+    assert len(index.postings["hack"][0]) == 50
+    hits = ids(index, "hack")
+    assert len(hits) == 20 and set(hits) <= {r["id"] for r in records[:50]}
+
+
+def test_saved_index_round_trips_as_json(tmp_path):
+    path = str(tmp_path / "search.index")
+    index = search.SearchIndex()
+    index.sync("events", "event", [FAIR, HACK])
+    index.sources["events"] = utils.sig_marker(((1, 2), None))
+    search.save(path, index)
+    with open(path, "rb") as f:
+        assert f.read(1) == b"{"
+    assert os.stat(path).st_mode & 0o777 == 0o666 & ~utils._UMASK
+
+    loaded = search.load(path)
+    assert ids(loaded, "fresh") == ["e1"]
+    assert loaded.sources == index.sources
+    # still tracked per source: a later sync drops what's gone
+    loaded.sync("events", "event", [HACK])
+    assert ids(loaded, "freshers") == []
+
+
+def test_pickled_index_is_not_loaded(tmp_path):
+    path = tmp_path / "search.index"
+    path.write_bytes(pickle.dumps((1, {"docs": []})))
+    assert search.load(str(path)) is None
@@ -0,0 +1,24 @@
+import pytest
+
+import serialization
+
+CODECS = ["json"] + (["orjson"] if serialization.orjson is not None else [])
+DATA = {
+    "incomes": [{"id": "i1", "source": "Allowance", "amount": 5000.0}],
+    "expenses": [{"id": "x1", "expense": "Food", "amount": float("nan")}, {"id": "x2", "expense": "Rent", "amount": float("inf")}],
+}
+
+
+@pytest.mark.parametrize("kind", CODECS)
+def test_non_finite_floats_are_written_as_null(kind):
+    codec = serialization.make_codec(kind)
+    raw = b"".join(serialization.chunks(DATA, codec))
+    assert b"NaN" not in raw and b"Infinity" not in raw
+    assert [x["amount"] for x in serialization.parse(raw, codec)["expenses"]] == [None, None]
+
+
+def test_codecs_write_the_same_bytes():
+    if len(CODECS) < 2:
+        pytest.skip("orjson is not installed")
+    json_codec, orjson_codec = (serialization.make_codec(kind) for kind in CODECS)
+    assert b"".join(serialization.chunks(DATA, json_codec)) == b"".join(serialization.chunks(DATA, orjson_codec))
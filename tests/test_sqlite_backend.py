@@ -0,0 +1,34 @@
+import datetime
+import os
+
+from config import FILES
+from sqlite_backend import SqliteBackend
+
+
+def make(tmp_path):
+    return SqliteBackend(os.path.join(tmp_path, "campus.db"), FILES)
+
+
+def event(i, day):
+    return {"id": f"e{i}", "title": f"Event {i}", "date": day.isoformat(), "time": "10:00 AM"}
+
+
+def test_signature_is_per_table(tmp_path):
+    backend = make(tmp_path)
+    events, streaks = backend.signature(FILES["events"]), backend.signature(FILES["streaks"])
+    backend.append(FILES["streaks"], {"op": "add", "section": None, "record": "2026-10-18"}, [])
+    assert backend.signature(FILES["events"]) == events
+    assert backend.signature(FILES["streaks"]) != streaks
+
+
+def test_upcoming_and_past_events_page_in_sql(tmp_path):
+    backend = make(tmp_path)
+    today = datetime.date(2026, 10, 18)
+    entries = [{"op": "add", "section": None, "record": event(i, today + datetime.timedelta(days=i - 5))} for i in range(50)]
+    backend.append_many(FILES["events"], entries, [])
+    upcoming, past = backend.upcoming_and_past_events(today)
+    assert (len(upcoming), len(past)) == (45, 5)
+    assert [e["id"] for e in upcoming[:3]] == ["e5", "e6", "e7"]
+    assert [e["id"] for e in upcoming[40:]] == ["e45", "e46", "e47", "e48", "e49"]
+    assert [e["id"] for e in past] == ["e4", "e3", "e2", "e1", "e0"]
+    assert past[-1]["id"] == "e0"
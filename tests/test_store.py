@@ -0,0 +1,221 @@
+import pytest
+
+import store
+from config import FILES
+from utils import load_data
+
+EVENT = {"id": "e1", "title": "Freshers' fair", "date": "2026-10-20", "time": "10:00 AM", "location": "Main Hall",
+         "type": "Social", "color": "#cfe9ff", "user_pick": False, "description": "No description"}
+
+
+@pytest.fixture
+def json_backend():
+    if store.backend.incremental:
+        pytest.skip("changes are written as they are made, flush() commits nothing")
+    return store.backend
+
+
+def test_failed_commit_keeps_pending_changes(session, json_backend, monkeypatch):
+    commit = json_backend.commit
+    calls = []
+
+    def flaky(*args, **kwargs):
+        calls.append(args)
+        if len(calls) == 1:
+            raise TimeoutError("Timed out waiting for the lock")
+        return commit(*args, **kwargs)
+
+    monkeypatch.setattr(json_backend, "commit", flaky)
+    store.add_event(dict(EVENT))
+    with pytest.raises(TimeoutError):
+        store.flush()
+    assert [e["id"] for e in store.get("events")] == ["e1"]
+
+    assert store.flush() == ["events"]
+    assert [e["id"] for e in store.get("events")] == ["e1"]
+    assert [e["id"] for e in load_data(FILES["events"], [])] == ["e1"]
+    assert not session.pending_ops
+
+
+@pytest.fixture(params=["journal", "sqlite"])
+def incremental(request, session, tmp_path, monkeypatch):
+    """store running on an incremental backend, on a fresh data set."""
+    if request.param == "journal":
+        from journal import JournalBackend
+
+        backend = JournalBackend(compact_bytes=float("inf"))
+    else:
+        from sqlite_backend import SqliteBackend
+
+        backend = SqliteBackend(str(tmp_path / "campus.db"), FILES)
+    monkeypatch.setattr(store, "backend", backend)
+    store._shared.clear()
+    for key in list(session):
+        del session[key]
+    store.init_stores()
+    return backend
+
+
+def test_incremental_write_sees_other_writers(incremental):
+    store.add("streaks", "2026-10-01")
+    store.flush()  # end of the run
+    # another session or server process writes to the same store
+    incremental.append(FILES["streaks"], {"op": "add", "section": None, "record": "2026-10-02"}, [])
+    store.init_stores()
+    assert store.get("streaks") == ["2026-10-01", "2026-10-02"]
+
+
+def test_incremental_write_is_shared_without_a_reload(incremental, session, monkeypatch):
+    store.add("streaks", "2026-10-01")
+    store.flush()  # end of the run
+    loads = []
+    load = incremental.load
+    monkeypatch.setattr(incremental, "load", lambda path, default: loads.append(path) or load(path, default))
+    for key in list(session):
+        del session[key]
+    store.init_stores()
+    assert store.get("streaks") == ["2026-10-01"]
+    assert loads == []
+
+
+def test_incremental_writes_copy_the_store_once_per_run(incremental, monkeypatch):
+    copies = []
+    copy = store._copy
+    monkeypatch.setattr(store, "_copy", lambda data: copies.append(data) or copy(data))
+    for day in (1, 2, 3):
+        store.add("streaks", f"2026-10-0{day}")
+    assert len(copies) == 1
+    store.flush()
+    assert store._shared_entry("streaks")[1] is store.get("streaks")
+    assert "streaks" not in store.st.session_state.owned_stores
+
+
+def counting(monkeypatch, module, name):
+    """Replace `module.name` (an index class) with a subclass that counts full builds."""
+    builds = []
+    base = getattr(module, name)
+
+    class Counted(base):
+        def __init__(self, *args, **kwargs):
+            builds.append(1)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(module, name, Counted)
+    return builds
+
+
+def test_streak_tracker_survives_flush(session, monkeypatch):
+    import datetime
+
+    import streaks
+
+    builds = counting(monkeypatch, streaks, "StreakTracker")
+    for day in (1, 2, 3):
+        assert store.log_streak_day(datetime.date(2026, 10, day))
+        store.flush()
+    assert store.streak_tracker().current == 3
+    assert len(builds) == 1
+
+
+def test_deleting_a_day_inside_a_compacted_interval(session, json_backend):
+    import datetime
+
+    import streaks
+
+    for day in (1, 2, 3):
+        store.log_streak_day(datetime.date(2026, 10, day))
+    store.flush()
+    assert load_data(FILES["streaks"], []) == ["2026-10-01/P3D"]
+
+    store.remove("streaks", "2026-10-02")
+    store.flush()
+    assert load_data(FILES["streaks"], []) == ["2026-10-01", "2026-10-03"]
+    assert store.get("streaks") == ["2026-10-01", "2026-10-03"]
+
+    # a fresh session reads the intervals back as days
+    store._shared.clear()
+    for key in list(session):
+        del session[key]
+    store.init_stores()
+    assert streaks.days(load_data(FILES["streaks"], [])) == store.get("streaks") == ["2026-10-01", "2026-10-03"]
+
+
+def test_flush_after_another_writer_rebuilds_the_index(session, json_backend):
+    import datetime
+
+    store.log_streak_day(datetime.date(2026, 10, 1))
+    # another server process logs the next day before this session flushes
+    json_backend.commit(FILES["streaks"], [{"op": "add", "section": None, "record": "2026-10-02"}], [])
+    store.flush()
+    assert store.streak_tracker().current == 2
+
+
+def test_timetable_index_survives_flush(session, monkeypatch):
+    import timetable
+
+    builds = counting(monkeypatch, timetable, "TimetableIndex")
+    for hour in (9, 11, 14):
+        store.add_class({"id": f"c{hour}", "day": "Monday", "time": f"{hour:02d}:00 AM", "start_min": hour * 60,
+                         "duration_min": 60, "course": f"MTH{hour}", "lecturer": "", "notes": "", "color": "#b3e5fc",
+                         "reminder": False})
+        store.flush()
+    assert [c["id"] for c in store.timetable_index().day("Monday")] == ["c9", "c11", "c14"]
+    assert len(builds) == 1
+
+
+def test_assignment_index_survives_flush(session, monkeypatch):
+    import assignments
+
+    builds = counting(monkeypatch, assignments, "AssignmentIndex")
+    for day in (20, 5, 12):
+        store.add_assignment({"id": f"a{day}", "course": "MTH101", "title": f"Set {day}", "status": "Not Started",
+                              "due_date": f"2026-10-{day:02d}", "notes": ""})
+        store.flush()
+    assert [a["id"] for a in store.filter_assignments("Not Started")] == ["a5", "a12", "a20"]
+    assert len(builds) == 1
+
+
+def test_search_catches_up_with_another_writers_edit_and_delete(session, json_backend, monkeypatch):
+    monkeypatch.setattr(store, "_search", None)
+    monkeypatch.setattr(store.search, "load", lambda path: None)
+    store.add_event(dict(EVENT))
+    store.flush()
+    assert [info[1] for _, info in store.search_all("freshers")] == ["e1"]
+
+    # another server process renames the event, then deletes it
+    json_backend.commit(FILES["events"], [{"op": "update", "section": None, "id": "e1", "changes": {"title": "Careers day"}}], [])
+    store.init_stores()
+    assert store.search_all("freshers") == []
+    assert [info[1] for _, info in store.search_all("careers")] == ["e1"]
+
+    json_backend.commit(FILES["events"], [{"op": "delete", "section": None, "id": "e1"}], [])
+    store.init_stores()
+    assert store.search_all("careers") == []
+
+
+def test_budget_totals_follow_another_writers_edit(session, json_backend):
+    store.add("budget", {"id": "x1", "expense": "Food", "amount": 1200.0, "date": "2026-10-01"}, section="expenses")
+    store.add("budget", {"id": "x2", "expense": "Rent", "amount": 5000.0, "date": "2026-10-02"}, section="expenses")
+    store.flush()
+    assert store.budget_aggregates()["totals"]["expenses"] == 6200.0
+
+    # another server process corrects the older expense: same counts, same last id
+    json_backend.commit(FILES["budget"], [{"op": "update", "section": "expenses", "id": "x1", "changes": {"amount": 1000.0}}],
+                        store.STORES["budget"][1]())
+    store.init_stores()
+    assert store.budget_aggregates()["totals"]["expenses"] == 6000.0
+    assert store.budget_aggregates()["by_category"]["Food"] == 1000.0
+
+
+def test_budget_totals_are_not_rebuilt_after_own_writes(session, monkeypatch):
+    import budget_agg
+
+    builds = []
+    rebuild = budget_agg.rebuild
+    monkeypatch.setattr(budget_agg, "rebuild", lambda *args: builds.append(1) or rebuild(*args))
+    store.budget_aggregates()
+    for amount in (100.0, 200.0, 300.0):
+        store.add("budget", {"id": f"x{amount:.0f}", "expense": "Food", "amount": amount, "date": "2026-10-01"}, section="expenses")
+        store.flush()
+    assert store.budget_aggregates()["totals"]["expenses"] == 600.0
+    assert len(builds) == 1
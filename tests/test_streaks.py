@@ -0,0 +1,34 @@
+import datetime
+
+import streaks
+
+
+def test_consecutive_days_are_compacted_into_intervals():
+    logged = ["2026-10-03", "2026-10-01", "2026-10-02", "2026-10-02", "2026-10-05", "2026-12-30", "2026-12-31", "2027-01-01"]
+    compacted = streaks.compact(logged)
+    assert compacted == ["2026-10-01/P3D", "2026-10-05", "2026-12-30/P3D"]
+    assert streaks.compact(compacted) == compacted
+    assert streaks.days(compacted) == sorted(set(logged))
+
+
+def test_old_plain_dates_and_intervals_mix():
+    assert streaks.days(["2026-09-30", "2026-10-01/P2D"]) == ["2026-09-30", "2026-10-01", "2026-10-02"]
+    assert streaks.compact(["2026-09-30", "2026-10-01/P2D"]) == ["2026-09-30/P3D"]
+
+
+def test_tracker_counts_streaks_from_intervals():
+    tracker = streaks.StreakTracker(["2026-10-01/P3D", "2026-10-10/P5D"])
+    assert (len(tracker), tracker.current, tracker.longest) == (8, 5, 5)
+    assert datetime.date(2026, 10, 2) in tracker and "2026-10-05" not in tracker
+    assert tracker.month_counts == {"2026-10": 8}
+
+
+def test_tracker_add_keeps_the_counters():
+    tracker = streaks.StreakTracker(["2026-10-01/P3D", "2026-10-05"])
+    assert (tracker.current, tracker.longest) == (1, 3)
+    assert tracker.add(datetime.date(2026, 10, 6))
+    assert (tracker.current, tracker.longest) == (2, 3)
+    assert not tracker.add("2026-10-02")
+    # a missed day filled in later joins the two runs
+    assert tracker.add("2026-10-04")
+    assert (tracker.current, tracker.longest) == (6, 6)
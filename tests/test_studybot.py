@@ -0,0 +1,45 @@
+import datetime
+
+import budget_agg
+import studybot
+
+NOW = datetime.datetime(2026, 10, 18, 9, 0)  # a Sunday
+BUDGET = budget_agg.rebuild({"expenses": [
+    {"id": 1, "expense": "Food", "amount": 100, "date": "2026-09-20"},
+    {"id": 2, "expense": "Food", "amount": 200, "date": "2026-10-05"},
+    {"id": 3, "expense": "Food", "amount": 400, "date": "2026-10-16"},
+    {"id": 4, "expense": "Transport", "amount": 50, "date": "2026-10-17"},
+]})
+
+
+def ask(question):
+    return studybot.answer(question, NOW, None, BUDGET, None)
+
+
+def test_period_is_read_from_the_question():
+    assert studybot._period("what is due next week".split()) == "next_week"
+    assert studybot._period("classes tonight".split()) == "today"
+    assert studybot._period("spent this month".split()) == "month"
+    assert studybot._period("classes on friday".split()) == "Friday"
+    assert studybot._period("how much have i spent".split()) is None
+
+
+def test_spending_on_a_category_honours_the_period():
+    assert ask("How much did I spend on food?") == "You've spent **₦700.00** on Food in total."
+    assert ask("How much did I spend on food this month?") == "You've spent **₦600.00** on Food this month."
+    assert ask("How much did I spend on food this week?") == "You've spent **₦400.00** on Food this week."
+    assert ask("How much did I spend on food on Friday?") == "You've spent **₦400.00** on Food on Friday."
+    assert ask("How much did I spend on food today?") == "You've spent **₦0.00** on Food today."
+
+
+def test_spending_without_a_category():
+    assert ask("How much did I spend this week?") == "You've spent **₦450.00** this week."
+    assert ask("How much did I spend this month?") == "You've spent **₦650.00** this month."
+    assert ask("How much have I spent on Saturday?") == "You've spent **₦50.00** on Saturday."
+
+
+def test_saved_aggregates_without_the_category_rollup_are_rebuilt():
+    old = dict(budget_agg.empty("sig"))
+    del old["format"], old["by_category_day"]
+    assert not budget_agg.in_sync(old, {}, "sig")
+    assert budget_agg.in_sync(budget_agg.empty("sig"), {}, "sig")
@@ -0,0 +1,21 @@
+import theme
+
+
+def test_local_font_files_replace_the_remote_import(tmp_path, monkeypatch):
+    monkeypatch.setattr(theme, "STATIC_DIR", str(tmp_path))
+    monkeypatch.setattr(theme, "REMOTE_FONTS", True)
+    (tmp_path / "fonts").mkdir()
+    (tmp_path / "fonts" / "Poppins-400.woff2").write_bytes(b"wOF2")
+
+    faces = theme._font_faces()
+    assert "@import" not in faces
+    assert faces.startswith("@font-face { font-family: 'Poppins'; font-weight: 400;")
+    assert "url('app/static/fonts/Poppins-400.woff2?v=" in faces
+
+
+def test_without_font_files_the_system_stack_is_used_unless_remote_fonts_are_on(tmp_path, monkeypatch):
+    monkeypatch.setattr(theme, "STATIC_DIR", str(tmp_path))
+    monkeypatch.setattr(theme, "REMOTE_FONTS", False)
+    assert theme._font_faces() == ""
+    monkeypatch.setattr(theme, "REMOTE_FONTS", True)
+    assert theme._font_faces() == f"@import url('{theme.GOOGLE_FONTS}');"
@@ -0,0 +1,54 @@
+import io
+
+import pytest
+from streamlit.runtime.download_data_util import convert_data_to_bytes_and_infer_mime
+
+import transfer
+
+EVENTS = [
+    {"id": "e1", "title": "Freshers' fair", "date": "2026-10-20", "time": "10:00 AM", "location": "Main Hall",
+     "type": "Social", "color": "#cfe9ff", "user_pick": False, "description": "Stalls, music; bring a friend"},
+    {"id": "e2", "title": "Hackathon", "date": "2026-11-02", "time": "09:30 AM", "location": "Lab 3",
+     "type": "Academic", "color": "#cfe9ff", "user_pick": True, "description": "No description"},
+]
+
+
+@pytest.mark.parametrize("fmt", ["csv", "ics", "jsonl"])
+def test_download_is_accepted_by_streamlit(fmt):
+    data = transfer.download(transfer.export("events", fmt, iter(EVENTS)))
+    payload, _ = convert_data_to_bytes_and_infer_mime(data, RuntimeError("unsupported type"))
+    assert payload == data
+
+
+@pytest.mark.parametrize("fmt", ["csv", "ics"])
+def test_download_imports_back(fmt):
+    data = transfer.download(transfer.export("events", fmt, iter(EVENTS)))
+    report = transfer.ImportReport()
+    imported = list(transfer.records("events", fmt, transfer.text(io.BytesIO(data)), set(), report))
+    assert [(e["id"], e["title"], e["date"], e["time"]) for e in imported] == [
+        (e["id"], e["title"], e["date"], e["time"]) for e in EVENTS
+    ]
+    assert report.invalid == 0
+
+
+def test_imported_classes_that_clash_are_reported():
+    stored = [{"id": "c0", "day": "Monday", "time": "09:00 AM", "start_min": 540, "duration_min": 60, "course": "Maths"}]
+    data = ("id,day,time,duration_min,course\n"
+            "c1,Mon,09:30,60,Physics\n"   # overlaps the stored class
+            "c2,Mon,11:00,60,Chemistry\n"
+            "c3,Monday,11:30 AM,30,Biology\n")  # overlaps the row above
+    report = transfer.ImportReport()
+    records = transfer.records("classes", "csv", transfer.text(io.BytesIO(data.encode())), {"c0"}, report)
+    imported = list(transfer.flag_clashes(records, stored, report))
+
+    assert [c["id"] for c in imported] == ["c1", "c2", "c3"]
+    assert report.clashed == 2
+    assert report.clashes == [
+        "Physics (Monday 09:30 AM) overlaps Maths (09:00 AM)",
+        "Biology (Monday 11:30 AM) overlaps Chemistry (11:00 AM)",
+    ]
+
+    import components
+
+    kind, message = components._import_messages("classes", report)[-1]
+    assert kind == "warning" and message.startswith("2 imported class(es) overlap another class:\n- Physics")
@@ -0,0 +1,51 @@
+import os
+
+import pytest
+
+import utils
+
+PATH = os.path.join("data", "recovery.json")
+
+
+@pytest.fixture
+def saved_twice():
+    utils.recovered.clear()
+    for stale in (PATH, PATH + ".bak"):
+        if os.path.exists(stale):
+            os.unlink(stale)
+    utils.save_data(PATH, [1])
+    utils.save_data(PATH, [1, 2])
+    yield
+    utils.recovered.clear()
+
+
+def test_unreadable_file_loads_its_backup_and_is_reported(saved_twice):
+    with open(PATH, "wb") as f:
+        f.write(b"[1, 2")
+    assert utils.load_data(PATH, []) == [1]
+    assert PATH in utils.recovered
+
+    # the next save replaces the unreadable file without making it the backup
+    utils.save_data(PATH, [1, 3])
+    assert utils.recovered == {}
+    assert utils.load_data(PATH + ".bak", []) == [1]
+
+
+def test_unreadable_file_and_backup_raise(saved_twice):
+    for path in (PATH, PATH + ".bak"):
+        with open(path, "wb") as f:
+            f.write(b"{")
+    with pytest.raises(utils.DataFileError):
+        utils.load_data(PATH, [])
+
+
+def test_save_keeps_the_file_mode(saved_twice):
+    os.chmod(PATH, 0o640)
+    utils.save_data(PATH, [1, 2, 3])
+    assert os.stat(PATH).st_mode & 0o777 == 0o640
+
+
+def test_new_file_gets_the_umask_mode(tmp_path):
+    path = str(tmp_path / "new.json")
+    utils.save_data(path, [])
+    assert os.stat(path).st_mode & 0o777 == 0o666 & ~utils._UMASK
@@ -0,0 +1,70 @@
+import datetime
+
+from config import CLASS_MINUTES, DAY_END, DAY_START
+from schedule import IntervalIndex, free_windows
+
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
+WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+
+def time_to_minutes(value):
+    """"09:30 PM" -> 1290; None when the string can't be parsed."""
+    try:
+        t = datetime.datetime.strptime(value, "%I:%M %p")
+    except (TypeError, ValueError):
+        return None
+    return t.hour * 60 + t.minute
+
+
+def minutes_to_label(minutes):
+    return datetime.time(minutes // 60, minutes % 60).strftime("%I:%M %p")
+
+
+def start_of(entry):
+    """Start of a class in minutes since midnight (older entries only carry "time")."""
+    start = entry.get("start_min")
+    return start if start is not None else time_to_minutes(entry.get("time")) or 0
+
+
+def span_of(entry, default_minutes=CLASS_MINUTES):
+    """(start, end) in minutes; entries without a stored duration get the default length."""
+    start = start_of(entry)
+    return start, start + int(entry.get("duration_min") or default_minutes)
+
+
+class TimetableIndex:
+    """Classes per day in an IntervalIndex, kept sorted by start as entries are added."""
+
+    def __init__(self, entries=()):
+        self.by_day = {d: IntervalIndex() for d in DAYS}
+        for entry in entries:
+            self.add(entry)
+
+    def add(self, entry):
+        start, end = span_of(entry)
+        self.by_day.setdefault(entry["day"], IntervalIndex()).add(start, end, entry)
+
+    def day(self, day):
+        return [entry for _, _, entry in self.by_day.get(day, ())]
+
+    def clashes(self, day, start, end):
+        """Classes on `day` overlapping [start, end)."""
+        return self.by_day[day].overlapping(start, end) if day in self.by_day else []
+
+    def busy(self, day):
+        return [(start, end) for start, end, _ in self.by_day.get(day, ())]
+
+    def next_class(self, now):
+        """(date, entry) of the first class starting at or after `now`, looking a week ahead."""
+        minute = now.hour * 60 + now.minute
+        for offset in range(8):
+            date = now.date() + datetime.timedelta(days=offset)
+            classes = self.by_day.get(WEEKDAYS[date.weekday()])
+            entry = classes.first_from(minute if offset == 0 else 0) if classes else None
+            if entry is not None:
+                return date, entry
+        return None
+
+    def free_slots(self, day, min_length=30, start=DAY_START, end=DAY_END):
+        """Gaps of at least `min_length` minutes between `start` and `end` on `day`."""
+        return free_windows(self.busy(day), start, end, min_length)
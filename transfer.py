@@ -0,0 +1,484 @@
+# Bulk import and export of classes, events and expenses.
+#
+# An import is a generator pipeline over the uploaded file: rows are read one
+# at a time (CSV rows, or the VEVENTs of an .ics file), converted and
+# validated, and checked against the ids already stored and earlier in the
+# file (imported classes also against the timetable, for clashes). store.add_many()
+# consumes the survivors and persists them with one write. Exports are generators of text chunks, so nothing builds the whole
+# file in memory before it is written out; a download joins them into the
+# one bytes object Streamlit sends.
+import csv
+import datetime
+import functools
+import io
+import itertools
+import json
+import re
+import uuid
+
+import models
+import timetable
+from config import CLASS_MINUTES, EVENT_MINUTES, EXPORT_CHUNK_ROWS, IMPORT_ERRORS_SHOWN
+
+EVENT_TYPES = ["Social", "Academic", "Club", "Other"]
+
+# kind -> (store, section, CSV columns in export order)
+KINDS = {
+    "classes": ("timetable", None, ["id", "day", "time", "duration_min", "course", "lecturer", "notes", "color", "reminder"]),
+    "events": ("events", None, ["id", "title", "date", "time", "location", "type", "color", "user_pick", "description"]),
+    "expenses": ("budget", "expenses", ["id", "expense", "amount", "color", "date"]),
+}
+# calendar files only make sense for things that happen at a time
+ICS_KINDS = ("classes", "events")
+DEFAULT_COLORS = {"classes": "#b3e5fc", "events": "#cfe9ff", "expenses": "#ffccbc"}
+MIME = {"csv": "text/csv", "ics": "text/calendar", "jsonl": "application/x-ndjson"}
+
+
+class ImportReport:
+    """What an import did: rows read, records added, duplicates skipped, clashes and the first problems found."""
+
+    def __init__(self):
+        self.read = 0
+        self.added = 0
+        self.duplicates = 0
+        self.invalid = 0
+        self.errors = []  # (line number or None, message), at most IMPORT_ERRORS_SHOWN
+        self.clashed = 0
+        self.clashes = []  # messages, at most IMPORT_ERRORS_SHOWN
+
+    def reject(self, line, message):
+        self.invalid += 1
+        if len(self.errors) < IMPORT_ERRORS_SHOWN:
+            self.errors.append((line, message))
+
+    def clash(self, message):
+        self.clashed += 1
+        if len(self.clashes) < IMPORT_ERRORS_SHOWN:
+            self.clashes.append(message)
+
+
+# ----------------------------
+# Field parsing: each helper returns the stored form or raises ValueError
+# with a message fit to show next to the row's line number.
+# ----------------------------
+_TIME_FORMATS = ("%I:%M %p", "%I:%M%p", "%I %p", "%I%p", "%H:%M", "%H:%M:%S")
+
+
+def _text(row, column):
+    return (row.get(column) or "").strip()
+
+
+@functools.lru_cache(maxsize=4096)
+def _time(value):
+    """Minutes since midnight from "09:30 PM", "9:30pm" or "21:30"."""
+    for fmt in _TIME_FORMATS:
+        try:
+            t = datetime.datetime.strptime(value.upper(), fmt)
+        except ValueError:
+            continue
+        return t.hour * 60 + t.minute
+    raise ValueError(f"unreadable time {value!r}")
+
+
+def _date(value):
+    try:
+        return datetime.date.fromisoformat(value).isoformat()
+    except ValueError:
+        raise ValueError(f"unreadable date {value!r} (use YYYY-MM-DD)") from None
+
+
+def _day(value):
+    name = value.lower()
+    for day in timetable.DAYS:
+        if day.lower() == name or (len(name) >= 3 and day.lower().startswith(name)):
+            return day
+    raise ValueError(f"unknown day {value!r} (classes run Monday to Saturday)")
+
+
+def _minutes(value, default):
+    if not value:
+        return default
+    try:
+        minutes = int(float(value))
+    except ValueError:
+        raise ValueError(f"unreadable duration {value!r}") from None
+    if not 0 < minutes <= 24 * 60:
+        raise ValueError(f"duration {minutes} is not between 1 and 1440 minutes")
+    return minutes
+
+
+def _amount(value):
+    try:
+        amount = float(value.replace("₦", "").replace(",", "").strip())
+    except ValueError:
+        raise ValueError(f"unreadable amount {value!r}") from None
+    if not 0 < amount < float("inf"):
+        raise ValueError(f"amount {value!r} must be above zero")
+    return amount
+
+
+def _flag(value):
+    return value.lower() in ("1", "true", "yes", "y", "x")
+
+
+def _color(value, kind):
+    return value if re.fullmatch(r"#[0-9a-fA-F]{6}", value) else DEFAULT_COLORS[kind]
+
+
+def _choice(value, options, default):
+    return next((o for o in options if o.lower() == value.lower()), default)
+
+
+def _class(row):
+    course = _text(row, "course")
+    if not course:
+        raise ValueError("course is missing")
+    start = _time(_text(row, "time"))
+    return {
+        "id": _text(row, "id") or str(uuid.uuid4()),
+        "day": _day(_text(row, "day")),
+        "time": timetable.minutes_to_label(start),
+        "start_min": start,
+        "duration_min": _minutes(_text(row, "duration_min"), CLASS_MINUTES),
+        "course": course,
+        "lecturer": _text(row, "lecturer"),
+        "notes": _text(row, "notes"),
+        "color": _color(_text(row, "color"), "classes"),
+        "reminder": _flag(_text(row, "reminder")),
+    }
+
+
+def _event(row):
+    title = _text(row, "title")
+    if not title:
+        raise ValueError("title is missing")
+    # events without a time (all-day calendar entries) keep an empty one
+    time = _text(row, "time")
+    return {
+        "id": _text(row, "id") or str(uuid.uuid4()),
+        "title": title,
+        "date": _date(_text(row, "date")),
+        "time": timetable.minutes_to_label(_time(time)) if time else "",
+        "location": _text(row, "location"),
+        "type": _choice(_text(row, "type"), EVENT_TYPES, "Other"),
+        "color": _color(_text(row, "color"), "events"),
+        "user_pick": _flag(_text(row, "user_pick")),
+        "description": _text(row, "description") or "No description",
+    }
+
+
+def _expense(row):
+    name = _text(row, "expense")
+    if not name:
+        raise ValueError("expense name is missing")
+    date = _text(row, "date")
+    return {
+        "id": _text(row, "id") or str(uuid.uuid4()),
+        "expense": name,
+        "amount": _amount(_text(row, "amount")),
+        "color": _color(_text(row, "color"), "expenses"),
+        "date": _date(date) if date else datetime.date.today().isoformat(),
+    }
+
+
+CONVERTERS = {"classes": _class, "events": _event, "expenses": _expense}
+
+
+# ----------------------------
+# Readers: (line number, row) pairs with the CSV column names as keys
+# ----------------------------
+def text(upload):
+    """A text stream over an uploaded (binary) file; a UTF-8 byte order mark is dropped."""
+    return io.TextIOWrapper(upload, encoding="utf-8-sig", newline="")
+
+
+def _csv_rows(stream):
+    reader = csv.DictReader(stream)
+    if reader.fieldnames:
+        reader.fieldnames = [name.strip().lower().replace(" ", "_") for name in reader.fieldnames]
+    for row in reader:
+        yield reader.line_num, row
+
+
+def _unfolded(stream):
+    # RFC 5545 folds long lines: a line starting with a space or tab continues the previous one
+    pending, start = None, 0
+    for number, raw in enumerate(stream, 1):
+        line = raw.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and pending is not None:
+            pending += line[1:]
+            continue
+        if pending is not None:
+            yield start, pending
+        pending, start = line, number
+    if pending is not None:
+        yield start, pending
+
+
+_ESCAPED = re.compile(r"\\([\\;,nN])")
+
+
+def _unescape(value):
+    if "\\" not in value:
+        return value
+    return _ESCAPED.sub(lambda m: "\n" if m.group(1) in "nN" else m.group(1), value)
+
+
+def _ics_when(prop):
+    """A DTSTART / DTEND property as a date (all-day) or a local datetime."""
+    value, params = prop
+    try:
+        if len(value) == 8 or "VALUE=DATE" in params.upper():
+            return datetime.date(int(value[:4]), int(value[4:6]), int(value[6:8]))
+        if len(value) not in (15, 16) or value[8] != "T":
+            raise ValueError
+        when = datetime.datetime(int(value[:4]), int(value[4:6]), int(value[6:8]),
+                                 int(value[9:11]), int(value[11:13]), int(value[13:15]))
+    except ValueError:
+        raise ValueError(f"unreadable date-time {value!r}") from None
+    if value.endswith("Z"):
+        return when.replace(tzinfo=datetime.timezone.utc).astimezone().replace(tzinfo=None)
+    # floating or TZID times are kept as the wall-clock time they name
+    return when
+
+
+_DURATION = re.compile(r"P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$")
+
+
+def _ics_minutes(props, start):
+    if "DTEND" in props and isinstance(start, datetime.datetime):
+        end = _ics_when(props["DTEND"])
+        if isinstance(end, datetime.datetime):
+            return str(int((end - start).total_seconds() // 60))
+    match = _DURATION.match(props.get("DURATION", ("", ""))[0])
+    if match and any(match.groups()):
+        weeks, days, hours, minutes, _ = (int(g or 0) for g in match.groups())
+        return str(((weeks * 7 + days) * 24 + hours) * 60 + minutes)
+    return ""
+
+
+def _ics_row(kind, props):
+    def text_of(name):
+        return _unescape(props[name][0]) if name in props else ""
+
+    if "DTSTART" not in props:
+        raise ValueError("VEVENT has no DTSTART")
+    start = _ics_when(props["DTSTART"])
+    timed = isinstance(start, datetime.datetime)
+    row = {
+        "id": text_of("UID"),
+        "color": text_of("X-CAMPUS-COLOR"),
+        "time": start.strftime("%H:%M") if timed else "",
+    }
+    if kind == "classes":
+        if not timed:
+            raise ValueError("all-day VEVENT can't be a class")
+        row.update({
+            "day": timetable.WEEKDAYS[start.weekday()],
+            "duration_min": _ics_minutes(props, start),
+            "course": text_of("SUMMARY"),
+            "lecturer": text_of("X-CAMPUS-LECTURER"),
+            "notes": text_of("DESCRIPTION") or text_of("LOCATION"),
+            "reminder": text_of("X-CAMPUS-REMINDER"),
+        })
+    else:
+        row.update({
+            "title": text_of("SUMMARY"),
+            "date": start.isoformat()[:10],
+            "location": text_of("LOCATION"),
+            "type": text_of("CATEGORIES").split(",")[0],
+            "user_pick": text_of("X-CAMPUS-PICK"),
+            "description": text_of("DESCRIPTION"),
+        })
+    return row
+
+
+def _ics_rows(stream):
+    # yields (line, {name: (value, raw parameters)}) per VEVENT; components nested in one (VALARM) are skipped
+    props, start, nested = None, 0, 0
+    for number, line in _unfolded(stream):
+        head, _, value = line.partition(":")
+        name, _, params = head.partition(";")
+        name = name.upper()
+        if props is not None and not nested and name not in ("BEGIN", "END"):
+            if name not in props:
+                props[name] = (value, params)
+        elif name == "BEGIN":
+            if value.upper() == "VEVENT":
+                props, start, nested = {}, number, 0
+            elif props is not None:
+                nested += 1
+        elif name == "END" and props is not None:
+            if nested:
+                nested -= 1
+            elif value.upper() == "VEVENT":
+                yield start, props
+                props = None
+
+
+def _rows(kind, fmt, stream, report):
+    if fmt == "ics":
+        if kind not in ICS_KINDS:
+            raise ValueError(f"{kind} can't be imported from a calendar file")
+        rows = ((line, props) for line, props in _ics_rows(stream) if "RECURRENCE-ID" not in props)
+    else:
+        rows = _csv_rows(stream)
+    try:
+        yield from rows
+    except (UnicodeDecodeError, csv.Error) as exc:
+        report.reject(None, f"stopped reading the file: {exc}")
+
+
+def records(kind, fmt, stream, existing, report):
+    """Valid records from `stream` whose id isn't in `existing`, one at a time.
+
+    `existing` is a set of ids and gains every id yielded, so a file that lists
+    a record twice adds it once. Rows that fail validation and duplicates are
+    counted in `report`.
+    """
+    convert = CONVERTERS[kind]
+    for line, row in _rows(kind, fmt, stream, report):
+        report.read += 1
+        try:
+            record = convert(_ics_row(kind, row) if fmt == "ics" else row)
+        except ValueError as exc:
+            report.reject(line, str(exc))
+            continue
+        if record["id"] in existing:
+            report.duplicates += 1
+            continue
+        existing.add(record["id"])
+        yield record
+
+
+def flag_clashes(classes, stored, report):
+    """Pass imported `classes` through, noting in `report` each one that overlaps a
+    class in `stored` (the timetable) or an earlier one in the file.
+
+    Clashing classes are still imported: the summary lists them, as the class
+    form warns about them.
+    """
+    index = timetable.TimetableIndex(stored)
+    for record in classes:
+        found = index.clashes(record["day"], *timetable.span_of(record))
+        if found:
+            report.clash(f"{record['course']} ({record['day']} {record['time']}) overlaps "
+                         + ", ".join(f"{c['course']} ({c['time']})" for c in found))
+        index.add(record)
+        yield record
+
+
+# ----------------------------
+# Export: text chunks of EXPORT_CHUNK_ROWS records each
+# ----------------------------
+def _batches(records):
+    records = iter(records)
+    while batch := list(itertools.islice(records, EXPORT_CHUNK_ROWS)):
+        yield batch
+
+
+def _csv_chunks(kind, records):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, KINDS[kind][2], extrasaction="ignore")
+    writer.writeheader()
+    for batch in _batches(records):
+        writer.writerows(batch)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()  # header only: nothing to export
+
+
+def _jsonl_chunks(kind, records):
+    for batch in _batches(records):
+        yield "".join(json.dumps(record, default=models.to_json) + "\n" for record in batch)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+
+def _fold(line):
+    # lines longer than 75 octets continue on the next line after a space, never splitting a character
+    if len(line.encode()) <= 75:
+        return line + "\r\n"
+    parts, part, size = [], [], 0
+    for ch in line:
+        n = len(ch.encode())
+        if size + n > 75:
+            parts.append("".join(part))
+            part, size = [" "], 1
+        part.append(ch)
+        size += n
+    parts.append("".join(part))
+    return "\r\n".join(parts) + "\r\n"
+
+
+def _stamp(value):
+    return value.strftime("%Y%m%dT%H%M%S")
+
+
+def _ics_class(record, today):
+    start, end = timetable.span_of(record)
+    day = today + datetime.timedelta(days=(timetable.WEEKDAYS.index(record["day"]) - today.weekday()) % 7)
+    midnight = datetime.datetime.combine(day, datetime.time())
+    return [
+        ("UID", _escape(record["id"])),
+        ("DTSTART", _stamp(midnight + datetime.timedelta(minutes=start))),
+        ("DTEND", _stamp(midnight + datetime.timedelta(minutes=end))),
+        ("RRULE", f"FREQ=WEEKLY;BYDAY={record['day'][:2].upper()}"),
+        ("SUMMARY", _escape(record["course"])),
+        ("DESCRIPTION", _escape(record.get("notes", ""))),
+        ("X-CAMPUS-LECTURER", _escape(record.get("lecturer", ""))),
+        ("X-CAMPUS-COLOR", record.get("color", DEFAULT_COLORS["classes"])),
+        ("X-CAMPUS-REMINDER", "TRUE" if record.get("reminder") else "FALSE"),
+    ]
+
+
+def _ics_event(record, today):
+    date = datetime.date.fromisoformat(record["date"])
+    start = timetable.time_to_minutes(record.get("time"))
+    if start is None:
+        when = [("DTSTART;VALUE=DATE", date.strftime("%Y%m%d"))]
+    else:
+        begin = datetime.datetime.combine(date, datetime.time()) + datetime.timedelta(minutes=start)
+        when = [("DTSTART", _stamp(begin)), ("DTEND", _stamp(begin + datetime.timedelta(minutes=EVENT_MINUTES)))]
+    return [("UID", _escape(record["id"]))] + when + [
+        ("SUMMARY", _escape(record["title"])),
+        ("LOCATION", _escape(record.get("location", ""))),
+        ("DESCRIPTION", _escape(record.get("description", ""))),
+        ("CATEGORIES", _escape(record.get("type", "Other"))),
+        ("X-CAMPUS-COLOR", record.get("color", DEFAULT_COLORS["events"])),
+        ("X-CAMPUS-PICK", "TRUE" if record.get("user_pick") else "FALSE"),
+    ]
+
+
+def _ics_chunks(kind, records):
+    today = datetime.date.today()
+    stamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    build = _ics_class if kind == "classes" else _ics_event
+    yield "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//Campus Companion//EN\r\n"
+    for batch in _batches(records):
+        yield "".join(
+            "BEGIN:VEVENT\r\n" + f"DTSTAMP:{stamp}\r\n"
+            + "".join(_fold(f"{name}:{value}") for name, value in build(record, today))
+            + "END:VEVENT\r\n"
+            for record in batch
+        )
+    yield "END:VCALENDAR\r\n"
+
+
+def export(kind, fmt, records):
+    """`records` as "csv", "ics" or "jsonl" text, yielded in chunks of EXPORT_CHUNK_ROWS records."""
+    if fmt == "ics" and kind not in ICS_KINDS:
+        raise ValueError(f"{kind} can't be exported as a calendar file")
+    return {"csv": _csv_chunks, "ics": _ics_chunks, "jsonl": _jsonl_chunks}[fmt](kind, records)
+
+
+def download(chunks):
+    """The chunks as the bytes of a download (st.download_button takes bytes, not file objects)."""
+    buffer = io.BytesIO()
+    for chunk in chunks:
+        buffer.write(chunk.encode())
+    return buffer.getvalue()
@@ -1,15 +1,167 @@
+import contextlib
 import json
 import os
+import shutil
+import stat
+import tempfile
+import threading
+import time
+import zlib
+
+import metrics
+import serialization
+from config import BACKUP_SUFFIX
+
+
+class DataFileError(ValueError):
+    """A data file exists but neither it nor its backup can be parsed."""
+
+
+# what a truncated or garbled file raises from serialization.parse
+_UNREADABLE = (ValueError, EOFError, OSError, zlib.error)
+
+# path -> message, for data files loaded from their backup; shown on every page
+# (main.py) until a save replaces the unreadable file
+recovered = {}
+
+
+# read once: os.umask can only be queried by setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+@contextlib.contextmanager
+def atomic_write(path, suffix=".tmp"):
+    """Yield a binary file that replaces `path` once the block exits cleanly.
+
+    The data goes to a temp file in the same directory and is renamed over the
+    target, so a crash mid-write never leaves a truncated file behind. The temp
+    file gets the target's permissions (or the umask's for a new file) instead
+    of mkstemp's 0600.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=".tmp-", suffix=suffix)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def save_data(path, data, compress=False):
+    with metrics.timer("save_data_seconds", os.path.basename(path)) as timer:
+        with atomic_write(path, ".json") as f:
+            serialization.write(f, data, compress)
+            timer.bytes = f.tell()
+            # an unreadable file must not replace the backup it was recovered from
+            if path not in recovered:
+                _keep_backup(path)
+        recovered.pop(path, None)
+
+
+def _keep_backup(path):
+    # the version about to be replaced becomes <path>.bak; a hard link, so nothing is copied
+    backup = path + BACKUP_SUFFIX
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(backup)
+    try:
+        os.link(path, backup)
+    except FileNotFoundError:
+        pass  # first save
+    except OSError:
+        # no hard links on this filesystem, or another writer just made the backup
+        with contextlib.suppress(OSError):
+            shutil.copyfile(path, backup)
+
+
+def _read(path):
+    with open(path, "rb") as f:
+        raw = f.read()
+    return serialization.parse(raw), len(raw)
 
-def save_data(path, data):
-    with open(path, "w") as f:
-        json.dump(data, f, default=str)
 
 def load_data(path, default):
-    if os.path.exists(path):
+    """The data saved at `path`, or `default` if there is no such file.
+
+    A file that exists but can't be parsed is never taken for empty (the next
+    save would overwrite it with `default`): the backup kept by the previous
+    save is returned instead (timed as its own load_data series and listed in
+    `recovered`), and DataFileError raised if that fails too.
+    """
+    if not os.path.exists(path):
+        return default
+    with metrics.timer("load_data_seconds", os.path.basename(path)) as timer:
         try:
-            with open(path, "r") as f:
-                return json.load(f)
-        except Exception:
+            data, timer.bytes = _read(path)
+            return data
+        except FileNotFoundError:
             return default
-    return default
+        except _UNREADABLE as exc:
+            error = exc
+    backup = path + BACKUP_SUFFIX
+    with metrics.timer("load_data_seconds", os.path.basename(backup)) as timer:
+        try:
+            data, timer.bytes = _read(backup)
+        except (FileNotFoundError, *_UNREADABLE):
+            raise DataFileError(f"{path} is unreadable ({error}) and has no usable backup") from error
+    recovered[path] = f"{path} is unreadable ({error}); loaded the copy from before its last save ({backup}) instead."
+    return data
+
+
+def file_signature(*paths):
+    # (mtime, size) of each path, None for missing files; changes whenever a writer touches them
+    sig = []
+    for p in paths:
+        try:
+            stat = os.stat(p)
+            sig.append((stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            sig.append(None)
+    return tuple(sig)
+
+
+def sig_marker(sig):
+    """A signature as it reads back from a JSON file (tuples become lists), for
+    comparing with one saved next to derived data."""
+    return json.loads(json.dumps(sig))
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to the in-process lock below
+    fcntl = None
+
+_process_locks = {}
+
+
+@contextlib.contextmanager
+def file_lock(path, timeout=10.0):
+    """Exclusive lock on `path` shared by every process using the data directory."""
+    if fcntl is None:
+        with _process_locks.setdefault(path, threading.Lock()):
+            yield
+        return
+    with open(path + ".lock", "a") as f:
+        deadline = time.monotonic() + timeout
+        delay = 0.001
+        while True:
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"Timed out waiting for the lock on {path}")
+                time.sleep(delay)
+                delay = min(delay * 2, 0.05)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)